@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
 """
 K UNIVERSITY 2025 연간 보고서 데이터 추출 스크립트
-- 2025-01-01 ~ 2025-12-31 데이터 분석
+- 2025-01-01 ~ 2025-12-31 데이터 분석 (--from/--to로 기간 변경 가능)
 - JSON 형식으로 모든 분석 데이터 추출
+
+사용법:
+    python data_extractor.py                                   # 2025 연간 → data/report_data.json
+    python data_extractor.py --from 2025-01-01 --to 2025-08-31 # → data/report_data_20250101_20250831.json
+    python data_extractor.py --incremental                     # 이전 결과에 추가/변경된 경기만 반영
+
+증분 실행 (--incremental, 이전 결과 JSON + 행 해시 상태 기준):
+- 멤버별 항목 (멤버 상세, 평가 점수, 멤버별 대회 성적, 하이라이트): 영향받은 멤버만 재계산
+- 상대별 항목 (주요 상대): 영향받은 상대만 재계산
+- 팀 합계 (전체/구분별/종족/맵/상대 티어/대회별): 경기만 추가됐으면 이전 합계 + 추가 경기 합계,
+  기존 경기가 수정/삭제됐으면 전체 재계산 (상태에 이전 행 값이 없음)
+- 월별/분기별: 일별 누적 배열로 계산 (경기 행을 다시 집계하지 않음)
 """
 
+import argparse
 import pandas as pd
+import numpy as np
 import json
 from datetime import datetime
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches, workbook_version
+from ku_common.schema import to_match_table, value_counts
+from ku_common.aggregate import MemberAggregates
+from ku_common.daily import DailyPrefix
+from ku_common.ingest import load_state, save_state, diff_table
+
 
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent
@@ -16,37 +39,86 @@ EXCEL_PATH = BASE_DIR / "ku_records.xlsx"
 OUTPUT_DIR = Path(__file__).parent / "data"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+DEFAULT_START = "2025-01-01"
+DEFAULT_END = "2025-12-31"
+
+
+def load_table():
+    """전체 경기 테이블 로드 (기간 필터 전)"""
+    return to_match_table(load_matches(EXCEL_PATH))
+
 
-def load_data():
-    """2025년 데이터 로드 및 필터링"""
-    df = pd.read_excel(EXCEL_PATH)
-    df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
-    df_2025['월'] = df_2025['날짜'].dt.month
-    df_2025['분기'] = df_2025['날짜'].dt.quarter
-    df_2025['요일'] = df_2025['날짜'].dt.dayofweek
-    return df_2025
+def load_data(table=None, start=DEFAULT_START, end=DEFAULT_END):
+    """기간 데이터 필터링 (기본: 2025년)"""
+    if table is None:
+        table = load_table()
+    df_period = table[(table['날짜'] >= start) & (table['날짜'] <= end)].copy()
+    df_period['요일'] = df_period['날짜'].dt.dayofweek
+    return df_period
+
+
+def period_months(start, end):
+    """기간에 걸친 달력상 월 목록 (pd.Period)"""
+    return list(pd.period_range(pd.Timestamp(start), pd.Timestamp(end), freq='M'))
+
+
+def _clip_period(period, start, end):
+    """월/분기 기간을 조회 기간 안으로 자른 (시작일, 종료일)"""
+    period_start = max(period.start_time.normalize(), pd.Timestamp(start))
+    period_end = min(period.end_time.normalize(), pd.Timestamp(end))
+    return period_start, period_end
+
+
+RACES = ['테란', '저그', '프로토스']
+TIER_ORDER = ['1티어', '2티어', '3티어', '4티어', '5티어', '6티어', '7티어', '8티어', '베이비']
 
 
 def calc_winrate(data):
     """승률 계산"""
-    if len(data) == 0:
+    return calc_winrate_counts(len(data), data['win'].sum())
+
+
+def calc_winrate_counts(total, wins):
+    """경기수/승수로 승률 계산 (집계 엔진 결과용)"""
+    if total == 0:
         return {"total": 0, "wins": 0, "losses": 0, "winrate": 0.0}
-    wins = (data['결과'] == '승').sum()
-    total = len(data)
+    wins = np.int64(wins)
     losses = total - wins
     winrate = round(wins / total * 100, 2)
     return {"total": int(total), "wins": int(wins), "losses": int(losses), "winrate": float(winrate)}
 
 
-def extract_summary(df):
-    """요약 데이터 추출"""
+def add_stats(previous, delta):
+    """이전 집계 + 추가 경기 집계 (같은 키는 승/패 수를 더해 승률 재계산, 새 키는 뒤에 추가)"""
+    merged = dict(previous)
+    for key, value in delta.items():
+        if key not in merged:
+            merged[key] = value
+        elif isinstance(value, dict):
+            merged[key] = add_stats(merged[key], value)
+    if 'total' in delta and 'wins' in delta:
+        merged.update(calc_winrate_counts(previous['total'] + delta['total'], previous['wins'] + delta['wins']))
+    return merged
+
+
+def order_by_total(stats, series):
+    """집계 dict를 경기수 내림차순으로 정렬 (동점은 series 첫 등장 순서, value_counts와 같은 순서)"""
+    position = {value: i for i, value in enumerate(series.dropna().unique())}
+    return dict(sorted(stats.items(), key=lambda item: (-item[1]['total'], position[item[0]])))
+
+
+def extract_summary(df, member_details, start=DEFAULT_START, end=DEFAULT_END, previous=None, added=None):
+    """요약 데이터 추출 (하이라이트는 멤버 상세 기준)
+
+    previous/added: 증분 실행 - 전체/구분별 전적은 이전 요약 + 추가 경기(added) 합계
+    """
     summary = {
         "period": {
-            "start": "2025-01-01",
-            "end": "2025-12-31",
-            "months": 12
+            "start": start,
+            "end": end,
+            "months": len(period_months(start, end))
         },
-        "overall": calc_winrate(df),
+        "overall": calc_winrate(df if added is None else added),
         "by_type": {},
         "members": {
             "total": df['멤버 이름'].nunique(),
@@ -56,20 +128,20 @@ def extract_summary(df):
     }
     
     # 구분별 전적
-    for cat in df['구분2'].unique():
-        cat_data = df[df['구분2'] == cat]
+    cat_df = df if added is None else added
+    for cat in cat_df['구분2'].unique():
+        cat_data = cat_df[cat_df['구분2'] == cat]
         summary["by_type"][cat] = calc_winrate(cat_data)
+    if previous is not None:
+        summary["overall"] = add_stats(previous["overall"], summary["overall"])
+        summary["by_type"] = add_stats(previous["by_type"], summary["by_type"])
     
-    # 하이라이트 계산
-    member_stats = []
-    for member in df['멤버 이름'].unique():
-        m_data = df[df['멤버 이름'] == member]
-        stats = calc_winrate(m_data)
-        stats['name'] = member
-        stats['race'] = m_data['멤버 종족'].iloc[0]
-        stats['tier_start'] = m_data.iloc[0]['멤버 티어']
-        stats['tier_end'] = m_data.iloc[-1]['멤버 티어']
-        member_stats.append(stats)
+    # 하이라이트 계산 (멤버 상세의 전체 전적/종족/시작·종료 티어)
+    member_stats = [
+        {**details['overall'], 'name': member, 'race': details['race'],
+         'tier_start': details['tier_start'], 'tier_end': details['tier_end']}
+        for member, details in member_details.items()
+    ]
     
     # MVP (최고 승률, 100경기 이상)
     qualified = [m for m in member_stats if m['total'] >= 100]
@@ -110,24 +182,61 @@ def extract_summary(df):
     return summary
 
 
-def extract_monthly(df):
-    """월별 전적 추출"""
+def extract_monthly(daily, start=DEFAULT_START, end=DEFAULT_END, member=None):
+    """월별 전적 추출 (일별 누적 배열 사용)
+
+    한 해 안의 기간이면 월 번호(1~12), 여러 해에 걸치면 'YYYY-MM' 키
+    member를 주면 그 멤버의 경기가 있는 월만 (없으면 팀 전체, 모든 월)
+    """
+    months = period_months(start, end)
+    single_year = months[0].year == months[-1].year
+    
     monthly = {}
-    for month in range(1, 13):
-        m_data = df[df['월'] == month]
-        monthly[month] = calc_winrate(m_data)
+    for period in months:
+        key = period.month if single_year else str(period)
+        games, wins = daily.stats(*_clip_period(period, start, end), member=member)
+        if member is None or games > 0:
+            monthly[key] = calc_winrate_counts(games, wins)
     return monthly
 
 
-def extract_quarterly(df):
-    """분기별 전적 추출"""
+def extract_quarterly(daily, start=DEFAULT_START, end=DEFAULT_END, member=None):
+    """분기별 전적 추출 (일별 누적 배열 사용)
+
+    한 해 안의 기간이면 'Q1'~'Q4', 여러 해에 걸치면 'YYYY-Q1' 키
+    member를 주면 그 멤버의 경기가 있는 분기만 (없으면 팀 전체, 모든 분기)
+    """
+    quarters = list(pd.period_range(pd.Timestamp(start), pd.Timestamp(end), freq='Q'))
+    single_year = quarters[0].year == quarters[-1].year
+    
     quarterly = {}
-    for q in range(1, 5):
-        q_data = df[df['분기'] == q]
-        quarterly[f"Q{q}"] = calc_winrate(q_data)
+    for period in quarters:
+        key = f"Q{period.quarter}" if single_year else f"{period.year}-Q{period.quarter}"
+        games, wins = daily.stats(*_clip_period(period, start, end), member=member)
+        if member is None or games > 0:
+            quarterly[key] = calc_winrate_counts(games, wins)
     return quarterly
 
 
+def period_label(start, end):
+    """보고서 문장용 기간 이름 ('2025년', '2025년 1~8월', '2024년 7월 ~ 2025년 6월')"""
+    months = period_months(start, end)
+    first, last = months[0], months[-1]
+    if first.year != last.year:
+        return f"{first.year}년 {first.month}월 ~ {last.year}년 {last.month}월"
+    if (first.month, last.month) == (1, 12):
+        return f"{first.year}년"
+    return f"{first.year}년 {first.month}~{last.month}월"
+
+
+def _key_label(key, unit=''):
+    """월/분기 키 → 문장용 이름 (3 → '3월', '2024-07' → '2024년 7월', '2024-Q3' → '2024년 Q3')"""
+    if isinstance(key, str) and '-' in key:
+        year, part = key.split('-')
+        return f"{year}년 {part}" if part.startswith('Q') else f"{year}년 {int(part)}{unit}"
+    return f"{key}{unit}"
+
+
 def extract_race_stats(df):
     """종족별 전적 추출"""
     race_stats = {
@@ -137,18 +246,18 @@ def extract_race_stats(df):
     }
     
     # 멤버 종족별
-    for race in ['테란', '저그', '프로토스']:
+    for race in RACES:
         race_data = df[df['멤버 종족'] == race]
         race_stats["member_race"][race] = calc_winrate(race_data)
     
     # 상대 종족별
-    for race in ['테란', '저그', '프로토스']:
+    for race in RACES:
         race_data = df[df['상대 종족'] == race]
         race_stats["opponent_race"][race] = calc_winrate(race_data)
     
     # 매치업별
-    for my_race in ['테란', '저그', '프로토스']:
-        for opp_race in ['테란', '저그', '프로토스']:
+    for my_race in RACES:
+        for opp_race in RACES:
             matchup_data = df[(df['멤버 종족'] == my_race) & (df['상대 종족'] == opp_race)]
             key = f"{my_race[0]}v{opp_race[0]}"
             race_stats["matchups"][key] = {
@@ -160,16 +269,26 @@ def extract_race_stats(df):
     return race_stats
 
 
-def extract_map_stats(df):
-    """맵별 전적 추출"""
+def extract_map_stats(df, previous=None, added=None):
+    """맵별 전적 추출
+
+    previous/added: 증분 실행 - 이전 맵별 전적 + 추가 경기(added) 합계
+    """
+    if previous is not None:
+        map_stats = add_stats(previous, extract_map_stats(added))
+        for stats in map_stats.values():
+            by_race = stats["by_member_race"]
+            stats["by_member_race"] = {race: by_race[race] for race in RACES if race in by_race}
+        return order_by_total(map_stats, df['맵'])
+    
     map_stats = {}
-    for map_name in df['맵'].value_counts().index:
+    for map_name in value_counts(df['맵']).index:
         map_data = df[df['맵'] == map_name]
         stats = calc_winrate(map_data)
         
         # 맵-종족 교차
         by_race = {}
-        for race in ['테란', '저그', '프로토스']:
+        for race in RACES:
             race_data = map_data[map_data['멤버 종족'] == race]
             if len(race_data) > 0:
                 by_race[race] = calc_winrate(race_data)
@@ -182,53 +301,83 @@ def extract_map_stats(df):
     return map_stats
 
 
-def extract_opponent_stats(df):
-    """상대별 전적 추출"""
+def extract_opponent_stats(df, previous=None, added=None, only=None):
+    """상대별 전적 추출
+
+    previous/added/only: 증분 실행 - 티어별은 이전 결과 + 추가 경기(added) 합계 (added가 None이면 df 전체),
+    주요 상대는 only에 있는 상대만 재계산하고 나머지는 이전 항목 재사용
+    """
     opponent_stats = {
         "by_tier": {},
         "top_opponents": []
     }
     
     # 티어별
-    tier_order = ['1티어', '2티어', '3티어', '4티어', '5티어', '6티어', '7티어', '8티어', '베이비']
-    for tier in tier_order:
-        tier_data = df[df['상대 티어'] == tier]
+    tier_df = df if added is None else added
+    for tier in TIER_ORDER:
+        tier_data = tier_df[tier_df['상대 티어'] == tier]
         if len(tier_data) > 0:
             opponent_stats["by_tier"][tier] = calc_winrate(tier_data)
+    if previous is not None and added is not None:
+        by_tier = add_stats(previous["by_tier"], opponent_stats["by_tier"])
+        opponent_stats["by_tier"] = {tier: by_tier[tier] for tier in TIER_ORDER if tier in by_tier}
     
     # 상위 상대 (30경기 이상)
-    opp_counts = df['상대'].value_counts()
+    if previous is None:
+        opp_df, reused = df, {}
+    else:
+        opp_df = df[df['상대'].isin(only)]
+        reused = {stats['name']: stats for stats in previous["top_opponents"] if stats['name'] not in only}
+    top = dict(reused)
+    opp_counts = value_counts(opp_df['상대'])
     for opp in opp_counts[opp_counts >= 30].index:
-        opp_data = df[df['상대'] == opp]
+        opp_data = opp_df[opp_df['상대'] == opp]
         stats = calc_winrate(opp_data)
         stats['name'] = opp
         stats['race'] = opp_data['상대 종족'].iloc[0]
         stats['tier'] = opp_data['상대 티어'].iloc[-1]
-        opponent_stats["top_opponents"].append(stats)
+        top[opp] = stats
     
-    # 승률순 정렬
-    opponent_stats["top_opponents"].sort(key=lambda x: x['total'], reverse=True)
+    # 경기수순 정렬 (동점은 첫 등장 순서)
+    opponent_stats["top_opponents"] = list(order_by_total(top, df['상대']).values())
     
     return opponent_stats
 
 
-def extract_tournament_stats(df):
-    """대회별 전적 추출"""
+def extract_tournament_stats(df, previous=None, added=None, only=None):
+    """대회별 전적 추출
+
+    previous/added/only: 증분 실행 - 전체/대회별은 이전 결과 + 추가 경기(added) 합계 (added가 None이면 df 전체),
+    멤버별은 only에 있는 멤버만 재계산하고 나머지는 이전 항목 재사용
+    """
     tour_data = df[df['구분2'] == '대회']
+    total_data = tour_data if added is None else added[added['구분2'] == '대회']
     tournament_stats = {
-        "overall": calc_winrate(tour_data),
+        "overall": calc_winrate(total_data),
         "by_tournament": {},
         "by_member": []
     }
     
     # 대회별
-    for tour in tour_data['구분'].value_counts().index:
-        t_data = tour_data[tour_data['구분'] == tour]
+    for tour in value_counts(total_data['구분']).index:
+        t_data = total_data[total_data['구분'] == tour]
         tournament_stats["by_tournament"][tour] = calc_winrate(t_data)
+    if previous is not None and added is not None:
+        tournament_stats["overall"] = add_stats(previous["overall"], tournament_stats["overall"])
+        tournament_stats["by_tournament"] = order_by_total(
+            add_stats(previous["by_tournament"], tournament_stats["by_tournament"]), tour_data['구분']
+        )
     
     # 멤버별 대회 성적
+    reused = {} if previous is None else {
+        stats['name']: stats for stats in previous["by_member"] if stats['name'] not in only
+    }
+    member_tour = tour_data if previous is None else tour_data[tour_data['멤버 이름'].isin(only)]
     for member in df['멤버 이름'].unique():
-        m_tour = tour_data[tour_data['멤버 이름'] == member]
+        if member in reused:
+            tournament_stats["by_member"].append(reused[member])
+            continue
+        m_tour = member_tour[member_tour['멤버 이름'] == member]
         if len(m_tour) > 0:
             stats = calc_winrate(m_tour)
             stats['name'] = member
@@ -239,19 +388,30 @@ def extract_tournament_stats(df):
     return tournament_stats
 
 
-def extract_member_details(df):
-    """멤버별 상세 데이터 추출"""
+def extract_member_details(df, daily, start=DEFAULT_START, end=DEFAULT_END, only=None):
+    """멤버별 상세 데이터 추출 (월별/분기별은 일별 누적 배열, only: 지정한 멤버만 계산)"""
     members = {}
-    
-    for member in df['멤버 이름'].unique():
-        m_data = df[df['멤버 이름'] == member]
+    if only is not None:
+        df = df[df['멤버 이름'].isin(only)]
+    
+    # 멤버 × 차원별 승/패 집계 (차원마다 groupby 한 번)
+    agg = MemberAggregates(df, {
+        'type': '구분2',
+        'race': '상대 종족',
+        'map': '맵',
+        'tier': '상대 티어',
+        'opponent': '상대',
+    })
+    
+    for member in agg.members:
+        overall = agg.total(member)
         
         member_info = {
             "name": member,
-            "race": m_data['멤버 종족'].iloc[0],
-            "tier_start": m_data.iloc[0]['멤버 티어'],
-            "tier_end": m_data.iloc[-1]['멤버 티어'],
-            "overall": calc_winrate(m_data),
+            "race": agg.value_at('멤버 종족', overall.first_row),
+            "tier_start": agg.value_at('멤버 티어', overall.first_row),
+            "tier_end": agg.value_at('멤버 티어', overall.last_row),
+            "overall": calc_winrate_counts(overall.games, overall.wins),
             "by_type": {},
             "monthly": {},
             "quarterly": {},
@@ -262,49 +422,37 @@ def extract_member_details(df):
         }
         
         # 타입별
+        by_type = agg.counts(member, 'type')
         for cat in ['스폰', '대회']:
-            cat_data = m_data[m_data['구분2'] == cat]
-            if len(cat_data) > 0:
-                member_info["by_type"][cat] = calc_winrate(cat_data)
-        
-        # 월별
-        for month in range(1, 13):
-            month_data = m_data[m_data['월'] == month]
-            if len(month_data) > 0:
-                member_info["monthly"][month] = calc_winrate(month_data)
+            if cat in by_type:
+                member_info["by_type"][cat] = calc_winrate_counts(by_type[cat].games, by_type[cat].wins)
         
-        # 분기별
-        for q in range(1, 5):
-            q_data = m_data[m_data['분기'] == q]
-            if len(q_data) > 0:
-                member_info["quarterly"][f"Q{q}"] = calc_winrate(q_data)
+        # 월별/분기별 (팀 월별/분기별과 같은 키)
+        member_info["monthly"] = extract_monthly(daily, start, end, member=member)
+        member_info["quarterly"] = extract_quarterly(daily, start, end, member=member)
         
         # 상대 종족별
-        for race in ['테란', '저그', '프로토스']:
-            race_data = m_data[m_data['상대 종족'] == race]
-            if len(race_data) > 0:
-                member_info["vs_race"][race] = calc_winrate(race_data)
+        by_race = agg.counts(member, 'race')
+        for race in RACES:
+            if race in by_race:
+                member_info["vs_race"][race] = calc_winrate_counts(by_race[race].games, by_race[race].wins)
         
         # 맵별
-        for map_name in m_data['맵'].value_counts().head(10).index:
-            map_data = m_data[m_data['맵'] == map_name]
-            member_info["by_map"][map_name] = calc_winrate(map_data)
+        for entry in agg.ranked(member, 'map')[:10]:
+            member_info["by_map"][entry.value] = calc_winrate_counts(entry.games, entry.wins)
         
         # 상대 티어별
-        tier_order = ['1티어', '2티어', '3티어', '4티어', '5티어', '6티어', '7티어', '8티어', '베이비']
-        for tier in tier_order:
-            tier_data = m_data[m_data['상대 티어'] == tier]
-            if len(tier_data) > 0:
-                member_info["vs_tier"][tier] = calc_winrate(tier_data)
+        by_tier = agg.counts(member, 'tier')
+        for tier in TIER_ORDER:
+            if tier in by_tier:
+                member_info["vs_tier"][tier] = calc_winrate_counts(by_tier[tier].games, by_tier[tier].wins)
         
         # 주요 상대 (10경기 이상)
-        opp_counts = m_data['상대'].value_counts()
-        for opp in opp_counts[opp_counts >= 10].index:
-            opp_data = m_data[m_data['상대'] == opp]
-            stats = calc_winrate(opp_data)
-            stats['name'] = opp
-            stats['race'] = opp_data['상대 종족'].iloc[0]
-            stats['tier'] = opp_data['상대 티어'].iloc[-1]
+        for entry in agg.ranked(member, 'opponent', min_games=10):
+            stats = calc_winrate_counts(entry.games, entry.wins)
+            stats['name'] = entry.value
+            stats['race'] = agg.value_at('상대 종족', entry.first_row)
+            stats['tier'] = agg.value_at('상대 티어', entry.last_row)
             member_info["top_opponents"].append(stats)
         
         member_info["top_opponents"].sort(key=lambda x: x['total'], reverse=True)
@@ -313,15 +461,31 @@ def extract_member_details(df):
     return members
 
 
-def extract_player_rankings(df):
-    """우수 학생 평가 점수 계산"""
+def merge_member_details(df, previous, updated):
+    """이전 멤버 상세 + 재계산한 멤버 상세 (기간 내 첫 등장 순서, 기간에 없는 멤버는 제외)"""
+    return {
+        member: updated[member] if member in updated else previous[member]
+        for member in pd.unique(df['멤버 이름'].to_numpy(dtype=object))
+    }
+
+
+def extract_player_rankings(df, months=12, previous=None, only=None):
+    """우수 학생 평가 점수 계산
+
+    previous/only: 증분 실행 - only에 없는 멤버는 이전 항목 재사용 (순위만 다시 매김)
+    """
     rankings = []
+    reused = {} if previous is None else {r['name']: r for r in previous if r['name'] not in only}
+    member_df = df if previous is None else df[df['멤버 이름'].isin(only)]
     
     for member in df['멤버 이름'].unique():
-        m_data = df[df['멤버 이름'] == member]
+        if member in reused:
+            rankings.append(reused[member])
+            continue
+        m_data = member_df[member_df['멤버 이름'] == member]
         
         # 기본 지표
-        monthly_avg = len(m_data) / 12  # 월평균 경기수
+        monthly_avg = len(m_data) / months  # 월평균 경기수
         overall = calc_winrate(m_data)
         
         # 상위 티어 경기 (1~4티어 상대)
@@ -380,8 +544,11 @@ def extract_player_rankings(df):
 
 
 def generate_report_text(summary, monthly, quarterly):
-    """보고서 요약 문장 생성"""
+    """보고서 요약 문장 생성 (기간 이름은 summary['period'] 기준)"""
     overall = summary['overall']
+    label = period_label(summary['period']['start'], summary['period']['end'])
+    full_year = label.endswith('년')
+    span = f"{label} 한 해" if full_year else label
     mvp = summary['highlights']['mvp']
     most_games = summary['highlights']['most_games']
     
@@ -393,12 +560,13 @@ def generate_report_text(summary, monthly, quarterly):
     best_quarter = max(quarterly.items(), key=lambda x: x[1]['winrate'])
     
     texts = {
-        "headline": f"대회 승률 {summary['by_type'].get('대회', {}).get('winrate', 0)}%\n우리의 2025년을 돌아보다",
+        "headline": f"대회 승률 {summary['by_type'].get('대회', {}).get('winrate', 0)}%\n우리의 {label}을 돌아보다",
         "summary_points": [
-            f"2025년 한 해 동안 케이대 학생들은 총 {overall['total']:,}경기를 치렀습니다.",
+            f"{span} 동안 케이대 학생들은 총 {overall['total']:,}경기를 치렀습니다.",
             f"전체 승률 {overall['winrate']}%, {overall['wins']:,}승 {overall['losses']:,}패를 기록했습니다.",
-            f"{best_quarter[0]} 시즌에 {best_quarter[1]['winrate']}%로 가장 높은 승률을 달성했습니다.",
-            f"{best_month[0]}월에는 {best_month[1]['winrate']}%로 연중 최고 승률을 기록했습니다.",
+            f"{_key_label(best_quarter[0])} 시즌에 {best_quarter[1]['winrate']}%로 가장 높은 승률을 달성했습니다.",
+            f"{_key_label(best_month[0], '월')}에는 {best_month[1]['winrate']}%로 "
+            f"{'연중' if full_year else '기간 중'} 최고 승률을 기록했습니다.",
             f"MVP {mvp['name']}은 {mvp['winrate']}%의 압도적인 승률을 보여주었습니다.",
             f"철인 {most_games['name']}은 {most_games['total']:,}경기로 최다 출전했습니다."
         ]
@@ -413,38 +581,104 @@ def generate_report_text(summary, monthly, quarterly):
     return texts
 
 
-def main():
-    print("K UNIVERSITY 2025 연간 보고서 데이터 추출 시작...")
-    
-    # 데이터 로드
-    df = load_data()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="K UNIVERSITY 보고서 데이터 추출")
+    parser.add_argument('--from', dest='start', default=DEFAULT_START, help="시작일 YYYY-MM-DD (기본: 2025-01-01)")
+    parser.add_argument('--to', dest='end', default=DEFAULT_END, help="종료일 YYYY-MM-DD (기본: 2025-12-31)")
+    parser.add_argument('--output', help="출력 JSON 경로 (기본: data/report_data.json 또는 기간별 파일명)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="이전 추출 결과에 추가/변경된 경기만 반영 (영향받은 멤버/상대만 재계산)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = pd.Timestamp(args.start).strftime('%Y-%m-%d')
+    end = pd.Timestamp(args.end).strftime('%Y-%m-%d')
+    print(f"K UNIVERSITY 보고서 데이터 추출 시작... ({start} ~ {end})")
+    
+    # 데이터 로드 (워크북은 한 번만 읽고, 기간 통계는 일별 누적 배열로 계산)
+    table = load_table()
+    daily = DailyPrefix(table)
+    df = load_data(table, start, end)
     print(f"총 {len(df):,}개 경기 데이터 로드 완료")
     
+    if args.output:
+        output_file = Path(args.output)
+    elif (start, end) == (DEFAULT_START, DEFAULT_END):
+        output_file = OUTPUT_DIR / "report_data.json"
+    else:
+        output_file = OUTPUT_DIR / f"report_data_{start.replace('-', '')}_{end.replace('-', '')}.json"
+    
+    # 증분 실행: 이전 추출 상태(행 해시/워터마크)와 비교해 바뀐 멤버만 재계산
+    state_path = output_file.with_suffix('.ingest.npz')
+    source_version = f"{workbook_version(EXCEL_PATH)}:{start}_{end}"
+    previous, diff = None, None
+    if args.incremental and output_file.exists():
+        diff = diff_table(df, load_state(state_path), source_version)
+        if diff.mode == 'none':
+            print(f"변경 없음 - 기존 결과 사용: {output_file}")
+            save_state(state_path, df, source_version)
+            with open(output_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        if diff.mode != 'full':
+            with open(output_file, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            print(f"추가/변경 경기 {len(diff.new_rows):,}개 → 멤버 {len(diff.members)}명, "
+                  f"상대 {len(diff.opponents)}명 재계산")
+    
+    # 팀 합계: 경기만 추가됐으면 이전 합계 + 추가 경기 합계 (수정/삭제가 있으면 전체 재계산)
+    added = df.iloc[diff.new_rows] if previous is not None and diff.mode == 'append' else None
+    
     # 각 섹션별 데이터 추출
+    print("멤버별 상세 데이터 추출 중...")
+    if previous is None:
+        member_details = extract_member_details(df, daily, start, end)
+    else:
+        member_details = merge_member_details(
+            df, previous['member_details'], extract_member_details(df, daily, start, end, only=diff.members)
+        )
+    
     print("요약 데이터 추출 중...")
-    summary = extract_summary(df)
+    if added is None:
+        summary = extract_summary(df, member_details, start, end)
+    else:
+        summary = extract_summary(df, member_details, start, end, previous=previous['summary'], added=added)
     
     print("월별/분기별 데이터 추출 중...")
-    monthly = extract_monthly(df)
-    quarterly = extract_quarterly(df)
+    monthly = extract_monthly(daily, start, end)
+    quarterly = extract_quarterly(daily, start, end)
     
     print("종족 데이터 추출 중...")
-    race_stats = extract_race_stats(df)
+    if added is None:
+        race_stats = extract_race_stats(df)
+    else:
+        race_stats = add_stats(previous['race_stats'], extract_race_stats(added))
     
     print("맵 데이터 추출 중...")
-    map_stats = extract_map_stats(df)
+    if added is None:
+        map_stats = extract_map_stats(df)
+    else:
+        map_stats = extract_map_stats(df, previous=previous['map_stats'], added=added)
     
     print("상대 데이터 추출 중...")
-    opponent_stats = extract_opponent_stats(df)
+    if previous is None:
+        opponent_stats = extract_opponent_stats(df)
+    else:
+        opponent_stats = extract_opponent_stats(df, previous['opponent_stats'], added, only=diff.opponents)
     
     print("대회 데이터 추출 중...")
-    tournament_stats = extract_tournament_stats(df)
-    
-    print("멤버별 상세 데이터 추출 중...")
-    member_details = extract_member_details(df)
+    if previous is None:
+        tournament_stats = extract_tournament_stats(df)
+    else:
+        tournament_stats = extract_tournament_stats(df, previous['tournament_stats'], added, only=diff.members)
     
     print("평가 점수 계산 중...")
-    rankings = extract_player_rankings(df)
+    if previous is None:
+        rankings = extract_player_rankings(df, summary['period']['months'])
+    else:
+        rankings = extract_player_rankings(df, summary['period']['months'],
+                                           previous=previous['rankings'], only=diff.members)
     
     print("보고서 텍스트 생성 중...")
     report_text = generate_report_text(summary, monthly, quarterly)
@@ -464,16 +698,16 @@ def main():
         "report_text": report_text
     }
     
-    # JSON 파일로 저장
-    output_file = OUTPUT_DIR / "report_data.json"
+    # JSON 파일로 저장 (다음 증분 실행 기준 상태도 함께 저장)
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(all_data, f, ensure_ascii=False, indent=2)
+    save_state(state_path, df, source_version)
     
     print(f"\n데이터 추출 완료: {output_file}")
     
     # 요약 출력
     print("\n" + "="*50)
-    print("2025년 연간 보고서 데이터 요약")
+    print(f"보고서 데이터 요약 ({start} ~ {end})")
     print("="*50)
     print(f"총 경기 수: {summary['overall']['total']:,}전")
     print(f"전체 승률: {summary['overall']['winrate']}%")
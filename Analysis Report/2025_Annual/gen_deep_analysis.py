@@ -7,9 +7,15 @@
 
 import json
 import asyncio
-import pandas as pd
+import numpy as np
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches
+from ku_common.cube import cube_for_workbook
+from ku_common.render import render_pages
+
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -27,7 +33,7 @@ def load_data():
 
 def get_sorted_members():
     """최종 티어 및 달성일 기준으로 멤버 정렬"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
@@ -82,9 +88,7 @@ body {
 
 def get_member_deep_analysis(member_name):
     """멤버별 심층 분석 데이터 수집"""
-    df = pd.read_excel(EXCEL_PATH)
-    df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
-    m_df = df_2025[df_2025['멤버 이름'] == member_name]
+    cube = cube_for_workbook(EXCEL_PATH, '2025-01-01', '2025-12-31')
     
     analysis = {
         'name': member_name,
@@ -94,120 +98,85 @@ def get_member_deep_analysis(member_name):
     
     # 종족별 전적 (경기수 10 이상, 40% 미만)
     for race in ['테란', '저그', '프로토스']:
-        race_df = m_df[m_df['상대 종족'] == race]
-        if len(race_df) >= 10:
-            wins = len(race_df[race_df['결과'] == '승'])
-            wr = round(wins / len(race_df) * 100, 2)
+        race_total = cube.stats(member=member_name, opp_race=race)
+        if race_total.games >= 10:
+            wr = round(race_total.wins / race_total.games * 100, 2)
             if wr < 40:
                 analysis['weak_points'].append({
                     'type': 'race',
                     'target': race,
-                    'total': len(race_df),
+                    'total': race_total.games,
                     'winrate': wr
                 })
                 # 해당 종족전 상대별 전적
-                opp_stats = {}
-                for _, row in race_df.iterrows():
-                    opp = row['상대']
-                    result = 1 if row['결과'] == '승' else 0
-                    if opp not in opp_stats:
-                        opp_stats[opp] = {'wins': 0, 'losses': 0}
-                    if result:
-                        opp_stats[opp]['wins'] += 1
-                    else:
-                        opp_stats[opp]['losses'] += 1
-                
-                for opp in opp_stats:
-                    s = opp_stats[opp]
-                    s['total'] = s['wins'] + s['losses']
-                    s['winrate'] = round(s['wins'] / s['total'] * 100, 2) if s['total'] > 0 else 0
+                opponents = [
+                    (entry.value, _win_loss_record(entry))
+                    for entry in cube.breakdown('opponent', member=member_name, opp_race=race)[:10]
+                ]
                 
                 analysis['deep_analysis'][f'vs_{race}'] = {
-                    'opponents': sorted(opp_stats.items(), key=lambda x: x[1]['total'], reverse=True)[:10],
+                    'opponents': opponents,
                     'by_map': {}
                 }
                 
                 # 해당 종족전 맵별 전적
-                for map_name in race_df['맵'].unique():
-                    map_race_df = race_df[race_df['맵'] == map_name]
-                    if len(map_race_df) >= 3:
-                        map_wins = len(map_race_df[map_race_df['결과'] == '승'])
-                        analysis['deep_analysis'][f'vs_{race}']['by_map'][map_name] = {
-                            'total': len(map_race_df),
-                            'wins': map_wins,
-                            'winrate': round(map_wins / len(map_race_df) * 100, 2)
+                for entry in cube.breakdown('map', ranked=False, member=member_name, opp_race=race):
+                    if entry.value is not None and entry.games >= 3:
+                        analysis['deep_analysis'][f'vs_{race}']['by_map'][entry.value] = {
+                            'total': entry.games,
+                            'wins': entry.wins,
+                            'winrate': round(entry.wins / entry.games * 100, 2)
                         }
     
     # 맵별 전적 (경기수 10 이상, 40% 미만)
-    for map_name in m_df['맵'].unique():
-        map_df = m_df[m_df['맵'] == map_name]
-        if len(map_df) >= 10:
-            wins = len(map_df[map_df['결과'] == '승'])
-            wr = round(wins / len(map_df) * 100, 2)
+    for map_entry in cube.breakdown('map', ranked=False, member=member_name):
+        map_name = map_entry.value
+        if map_name is not None and map_entry.games >= 10:
+            wr = round(map_entry.wins / map_entry.games * 100, 2)
             if wr < 40:
                 analysis['weak_points'].append({
                     'type': 'map',
                     'target': map_name,
-                    'total': len(map_df),
+                    'total': map_entry.games,
                     'winrate': wr
                 })
                 
                 # 해당 맵 종족별 전적
                 race_stats = {}
                 for race in ['테란', '저그', '프로토스']:
-                    race_map_df = map_df[map_df['상대 종족'] == race]
-                    if len(race_map_df) >= 1:
-                        race_wins = len(race_map_df[race_map_df['결과'] == '승'])
+                    race_map = cube.stats(member=member_name, map=map_name, opp_race=race)
+                    if race_map.games >= 1:
                         race_stats[race] = {
-                            'total': len(race_map_df),
-                            'wins': race_wins,
-                            'winrate': round(race_wins / len(race_map_df) * 100, 2) if len(race_map_df) > 0 else 0
+                            'total': race_map.games,
+                            'wins': race_map.wins,
+                            'winrate': round(race_map.wins / race_map.games * 100, 2)
                         }
                 
-                # 해당 맵 상대별 전적
-                opp_stats = {}
-                for _, row in map_df.iterrows():
-                    opp = row['상대']
-                    opp_race = row['상대 종족']
-                    result = 1 if row['결과'] == '승' else 0
-                    if opp not in opp_stats:
-                        opp_stats[opp] = {'race': opp_race, 'wins': 0, 'losses': 0}
-                    if result:
-                        opp_stats[opp]['wins'] += 1
-                    else:
-                        opp_stats[opp]['losses'] += 1
-                
-                for opp in opp_stats:
-                    s = opp_stats[opp]
-                    s['total'] = s['wins'] + s['losses']
-                    s['winrate'] = round(s['wins'] / s['total'] * 100, 2) if s['total'] > 0 else 0
+                # 해당 맵 상대별 전적 (종족은 첫 경기 기준)
+                opponents = [
+                    (entry.value, {'race': cube.label('opp_race', entry.first_cell), **_win_loss_record(entry)})
+                    for entry in cube.breakdown('opponent', member=member_name, map=map_name)[:8]
+                ]
                 
                 analysis['deep_analysis'][f'map_{map_name}'] = {
                     'by_race': race_stats,
-                    'opponents': sorted(opp_stats.items(), key=lambda x: x[1]['total'], reverse=True)[:8]
+                    'opponents': opponents
                 }
     
     # 티어별 전적 (경기 시점 기준으로 재계산)
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
                   '6티어': 6, '7티어': 7, '8티어': 8, '베이비': 9}
     
-    # 경기 시점 기준 티어 비교
-    tier_comparison = {'상위': {'wins': 0, 'total': 0}, '동일': {'wins': 0, 'total': 0}, '하위': {'wins': 0, 'total': 0}}
+    # 경기 시점 기준 티어 비교 (멤버 티어 × 상대 티어 행렬에서 합산)
+    games, wins = cube.dense(('member_tier', 'opp_tier'), member=member_name)
+    my_tier = np.array([tier_order.get(t, 9) for t in cube.labels['member_tier']])[:, None]
+    opp_tier = np.array([tier_order.get(t, 9) for t in cube.labels['opp_tier']])[None, :]
     
-    for _, row in m_df.iterrows():
-        my_tier = tier_order.get(row['멤버 티어'], 9)
-        opp_tier = tier_order.get(row['상대 티어'], 9)
-        result = 1 if row['결과'] == '승' else 0
-        
-        if opp_tier < my_tier:  # 상대가 상위 티어
-            tier_comparison['상위']['total'] += 1
-            tier_comparison['상위']['wins'] += result
-        elif opp_tier == my_tier:  # 동일 티어
-            tier_comparison['동일']['total'] += 1
-            tier_comparison['동일']['wins'] += result
-        else:  # 상대가 하위 티어
-            tier_comparison['하위']['total'] += 1
-            tier_comparison['하위']['wins'] += result
+    tier_comparison = {}
+    for key, relation in [('상위', opp_tier < my_tier),    # 상대가 상위 티어
+                          ('동일', opp_tier == my_tier),   # 동일 티어
+                          ('하위', opp_tier > my_tier)]:   # 상대가 하위 티어
+        tier_comparison[key] = {'wins': int(wins[relation].sum()), 'total': int(games[relation].sum())}
     
     for key in tier_comparison:
         t = tier_comparison[key]
@@ -218,6 +187,16 @@ def get_member_deep_analysis(member_name):
     return analysis
 
 
+def _win_loss_record(entry):
+    """큐브 집계 결과 → 승/패/경기수/승률 딕셔너리"""
+    return {
+        'wins': entry.wins,
+        'losses': entry.games - entry.wins,
+        'total': entry.games,
+        'winrate': round(entry.wins / entry.games * 100, 2) if entry.games > 0 else 0
+    }
+
+
 def gen_tier_comparison_page(member_name, analysis, idx):
     """티어별 비교 페이지 (경기 시점 기준)"""
     tc = analysis['tier_comparison']
@@ -498,17 +477,8 @@ async def main():
     
     print(f"\n총 {len(pages)}개 페이지 생성 중...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-        
-        await browser.close()
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT}, verbose=False,
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print("✓ 심층 분석 페이지 생성 완료!")
 
@@ -6,9 +6,13 @@
 
 import json
 import asyncio
-import pandas as pd
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches
+from ku_common.render import render_pages
+
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -26,7 +30,7 @@ def load_data():
 
 def get_sorted_members():
     """최종 티어 및 달성일 기준으로 멤버 정렬"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
@@ -317,13 +321,8 @@ async def main():
     
     print("03-00 멤버 전체 비교 페이지 생성 중...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-        await page.set_content(html)
-        await page.screenshot(path=str(output_path), type='png')
-        await page.close()
-        await browser.close()
+    await render_pages([(output_path.stem, html)], OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT}, verbose=False,
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print(f"✓ {output_path.name} 생성 완료!")
 
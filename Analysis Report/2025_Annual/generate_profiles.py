@@ -6,7 +6,10 @@
 import json
 import asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.render import render_pages
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -196,20 +199,12 @@ async def generate_all_profiles(data):
     
     print(f"총 {len(members_sorted)}명 멤버 프로필 생성...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for idx, (member_name, _) in enumerate(members_sorted, 1):
-            html = gen_member_profile(data, member_name, idx)
-            output_path = OUTPUT_DIR / f"03-{idx:02d}_00_{member_name}_profile.png"
-            
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ 03-{idx:02d}_00_{member_name}_profile.png")
-        
-        await browser.close()
+    pages = [
+        (f"03-{idx:02d}_00_{member_name}_profile", gen_member_profile(data, member_name, idx))
+        for idx, (member_name, _) in enumerate(members_sorted, 1)
+    ]
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print("\n프로필 생성 완료!")
 
@@ -1,58 +1,81 @@
 #!/usr/bin/env python3
 """
 K UNIVERSITY 2025 연간 보고서 PDF 병합
-- 모든 PNG 이미지를 순서대로 하나의 PDF로 병합
+- 페이지 목록(output/manifest.json, 렌더러가 기록)에 있는 PNG만 목록 순서대로 하나의 PDF로 병합
+- 지난 병합 이후 해시가 바뀐 페이지만 다시 변환, 나머지는 이전 PDF의 이미지 재사용 (--full: 전체)
+- 페이지 준비는 프로세스 풀에서 병렬, PDF는 준비된 순서대로 파일에 바로 기록 (ku_common.pdf)
+  불투명 RGB PNG는 재인코딩 없이 그대로 사용, 그 외(투명 등)는 기존처럼 다크 배경 합성 후 JPEG
+- --vector: 생성 스크립트를 --pdf로 실행해 만든 페이지별 벡터 PDF(output/pdf/)를
+  같은 순서로 이어 붙임 (이미지 변환 없음, 텍스트 선택 가능)
 """
 
-import img2pdf
+import pikepdf
 from pathlib import Path
 from PIL import Image
 import io
+import os
+import sys
+import json
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.pdf import StreamingPdfWriter, png_passthrough, jpeg_image, page_image, ordered_map
+from ku_common.manifest import PageManifest
 
 OUTPUT_DIR = Path(__file__).parent / "output"
+PDF_PAGES_DIR = OUTPUT_DIR / "pdf"
 PDF_OUTPUT = Path(__file__).parent / "K_UNIVERSITY_2025_Annual_Report.pdf"
+PDF_VECTOR_OUTPUT = Path(__file__).parent / "K_UNIVERSITY_2025_Annual_Report_vector.pdf"
+# 지난 병합의 페이지별 해시 (바뀐 페이지만 다시 변환)
+PDF_STATE = Path(__file__).parent / ".pdf_state.json"
 
 
-def get_sorted_images():
-    """이미지 파일을 보고서 순서대로 정렬"""
-    images = list(OUTPUT_DIR.glob("*.png"))
+def load_pages(directory=OUTPUT_DIR):
+    """페이지 목록(렌더러가 기록한 manifest.json) → 보고서 순서대로 항목 목록"""
+    manifest = PageManifest(directory)
+    if not manifest.exists:
+        print(f"❌ 페이지 목록이 없습니다: {manifest.manifest_path}")
+        print(f"   생성 스크립트를 실행하거나 기존 파일을 등록하세요: python -m ku_common.manifest {directory}")
+        sys.exit(1)
     
-    # 정렬 키 함수
-    def sort_key(path):
-        name = path.stem
-        
-        # 섹션별 우선순위
-        section_order = {
-            '00': 0,   # 표지
-            '01': 1,   # 요약
-            '02': 2,   # 전체 전적
-            '03': 3,   # 멤버별 분석
-            '04': 4,   # 대회 분석
-            '05': 5,   # 맵 분석
-            '06': 6,   # 상대 분석
-            '07': 7,   # POTY
-            '08': 8,   # 타임라인
-            '09': 9,   # 엔딩
-        }
-        
-        # 파일명에서 섹션 번호 추출
-        parts = name.split('_')[0].split('-')
-        section = parts[0]
-        
-        # 섹션 내 순서
-        if len(parts) == 1:
-            sub_order = 0
-            sub_sub_order = 0
-        elif len(parts) == 2:
-            sub_order = int(parts[1]) if parts[1].isdigit() else ord(parts[1])
-            sub_sub_order = 0
-        else:
-            sub_order = int(parts[1]) if parts[1].isdigit() else 0
-            sub_sub_order = int(parts[2]) if parts[2].isdigit() else 0
-        
-        return (section_order.get(section, 99), sub_order, sub_sub_order, name)
+    pages = manifest.pages()
+    missing = [entry['name'] for entry in pages if not manifest.path(entry).exists()]
+    if missing:
+        print(f"❌ 목록에 있는 페이지 파일이 없습니다: {', '.join(missing)}")
+        sys.exit(1)
+    return manifest, pages
+
+
+def load_previous_build():
+    """
+    지난 병합 결과 → ({페이지 이름: (sha256, PDF 페이지 번호)}, PDF)
+    
+    PDF가 없거나 지난 병합 이후 바뀌었으면 ({}, None) → 전체 다시 만들기
+    """
+    try:
+        with open(PDF_STATE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        stat = PDF_OUTPUT.stat()
+    except (OSError, ValueError):
+        return {}, None
+    if [stat.st_size, stat.st_mtime_ns] != [state.get('size'), state.get('mtime_ns')]:
+        return {}, None
     
-    return sorted(images, key=sort_key)
+    previous = pikepdf.open(PDF_OUTPUT)
+    if len(previous.pages) != len(state['pages']):
+        previous.close()
+        return {}, None
+    return {page['name']: (page['sha256'], i) for i, page in enumerate(state['pages'])}, previous
+
+
+def save_build_state(pages):
+    stat = PDF_OUTPUT.stat()
+    state = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'pages': [{'name': entry['name'], 'sha256': entry['sha256']} for entry in pages],
+    }
+    with open(PDF_STATE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
 
 
 def convert_to_rgb(image_path):
@@ -75,31 +98,87 @@ def convert_to_rgb(image_path):
         return output.read()
 
 
+def prepare_page(image_path):
+    """PDF 페이지 이미지 준비 (워커 프로세스에서 실행)"""
+    image = png_passthrough(image_path)
+    if image is not None:
+        return image
+    
+    with Image.open(image_path) as img:
+        size, dpi = img.size, img.info.get('dpi')
+    return jpeg_image(convert_to_rgb(image_path), size, dpi)
+
+
+def merge_vector_pages():
+    """페이지별 벡터 PDF를 보고서 순서대로 하나의 PDF로 연결"""
+    print("벡터 PDF 병합 시작...")
+    
+    manifest, entries = load_pages(PDF_PAGES_DIR)
+    pages = [manifest.path(entry) for entry in entries]
+    print(f"총 {len(pages)}개 페이지 ({manifest.manifest_path})")
+    if not pages:
+        print("❌ 페이지 PDF가 없습니다. 생성 스크립트를 --pdf 옵션으로 실행하세요.")
+        sys.exit(1)
+    
+    # 저장이 끝날 때까지 원본 PDF를 열어 둬야 함 (페이지 객체가 원본을 참조)
+    report = pikepdf.Pdf.new()
+    sources = []
+    try:
+        for path in pages:
+            source = pikepdf.open(path)
+            sources.append(source)
+            report.pages.extend(source.pages)
+        report.save(PDF_VECTOR_OUTPUT)
+    finally:
+        for source in sources:
+            source.close()
+    
+    print(f"\n✅ 벡터 PDF 생성 완료: {PDF_VECTOR_OUTPUT}")
+    print(f"   파일 크기: {PDF_VECTOR_OUTPUT.stat().st_size / 1024 / 1024:.1f} MB")
+
+
 def main():
+    if '--vector' in sys.argv[1:]:
+        merge_vector_pages()
+        return
+    
     print("PDF 병합 시작...")
     
-    # 정렬된 이미지 목록
-    images = get_sorted_images()
-    print(f"총 {len(images)}개 이미지 발견")
+    # 페이지 목록 (렌더러가 기록한 순서/해시)
+    manifest, pages = load_pages()
+    print(f"총 {len(pages)}개 페이지 ({manifest.manifest_path})")
     
     # 순서 출력
     print("\n=== 페이지 순서 ===")
-    for i, img in enumerate(images, 1):
-        print(f"{i:3d}. {img.name}")
-    
-    # RGB 변환
-    print("\n이미지 변환 중...")
-    image_data = []
-    for img_path in images:
-        data = convert_to_rgb(img_path)
-        image_data.append(data)
+    for i, entry in enumerate(pages, 1):
+        print(f"{i:3d}. {entry['path']}")
     
-    # PDF 생성
-    print("\nPDF 생성 중...")
-    pdf_bytes = img2pdf.convert(image_data)
+    # 지난 병합과 해시가 같은 페이지는 이전 PDF의 이미지를 그대로 사용 (--full: 전체 다시 변환)
+    previous, previous_pdf = ({}, None) if '--full' in sys.argv[1:] else load_previous_build()
+    reused = [previous.get(entry['name'], (None,))[0] == entry['sha256'] for entry in pages]
+    changed = [manifest.path(entry) for entry, same in zip(pages, reused) if not same]
     
-    with open(PDF_OUTPUT, 'wb') as f:
-        f.write(pdf_bytes)
+    # 변환(병렬) → 순서대로 PDF에 기록 (메모리에는 진행 중인 페이지만 유지)
+    workers = os.cpu_count() or 1
+    print(f"\nPDF 생성 중... (다시 변환 {len(changed)}개, 재사용 {len(pages) - len(changed)}개, 프로세스 {workers}개)")
+    passthrough = 0
+    tmp_output = PDF_OUTPUT.with_name(PDF_OUTPUT.name + '.tmp')
+    try:
+        prepared = ordered_map(prepare_page, changed, workers=workers)
+        with StreamingPdfWriter(tmp_output) as writer:
+            for entry, same in zip(pages, reused):
+                if same:
+                    writer.add_image(page_image(previous_pdf.pages[previous[entry['name']][1]]))
+                    continue
+                image = next(prepared)
+                writer.add_image(image)
+                passthrough += image.filter == 'FlateDecode'
+    finally:
+        if previous_pdf is not None:
+            previous_pdf.close()
+    tmp_output.replace(PDF_OUTPUT)
+    save_build_state(pages)
+    print(f"  - PNG 그대로 사용 {passthrough}개, JPEG 변환 {len(changed) - passthrough}개")
     
     print(f"\n✅ PDF 생성 완료: {PDF_OUTPUT}")
     print(f"   파일 크기: {PDF_OUTPUT.stat().st_size / 1024 / 1024:.1f} MB")
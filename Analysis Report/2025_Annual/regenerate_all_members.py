@@ -7,9 +7,14 @@
 
 import json
 import asyncio
-import pandas as pd
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches
+from ku_common.render import render_pages, PDF_SUBDIR
+from ku_common.manifest import PageManifest
+
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -27,7 +32,7 @@ def load_data():
 
 def get_sorted_members():
     """최종 티어 및 달성일 기준으로 멤버 정렬"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
@@ -483,10 +488,12 @@ async def regenerate_all():
     for i, m in enumerate(sorted_members, 1):
         print(f"{i:2d}. {m['name']} ({m['final_tier']})")
     
-    # 기존 03-XX 파일 삭제
+    # 기존 03-XX 페이지 삭제 (멤버 순서가 바뀌면 번호가 달라지므로 섹션 전체를 목록과 디렉토리에서 제거)
     print("\n기존 멤버 페이지 삭제 중...")
-    for old_file in OUTPUT_DIR.glob("03-*"):
-        old_file.unlink()
+    output_format = 'pdf' if '--pdf' in sys.argv[1:] else 'png'
+    manifest = PageManifest(OUTPUT_DIR / PDF_SUBDIR if output_format == 'pdf' else OUTPUT_DIR)
+    print(f"  - {manifest.discard_prefix('03-')}개 삭제")
+    manifest.save()
     
     pages = []
     
@@ -518,20 +525,9 @@ async def regenerate_all():
     
     print(f"\n총 {len(pages)}개 페이지 생성 중...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            if html is None:
-                continue
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ {name}.png")
-        
-        await browser.close()
+    # --book: 섹션별로 한 문서에 모아 렌더링 (03 멤버 페이지 등), --pdf: 벡터 PDF (output/pdf/)
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       book='--book' in sys.argv[1:], output_format=output_format)
     
     print("\n멤버 페이지 재생성 완료!")
 
@@ -7,7 +7,10 @@ K UNIVERSITY 2025 연간 보고서 이미지 생성기
 import json
 import asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.render import render_pages
 
 # 경로 설정
 BASE_DIR = Path(__file__).parent
@@ -729,12 +732,8 @@ def generate_ending_html():
 
 async def render_html_to_png(html_content, output_path):
     """HTML을 PNG로 렌더링"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-        await page.set_content(html_content)
-        await page.screenshot(path=str(output_path), type='png')
-        await browser.close()
+    output_path = Path(output_path)
+    await render_pages([(output_path.stem, html_content)], output_path.parent, viewport={'width': WIDTH, 'height': HEIGHT})
 
 
 async def generate_all_pages(data):
@@ -768,18 +767,8 @@ async def generate_all_pages(data):
     # 렌더링
     print(f"\n총 {len(pages)}개 페이지 렌더링 시작...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ {name}.png 생성 완료")
-        
-        await browser.close()
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print(f"\n모든 페이지 생성 완료! 출력 폴더: {OUTPUT_DIR}")
 
@@ -6,7 +6,10 @@ K UNIVERSITY 2025 연간 보고서 - POTY & 타임라인 섹션 생성
 import json
 import asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.render import render_pages
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -639,18 +642,8 @@ async def generate_final(data):
     
     print(f"\n총 {len(pages)}개 페이지 렌더링...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ {name}.png")
-        
-        await browser.close()
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print(f"\n완료! 출력: {OUTPUT_DIR}")
 
@@ -7,7 +7,10 @@ K UNIVERSITY 2025 연간 보고서 전체 이미지 생성기
 import json
 import asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.render import render_pages
 
 # 경로 설정
 BASE_DIR = Path(__file__).parent
@@ -975,20 +978,10 @@ async def generate_all(data):
     
     print(f"\n총 {len(pages)}개 페이지 렌더링 시작...")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            if html is None:
-                continue
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ {name}.png")
-        
-        await browser.close()
+    # --book: 섹션별로 한 문서에 모아 렌더링 (03 멤버 페이지 등), --pdf: 벡터 PDF (output/pdf/)
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       book='--book' in sys.argv[1:],
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print(f"\n모든 페이지 생성 완료! 출력: {OUTPUT_DIR}")
 
@@ -9,9 +9,14 @@
 
 import json
 import asyncio
-import pandas as pd
 from pathlib import Path
-from playwright.async_api import async_playwright
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches
+from ku_common.cube import cube_for_workbook
+from ku_common.render import render_pages
+
 
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "report_data.json"
@@ -137,7 +142,7 @@ tr:hover {{ background: rgba(74, 144, 217, 0.1); }}
 # ============================================================
 def get_official_match_data():
     """공식전 데이터 추출 (대학대전/CK 구분)"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     tour_df = df_2025[df_2025['구분2'] == '대회']
     
@@ -371,29 +376,18 @@ tr:hover {{ background: rgba(74, 144, 217, 0.1); }}
 # ============================================================
 def get_member_opponent_data(member_name):
     """멤버별 상대 전적 데이터"""
-    df = pd.read_excel(EXCEL_PATH)
-    df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
-    m_df = df_2025[df_2025['멤버 이름'] == member_name]
+    cube = cube_for_workbook(EXCEL_PATH, '2025-01-01', '2025-12-31')
     
+    # 상대별 전적 (첫 경기 순, 종족은 첫 경기 기준)
     opponent_stats = {}
-    for _, row in m_df.iterrows():
-        opp = row['상대']
-        opp_race = row['상대 종족']
-        result = 1 if row['결과'] == '승' else 0
-        
-        if opp not in opponent_stats:
-            opponent_stats[opp] = {'race': opp_race, 'wins': 0, 'losses': 0}
-        
-        if result:
-            opponent_stats[opp]['wins'] += 1
-        else:
-            opponent_stats[opp]['losses'] += 1
-    
-    # 전적 계산 및 정렬
-    for opp in opponent_stats:
-        s = opponent_stats[opp]
-        s['total'] = s['wins'] + s['losses']
-        s['winrate'] = round(s['wins'] / s['total'] * 100, 2) if s['total'] > 0 else 0
+    for entry in cube.breakdown('opponent', ranked=False, member=member_name):
+        opponent_stats[entry.value] = {
+            'race': cube.label('opp_race', entry.first_cell),
+            'wins': entry.wins,
+            'losses': entry.games - entry.wins,
+            'total': entry.games,
+            'winrate': round(entry.wins / entry.games * 100, 2) if entry.games > 0 else 0
+        }
     
     return opponent_stats
 
@@ -512,7 +506,7 @@ tr:hover {{ background: rgba(74, 144, 217, 0.1); }}
 # ============================================================
 def calculate_poty_scores():
     """POTY 점수 계산 (새 기준)"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
@@ -954,7 +948,7 @@ body {{ display: flex; flex-direction: column; justify-content: center; align-it
 # ============================================================
 def get_sorted_members():
     """최종 티어 및 달성일 기준으로 멤버 정렬"""
-    df = pd.read_excel(EXCEL_PATH)
+    df = load_matches(EXCEL_PATH)
     df_2025 = df[(df['날짜'] >= '2025-01-01') & (df['날짜'] <= '2025-12-31')].copy()
     
     tier_order = {'1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5, 
@@ -1006,24 +1000,9 @@ async def main():
     
     print(f"총 {len(pages)}개 페이지 생성 중...")
     
-    # 기존 04-01, 04-02 삭제
-    for old_file in OUTPUT_DIR.glob("04-01_tournament*.png"):
-        old_file.unlink()
-    for old_file in OUTPUT_DIR.glob("04-02_tournament*.png"):
-        old_file.unlink()
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        
-        for name, html in pages:
-            output_path = OUTPUT_DIR / f"{name}.png"
-            page = await browser.new_page(viewport={'width': WIDTH, 'height': HEIGHT})
-            await page.set_content(html)
-            await page.screenshot(path=str(output_path), type='png')
-            await page.close()
-            print(f"  ✓ {name}.png")
-        
-        await browser.close()
+    # 같은 번호의 이전 페이지(04-01/04-02_tournament_*)는 렌더링 후 페이지 목록에서 자동 삭제
+    await render_pages(pages, OUTPUT_DIR, viewport={'width': WIDTH, 'height': HEIGHT},
+                       output_format='pdf' if '--pdf' in sys.argv[1:] else 'png')
     
     print("\n페이지 업데이트 완료!")
     
@@ -6,24 +6,122 @@ Step 2: 패턴 발견 및 분석 (14명 전체)
 Step 3: 차트 생성 (14명 전체)
 Step 4: HTML 슬라이드 생성 (14명 전체)
 Step 5: PNG 변환 (14명 전체)
+
+기본: 각 단계 클래스를 한 프로세스에서 라이브러리로 실행 (워크북/JSON은 PipelineContext로 한 번만 로드)
+--subprocess: 기존처럼 단계마다 별도 Python 프로세스로 실행 (단계 간 격리)
+--dag: 멤버 × 단계 노드 그래프로 실행, 입력(워크북/JSON/스크립트/페이지 템플릿)이 그대로인 노드는 건너뜀
+       (지문: output/.build_state.json, --force로 전체 재실행)
+--jobs N: --dag 노드를 N개 프로세스에서 동시 실행 (기본: CPU 수)
+--browsers M: 동시에 실행할 PNG 변환(브라우저) 노드 수 (기본: 2, Chrome 메모리 사용량 제한)
 """
 
 import subprocess
 import sys
+import os
+import time
+import importlib.util
+import inspect
+import multiprocessing.util
 from pathlib import Path
-import json
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from ku_common.context import PipelineContext
+from ku_common.dag import BuildGraph, BuildNode, print_build_report
+from ku_common import charts, chart_templates, fonts
+
+# (스크립트, 클래스, 실행 메서드, 설명)
+STEPS = [
+    ('02_pattern_discovery_all.py', 'PatternDiscovery', 'run_all', 'Step 2: 패턴 발견 및 분석 (14명 전체)'),
+    ('03_generate_charts_all.py', 'ChartGenerator', 'generate_for_all_members', 'Step 3: 차트 생성 (14명 전체)'),
+    ('04_generate_slides_all.py', 'SlideGenerator', 'generate_for_all_members', 'Step 4: HTML 슬라이드 생성 (14명 전체)'),
+    ('05_convert_to_png_all.py', 'PNGConverter', 'convert_for_all_members', 'Step 5: PNG 변환 (14명 전체)'),
+]
+
+SCRIPTS_DIR = Path(__file__).resolve().parent / 'scripts'
+DEFAULT_BROWSER_SLOTS = 2
+
+# 프로세스별 캐시 (병렬 실행 시 워커 프로세스마다 컨텍스트/단계 인스턴스를 한 번만 생성)
+_contexts = {}
+_steps = {}
+_steps_finalizer = None
+
+def load_step_module(script_name):
+    """단계 스크립트를 모듈로 로드 (파일명이 숫자로 시작해 일반 import 불가)"""
+    module_name = 'ku_step_' + Path(script_name).stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / script_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def get_step(base_dir, script_name, class_name):
+    """단계 클래스 인스턴스 (프로세스마다 처음 필요할 때 한 번만 생성, 컨텍스트 공유)"""
+    global _steps_finalizer
+    key = (str(base_dir), script_name, class_name)
+    if key not in _steps:
+        if _steps_finalizer is None:
+            # 풀 워커는 atexit을 실행하지 않음 → multiprocessing 종료 처리에서 단계 정리
+            _steps_finalizer = multiprocessing.util.Finalize(None, close_steps, exitpriority=10)
+        if str(base_dir) not in _contexts:
+            _contexts[str(base_dir)] = PipelineContext(base_dir)
+        _steps[key] = getattr(load_step_module(script_name), class_name)(context=_contexts[str(base_dir)])
+    return _steps[key]
+
+def close_steps():
+    """캐시한 단계 인스턴스 정리 (close()가 있는 단계만, 예: PNG 변환기의 브라우저 세션)"""
+    for step in _steps.values():
+        close = getattr(step, 'close', None)
+        if close is not None:
+            close()
+    _steps.clear()
+
+class StepTask:
+    """빌드 노드 작업: 단계 인스턴스의 메서드 호출 (pickle 가능 → 워커 프로세스로 전달)"""
+    
+    def __init__(self, base_dir, script_name, class_name, method_name, *args, required=False):
+        """
+        Args:
+            required: True면 메서드가 None을 반환할 때 실패로 처리 (PNG 변환 등)
+        """
+        self.base_dir = str(base_dir)
+        self.script_name = script_name
+        self.class_name = class_name
+        self.method_name = method_name
+        self.args = args
+        self.required = required
+    
+    def __call__(self):
+        step = get_step(self.base_dir, self.script_name, self.class_name)
+        result = getattr(step, self.method_name)(*self.args)
+        if self.required and result is None:
+            raise RuntimeError(f"{self.method_name} 실패: {' '.join(map(str, self.args))}")
 
 class PipelineRunner:
-    def __init__(self):
-        """파이프라인 실행기 초기화"""
-        self.base_dir = Path(__file__).parent
+    def __init__(self, in_process=True):
+        """
+        파이프라인 실행기 초기화
+        
+        Args:
+            in_process: True면 단계 클래스를 현재 프로세스에서 실행, False면 단계마다 subprocess 실행
+        """
+        self.base_dir = Path(__file__).resolve().parent
         self.scripts_dir = self.base_dir / 'scripts'
-        self.python_path = self.base_dir / '.venv' / 'Scripts' / 'python.exe'
+        self.in_process = in_process
         
-        # 멤버 목록 로드
-        stats_file = self.base_dir / 'output' / 'data' / 'member_statistics.json'
-        with open(stats_file, 'r', encoding='utf-8') as f:
-            self.member_stats = json.load(f)
+        # subprocess 모드용 Python (프로젝트 가상환경 우선, 없으면 현재 인터프리터)
+        venv_pythons = [
+            self.base_dir / '.venv' / 'Scripts' / 'python.exe',
+            self.base_dir / '.venv' / 'bin' / 'python',
+        ]
+        self.python_path = next((p for p in venv_pythons if p.exists()), Path(sys.executable))
+        
+        # 공유 컨텍스트 (멤버 목록, 이후 단계에서 워크북/큐브/JSON 재사용)
+        self.context = PipelineContext(self.base_dir)
+        self.member_stats = self.context.member_stats
+        _contexts[str(self.base_dir)] = self.context
         
         self.all_members = list(self.member_stats.keys())
         
@@ -34,8 +132,33 @@ class PipelineRunner:
         print(f"✓ 초기화 완료")
         print(f"  - 총 멤버 수: {len(self.all_members)}")
         print(f"  - 멤버 목록: {', '.join(self.all_members)}")
+        print(f"  - 실행 모드: {'단일 프로세스 (공유 컨텍스트)' if in_process else 'subprocess'}")
         print()
     
+    def run_step(self, script_name, class_name, method_name, description):
+        """단계 클래스를 현재 프로세스에서 실행 (공유 컨텍스트 전달)"""
+        print("=" * 80)
+        print(f"{description}")
+        print("=" * 80)
+        print()
+        
+        start = time.perf_counter()
+        try:
+            module = load_step_module(script_name)
+            step = getattr(module, class_name)(context=self.context)
+            getattr(step, method_name)()
+        except SystemExit as e:
+            print(f"❌ 단계 종료 (exit code {e.code})")
+            return False
+        except Exception as e:
+            print(f"❌ 실행 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+        
+        print(f"\n✓ {description} 완료 ({time.perf_counter() - start:.1f}초)\n")
+        return True
+    
     def run_script(self, script_name, description):
         """스크립트 실행"""
         print("=" * 80)
@@ -51,7 +174,8 @@ class PipelineRunner:
                 capture_output=True,
                 text=True,
                 timeout=600,  # 10분 타임아웃
-                encoding='utf-8'
+                encoding='utf-8',
+                cwd=self.base_dir
             )
             
             print(result.stdout)
@@ -72,15 +196,16 @@ class PipelineRunner:
     
     def run_all(self):
         """전체 파이프라인 실행"""
-        steps = [
-            ('02_pattern_discovery_all.py', 'Step 2: 패턴 발견 및 분석 (14명 전체)'),
-            ('03_generate_charts_all.py', 'Step 3: 차트 생성 (14명 전체)'),
-            ('04_generate_slides_all.py', 'Step 4: HTML 슬라이드 생성 (14명 전체)'),
-            ('05_convert_to_png_all.py', 'Step 5: PNG 변환 (14명 전체)')
-        ]
+        # Step 2/3은 ku_annual 기준 상대 경로(output/, 워크북)를 사용
+        os.chdir(self.base_dir)
         
-        for script_name, description in steps:
-            if not self.run_script(script_name, description):
+        for script_name, class_name, method_name, description in STEPS:
+            if self.in_process:
+                success = self.run_step(script_name, class_name, method_name, description)
+            else:
+                success = self.run_script(script_name, description)
+            
+            if not success:
                 print()
                 print("=" * 80)
                 print(f"❌ 파이프라인 실패: {description}")
@@ -99,12 +224,132 @@ class PipelineRunner:
         print(f"  - PNG 이미지: output/images/ ({len(self.all_members) * 5}개)")
         print()
         return True
+    
+    def build_graph(self):
+        """
+        멤버 × 단계 빌드 그래프 구성
+        
+        - 분석(멤버): 워크북, Step 1 JSON, Step 2 스크립트 → output/analysis/<멤버>_analysis.json
+        - 차트(멤버, 차트): 워크북, member_statistics.json, Step 3 스크립트, 차트 템플릿 → output/charts/*.png
+        - 슬라이드(멤버, 페이지): 분석 JSON, 페이지 차트, 페이지 템플릿(메서드 소스) → output/slides/*.html
+        - PNG(멤버, 페이지): 슬라이드 HTML, Step 5 스크립트 → output/images/*.png
+        """
+        graph = BuildGraph(self.base_dir / 'output' / '.build_state.json')
+        
+        output_dir = self.base_dir / 'output'
+        data_dir = output_dir / 'data'
+        step1_outputs = [data_dir / 'tier_history.json', data_dir / 'team_statistics.json',
+                         data_dir / 'member_statistics.json']
+        workbook = self.context.excel_path
+        
+        chart_step = ('03_generate_charts_all.py', 'ChartGenerator')
+        slide_step = ('04_generate_slides_all.py', 'SlideGenerator')
+        png_step = ('05_convert_to_png_all.py', 'PNGConverter')
+        chart_cls = getattr(load_step_module(chart_step[0]), chart_step[1])
+        # 차트 설정/템플릿 모듈 (폰트, 스타일, 배치가 바뀌면 차트 다시 생성)
+        # 포함한 폰트 파일은 차트와 슬라이드(@font-face) 공통 입력 (추가/교체 시 다시 생성)
+        font_files = fonts.font_paths()
+        chart_modules = [Path(charts.__file__), Path(chart_templates.__file__), Path(fonts.__file__), *font_files]
+        slide_cls = getattr(load_step_module(slide_step[0]), slide_step[1])
+        
+        # 페이지 템플릿 = 페이지 메서드 + 공통 스타일 소스 (다른 페이지 수정은 영향 없음)
+        shared_template = inspect.getsource(slide_cls._get_base_style) + inspect.getsource(slide_cls._image_to_base64)
+        templates = {
+            page: inspect.getsource(getattr(slide_cls, f'generate_{page}')) + shared_template
+            for page in slide_cls.PAGES
+        }
+        
+        for member in self.all_members:
+            analysis_path = output_dir / 'analysis' / f'{member}_analysis.json'
+            graph.add(BuildNode(
+                f'analysis:{member}',
+                StepTask(self.base_dir, '02_pattern_discovery_all.py', 'PatternDiscovery', 'run_member', member),
+                inputs=[workbook, *step1_outputs, self.scripts_dir / '02_pattern_discovery_all.py'],
+                outputs=[analysis_path],
+                group='Step 2 분석'
+            ))
+            
+            for chart in chart_cls.CHART_NAMES:
+                graph.add(BuildNode(
+                    f'chart:{member}:{chart}',
+                    StepTask(self.base_dir, *chart_step, 'generate_chart', member, chart),
+                    inputs=[workbook, data_dir / 'member_statistics.json', self.scripts_dir / chart_step[0],
+                            *chart_modules],
+                    outputs=[output_dir / 'charts' / f'{member}_{chart}.png'],
+                    group='Step 3 차트'
+                ))
+            
+            for page in slide_cls.PAGES:
+                page_charts = slide_cls.PAGE_CHARTS[page]
+                html_path = output_dir / 'slides' / f'{member}_{page}.html'
+                graph.add(BuildNode(
+                    f'slide:{member}:{page}',
+                    StepTask(self.base_dir, *slide_step, 'generate_page', member, page),
+                    inputs=[analysis_path, data_dir / 'member_statistics.json',
+                            *[output_dir / 'charts' / f'{member}_{chart}.png' for chart in page_charts], *font_files],
+                    values={'template': templates[page]},
+                    outputs=[html_path],
+                    deps=[f'analysis:{member}', *[f'chart:{member}:{chart}' for chart in page_charts]],
+                    group='Step 4 슬라이드'
+                ))
+                graph.add(BuildNode(
+                    f'png:{member}:{page}',
+                    StepTask(self.base_dir, *png_step, 'convert_page', member, page, required=True),
+                    inputs=[html_path, self.scripts_dir / png_step[0]],
+                    outputs=[output_dir / 'images' / f'{member}_{page}.png'],
+                    deps=[f'slide:{member}:{page}'],
+                    group='Step 5 PNG',
+                    resource='browser'
+                ))
+        
+        return graph
+    
+    def run_dag(self, force=False, jobs=1, browsers=DEFAULT_BROWSER_SLOTS):
+        """
+        빌드 그래프 실행 (입력이 바뀐 노드만 다시 실행하고 이유 보고)
+        
+        Args:
+            jobs: 동시 실행 프로세스 수 (1이면 현재 프로세스에서 순서대로 실행)
+            browsers: 동시에 실행할 PNG 변환 노드 수
+        """
+        os.chdir(self.base_dir)
+        
+        graph = self.build_graph()
+        print("=" * 80)
+        print(f"증분 빌드: 노드 {len(graph.nodes)}개" + (" (강제 실행)" if force else "")
+              + (f", 프로세스 {jobs}개 (브라우저 {browsers}개)" if jobs > 1 else ""))
+        print("=" * 80)
+        
+        start = time.perf_counter()
+        try:
+            report = graph.run(force=force, workers=jobs, limits={'browser': browsers})
+        finally:
+            # 직렬 실행에서 캐시한 단계 정리 (병렬 워커는 프로세스 종료 시 Finalize로 정리)
+            close_steps()
+        print_build_report(report, graph.nodes)
+        print(f"\n소요 시간: {time.perf_counter() - start:.1f}초")
+        
+        return not report.failed and not report.blocked
+
+def _int_option(args, name, default):
+    """'--name N' 형식 정수 옵션 (없으면 기본값)"""
+    if name in args and args.index(name) + 1 < len(args):
+        return int(args[args.index(name) + 1])
+    return default
 
 def main():
-    runner = PipelineRunner()
-    
-    # 전체 파이프라인 실행
-    success = runner.run_all()
+    args = sys.argv[1:]
+    runner = PipelineRunner(in_process='--subprocess' not in args)
+
+    # 전체 파이프라인 실행 (--dag: 바뀐 노드만)
+    if '--dag' in args:
+        success = runner.run_dag(
+            force='--force' in args,
+            jobs=_int_option(args, '--jobs', os.cpu_count() or 1),
+            browsers=_int_option(args, '--browsers', DEFAULT_BROWSER_SLOTS)
+        )
+    else:
+        success = runner.run_all()
     
     if success:
         print("✓ 모든 작업 완료!")
@@ -5,13 +5,29 @@ Step 1: 데이터 전처리 및 기본 통계 추출
 1. 티어 이력 추적 시스템 구현 (경기 시점 기준)
 2. 팀 전체 통계 추출
 3. 14명 멤버별 기본 통계 추출
+
+증분 실행 (--incremental):
+- 이전 실행의 행 해시/날짜 워터마크(output/data/ingest_state.npz)와 비교
+- 추가/변경된 경기의 멤버·상대만 티어 이력과 멤버 통계를 다시 계산
+- 팀 통계는 추가분만 더함 (기존 행이 수정/삭제된 경우는 전체 재계산)
 """
 
-import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches, workbook_version
+from ku_common.schema import TIER_ORDER, to_match_table, memory_report, print_memory_report
+from ku_common.aggregate import MemberAggregates
+from ku_common.tiers import (
+    build_tier_changes, update_tier_changes, tier_history_dict, save_tier_changes,
+    load_tier_changes, TierTimeline, matchup_column, MATCHUP_TYPES
+)
+from ku_common.ingest import load_state, save_state, diff_table
+
 
 class DataPreprocessor:
     def __init__(self, excel_path):
@@ -20,56 +36,42 @@ class DataPreprocessor:
         print("Step 1: 데이터 전처리 및 기본 통계 추출")
         print("=" * 80)
         
-        self.df = pd.read_excel(excel_path)
+        self.excel_path = excel_path
+        raw_df = load_matches(excel_path)
+        self.df = to_match_table(raw_df)
+        self.tier_changes = None
         self.output_dir = Path('output/data')
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 티어 순서 정의
-        self.tier_order = {
-            '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5,
-            '6티어': 6, '7티어': 7, '8티어': 8, '베이비': 9
-        }
+        self.state_path = self.output_dir / 'ingest_state.npz'
         
         print(f"\n✓ Excel 데이터 로드 완료")
         print(f"  - 총 경기 수: {len(self.df):,}개")
         print(f"  - 기간: {self.df['날짜'].min().date()} ~ {self.df['날짜'].max().date()}")
         print(f"  - 멤버 수: {self.df['멤버 이름'].nunique()}명")
+        print_memory_report(memory_report(raw_df, self.df))
     
-    def build_tier_history(self):
+    def build_tier_history(self, diff=None):
         """
         티어 이력 추적 시스템 구축
         
         각 멤버의 티어 변동 이력을 날짜별로 추적
         경기 시점 기준 티어 비교를 위한 기반 데이터
+        
+        diff가 있으면 이전 변동 테이블에서 영향받은 멤버/상대 이력만 교체
         """
         print("\n[1/4] 티어 이력 추적 시스템 구축 중...")
         
-        tier_history = {}
-        
-        # 멤버별 처리
-        for member in self.df['멤버 이름'].unique():
-            member_df = self.df[self.df['멤버 이름'] == member].sort_values('날짜')
-            
-            # 티어 변동 추출
-            tier_changes = []
-            prev_tier = None
-            
-            for _, row in member_df.iterrows():
-                curr_tier = row['멤버 티어']
-                if curr_tier != prev_tier:
-                    tier_changes.append({
-                        'date': row['날짜'].strftime('%Y-%m-%d'),
-                        'tier': curr_tier,
-                        'tier_num': self.tier_order.get(curr_tier, 99)
-                    })
-                    prev_tier = curr_tier
-            
-            tier_history[member] = {
-                'changes': tier_changes,
-                'first_tier': tier_changes[0]['tier'] if tier_changes else None,
-                'last_tier': tier_changes[-1]['tier'] if tier_changes else None,
-                'tier_count': len(tier_changes)
-            }
+        if diff is None:
+            # 멤버/상대 티어 변동 지점을 한 번에 추출 (선수·날짜 정렬 후 직전 행과 비교)
+            self.tier_changes = build_tier_changes(self.df)
+        else:
+            previous = load_tier_changes(self.output_dir / 'tier_changes.csv')
+            self.tier_changes = update_tier_changes(previous, self.df, diff.members, diff.opponents)
+            print(f"  - 증분 갱신: 멤버 {len(diff.members)}명, 상대 {len(diff.opponents)}명 이력 재계산")
+        tier_history = tier_history_dict(
+            self.tier_changes, 'member', self.df['멤버 이름'].unique(),
+            TIER_ORDER, with_count=True
+        )
         
         # 저장
         output_path = self.output_dir / 'tier_history.json'
@@ -78,6 +80,11 @@ class DataPreprocessor:
         
         print(f"  ✓ 티어 이력 추출 완료: {output_path}")
         
+        # 컬럼형 이력 (선수 번호, 적용 시작일, 티어 코드)
+        changes_path = self.output_dir / 'tier_changes.csv'
+        save_tier_changes(self.tier_changes, changes_path)
+        print(f"  ✓ 티어 변동 테이블 저장: {changes_path} ({len(self.tier_changes):,}건)")
+        
         # 티어 변동 있는 멤버 출력
         print("\n  [티어 변동 멤버]")
         for member, history in tier_history.items():
@@ -87,113 +94,21 @@ class DataPreprocessor:
         
         return tier_history
     
-    def get_tier_at_date(self, member, date, tier_history):
-        """특정 날짜의 멤버 티어 반환"""
-        if member not in tier_history:
-            return None
-        
-        changes = tier_history[member]['changes']
-        date_str = date.strftime('%Y-%m-%d') if isinstance(date, pd.Timestamp) else date
+    def extract_team_statistics(self, diff=None):
+        """팀 전체 통계 추출
         
-        # 해당 날짜 이전 가장 최근 티어 찾기
-        current_tier = None
-        for change in changes:
-            if change['date'] <= date_str:
-                current_tier = change['tier']
-            else:
-                break
-        
-        return current_tier
-    
-    def classify_tier_matchup(self, member_tier, opponent_tier):
-        """티어 매치업 분류 (동일/상위/하위)"""
-        if not member_tier or not opponent_tier:
-            return 'unknown'
-        
-        member_num = self.tier_order.get(member_tier, 99)
-        opponent_num = self.tier_order.get(opponent_tier, 99)
-        
-        if member_num == opponent_num:
-            return 'same'
-        elif member_num > opponent_num:
-            return 'upper'  # 상대가 상위 티어
-        else:
-            return 'lower'  # 상대가 하위 티어
-    
-    def extract_team_statistics(self):
-        """팀 전체 통계 추출"""
+        diff가 추가(append)면 이전 통계에 추가 경기분만 더함
+        """
         print("\n[2/4] 팀 전체 통계 추출 중...")
         
-        stats = {}
-        
-        # 1. 전체 통계
-        total_games = len(self.df)
-        wins = len(self.df[self.df['결과'] == '승'])
-        losses = total_games - wins
-        
-        stats['overall'] = {
-            'total_games': total_games,
-            'wins': wins,
-            'losses': losses,
-            'win_rate': round(wins / total_games * 100, 2) if total_games > 0 else 0
-        }
-        
-        # 2. 구분별 통계 (스폰, 대회)
-        stats['by_type'] = {}
-        
-        # 스폰: '스폰'이 포함된 구분
-        spon_df = self.df[self.df['구분'].str.contains('스폰', na=False)]
-        spon_games = len(spon_df)
-        spon_wins = len(spon_df[spon_df['결과'] == '승'])
-        
-        stats['by_type']['스폰'] = {
-            'total_games': spon_games,
-            'wins': spon_wins,
-            'losses': spon_games - spon_wins,
-            'win_rate': round(spon_wins / spon_games * 100, 2) if spon_games > 0 else 0
-        }
-        
-        # 대회: '스폰'이 포함되지 않은 구분
-        tournament_df = self.df[~self.df['구분'].str.contains('스폰', na=False)]
-        tournament_games = len(tournament_df)
-        tournament_wins = len(tournament_df[tournament_df['결과'] == '승'])
-        
-        stats['by_type']['대회'] = {
-            'total_games': tournament_games,
-            'wins': tournament_wins,
-            'losses': tournament_games - tournament_wins,
-            'win_rate': round(tournament_wins / tournament_games * 100, 2) if tournament_games > 0 else 0
-        }
-        
-        # 3. 월별 통계
-        self.df['month'] = self.df['날짜'].dt.to_period('M')
-        stats['by_month'] = {}
-        
-        for month in sorted(self.df['month'].unique()):
-            month_df = self.df[self.df['month'] == month]
-            month_games = len(month_df)
-            month_wins = len(month_df[month_df['결과'] == '승'])
-            
-            stats['by_month'][str(month)] = {
-                'total_games': month_games,
-                'wins': month_wins,
-                'losses': month_games - month_wins,
-                'win_rate': round(month_wins / month_games * 100, 2) if month_games > 0 else 0
-            }
-        
-        # 4. 종족별 통계 (아군 종족)
-        stats['by_race'] = {}
-        for race in ['테란', '저그', '프로토스']:
-            race_df = self.df[self.df['멤버 종족'] == race]
-            race_games = len(race_df)
-            race_wins = len(race_df[race_df['결과'] == '승'])
-            
-            stats['by_race'][race] = {
-                'total_games': race_games,
-                'wins': race_wins,
-                'losses': race_games - race_wins,
-                'win_rate': round(race_wins / race_games * 100, 2) if race_games > 0 else 0
-            }
+        if diff is not None and diff.mode == 'append':
+            with open(self.output_dir / 'team_statistics.json', 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            added = self._team_statistics(self.df.iloc[diff.new_rows])
+            stats = self._merge_team_statistics(previous, added)
+            print(f"  - 증분 갱신: 추가 경기 {len(diff.new_rows)}개 반영")
+        else:
+            stats = self._team_statistics(self.df)
         
         # 저장
         output_path = self.output_dir / 'team_statistics.json'
@@ -211,7 +126,57 @@ class DataPreprocessor:
         
         return stats
     
-    def extract_member_statistics(self, tier_history):
+    def _team_statistics(self, df):
+        """경기 테이블 → 팀 통계 (전체/구분별/월별/종족별)"""
+        stats = {}
+        
+        # 1. 전체 통계
+        stats['overall'] = self._counts(len(df), int(df['win'].sum()))
+        
+        # 2. 구분별 통계 (스폰: '스폰'이 포함된 구분, 대회: 그 외)
+        is_spon = df['구분'].str.contains('스폰', na=False)
+        stats['by_type'] = {
+            '스폰': self._counts(int(is_spon.sum()), int(df['win'][is_spon].sum())),
+            '대회': self._counts(int((~is_spon).sum()), int(df['win'][~is_spon].sum()))
+        }
+        
+        # 3. 월별 통계
+        months = df['날짜'].dt.to_period('M')
+        by_month = df['win'].groupby(months, sort=True).agg(['size', 'sum'])
+        stats['by_month'] = {
+            str(month): self._counts(int(row['size']), int(row['sum']))
+            for month, row in by_month.iterrows()
+        }
+        
+        # 4. 종족별 통계 (아군 종족)
+        stats['by_race'] = {}
+        for race in ['테란', '저그', '프로토스']:
+            is_race = df['멤버 종족'] == race
+            stats['by_race'][race] = self._counts(int(is_race.sum()), int(df['win'][is_race].sum()))
+        
+        return stats
+    
+    @classmethod
+    def _merge_team_statistics(cls, previous, added):
+        """이전 팀 통계 + 추가 경기 팀 통계 (월은 합친 뒤 다시 정렬)"""
+        def merge(a, b):
+            a = a or cls._counts(0, 0)
+            b = b or cls._counts(0, 0)
+            return cls._counts(a['total_games'] + b['total_games'], a['wins'] + b['wins'])
+        
+        stats = {'overall': merge(previous['overall'], added['overall'])}
+        for section in ['by_type', 'by_month', 'by_race']:
+            keys = list(previous[section])
+            if section == 'by_month':
+                keys = sorted(set(keys) | set(added[section]))
+            stats[section] = {
+                key: merge(previous[section].get(key), added[section].get(key))
+                for key in keys
+            }
+        
+        return stats
+    
+    def extract_member_statistics(self, tier_history, members=None):
         """
         14명 멤버별 기본 통계 추출
         
@@ -222,135 +187,92 @@ class DataPreprocessor:
         4. 맵별 성과
         5. 티어별 성과 (경기 시점 기준)
         6. 상대별 성과
+        
+        members가 있으면 해당 멤버만 다시 계산하고 나머지는 이전 결과 유지
         """
         print("\n[3/4] 14명 멤버별 기본 통계 추출 중...")
         
         all_members_stats = {}
-        
-        # 상대 티어 이력도 구축 (경기 시점 티어 비교용)
-        print("  - 상대방 티어 이력 구축 중...")
-        opponent_tier_history = self._build_opponent_tier_history()
-        
-        for idx, member in enumerate(sorted(self.df['멤버 이름'].unique()), 1):
+        df = self.df
+        
+        if members is not None:
+            with open(self.output_dir / 'member_statistics.json', 'r', encoding='utf-8') as f:
+                all_members_stats = json.load(f)
+            df = self.df[self.df['멤버 이름'].isin(members)].reset_index(drop=True)
+            print(f"  - 증분 갱신: {df['멤버 이름'].nunique()}명 재계산 ({len(df):,}경기)")
+        
+        # 경기 시점 티어 매치업 분류 (대상 경기 한 번에)
+        print("  - 경기 시점 티어 매치업 분류 중...")
+        df['matchup'] = self._classify_tier_matchups(df)
+        
+        # 멤버 × 차원별 승/패 집계 (차원마다 groupby 한 번)
+        is_spon = df['구분'].str.contains('스폰', na=False).to_numpy()
+        agg = MemberAggregates(df, {
+            'race': '멤버 종족',
+            'type': np.where(is_spon, '스폰', '대회'),
+            'month': df['날짜'].dt.to_period('M'),
+            'opponent_race': '상대 종족',
+            'map': '맵',
+            'matchup': 'matchup',
+            'opponent': '상대',
+        })
+        
+        for idx, member in enumerate(sorted(df['멤버 이름'].unique()), 1):
             print(f"\n  [{idx}/14] {member} 분석 중...")
             
-            member_df = self.df[self.df['멤버 이름'] == member]
             member_stats = {}
             
             # 1. 기본 정보
             member_stats['basic_info'] = {
                 'name': member,
-                'race': member_df['멤버 종족'].mode()[0],
+                'race': agg.ranked(member, 'race')[0].value,
                 'first_tier': tier_history[member]['first_tier'],
                 'last_tier': tier_history[member]['last_tier'],
                 'tier_changes': tier_history[member]['tier_count']
             }
             
             # 2. 전체 성과
-            total_games = len(member_df)
-            wins = len(member_df[member_df['결과'] == '승'])
-            
-            member_stats['overall'] = {
-                'total_games': total_games,
-                'wins': wins,
-                'losses': total_games - wins,
-                'win_rate': round(wins / total_games * 100, 2) if total_games > 0 else 0
-            }
-            
-            # 3. 구분별 성과
-            member_stats['by_type'] = {}
-            
-            # 스폰
-            spon_df = member_df[member_df['구분'].str.contains('스폰', na=False)]
-            spon_games = len(spon_df)
-            spon_wins = len(spon_df[spon_df['결과'] == '승'])
-            
-            member_stats['by_type']['스폰'] = {
-                'total_games': spon_games,
-                'wins': spon_wins,
-                'losses': spon_games - spon_wins,
-                'win_rate': round(spon_wins / spon_games * 100, 2) if spon_games > 0 else 0
-            }
-            
-            # 대회
-            tournament_df = member_df[~member_df['구분'].str.contains('스폰', na=False)]
-            tournament_games = len(tournament_df)
-            tournament_wins = len(tournament_df[tournament_df['결과'] == '승'])
-            
-            member_stats['by_type']['대회'] = {
-                'total_games': tournament_games,
-                'wins': tournament_wins,
-                'losses': tournament_games - tournament_wins,
-                'win_rate': round(tournament_wins / tournament_games * 100, 2) if tournament_games > 0 else 0
+            overall = agg.total(member)
+            total_games = overall.games
+            member_stats['overall'] = self._win_loss(overall)
+            
+            # 3. 구분별 성과 (스폰: '스폰'이 포함된 구분, 대회: 그 외)
+            by_type = agg.counts(member, 'type')
+            member_stats['by_type'] = {
+                type_name: self._win_loss(by_type.get(type_name))
+                for type_name in ['스폰', '대회']
             }
             
             # 4. 월별 성과
-            member_stats['by_month'] = {}
-            member_df_copy = member_df.copy()
-            member_df_copy['month'] = member_df_copy['날짜'].dt.to_period('M')
-            
-            for month in sorted(member_df_copy['month'].unique()):
-                month_df = member_df_copy[member_df_copy['month'] == month]
-                month_games = len(month_df)
-                month_wins = len(month_df[month_df['결과'] == '승'])
-                
-                member_stats['by_month'][str(month)] = {
-                    'total_games': month_games,
-                    'wins': month_wins,
-                    'losses': month_games - month_wins,
-                    'win_rate': round(month_wins / month_games * 100, 2) if month_games > 0 else 0
-                }
+            by_month = agg.counts(member, 'month')
+            member_stats['by_month'] = {
+                str(month): self._win_loss(by_month[month])
+                for month in sorted(by_month)
+            }
             
             # 5. 상대 종족별 성과
-            member_stats['by_opponent_race'] = {}
-            for race in ['테란', '저그', '프로토스']:
-                race_df = member_df[member_df['상대 종족'] == race]
-                race_games = len(race_df)
-                race_wins = len(race_df[race_df['결과'] == '승'])
-                
-                member_stats['by_opponent_race'][race] = {
-                    'total_games': race_games,
-                    'wins': race_wins,
-                    'losses': race_games - race_wins,
-                    'win_rate': round(race_wins / race_games * 100, 2) if race_games > 0 else 0
-                }
+            by_race = agg.counts(member, 'opponent_race')
+            member_stats['by_opponent_race'] = {
+                race: self._win_loss(by_race.get(race))
+                for race in ['테란', '저그', '프로토스']
+            }
             
             # 6. 맵별 성과 (경기수 20+ 맵만)
-            member_stats['by_map'] = {}
-            map_counts = member_df['맵'].value_counts()
-            
-            for map_name in map_counts[map_counts >= 20].index:
-                map_df = member_df[member_df['맵'] == map_name]
-                map_games = len(map_df)
-                map_wins = len(map_df[map_df['결과'] == '승'])
-                
-                member_stats['by_map'][map_name] = {
-                    'total_games': map_games,
-                    'wins': map_wins,
-                    'losses': map_games - map_wins,
-                    'win_rate': round(map_wins / map_games * 100, 2) if map_games > 0 else 0
-                }
+            member_stats['by_map'] = {
+                entry.value: self._win_loss(entry)
+                for entry in agg.ranked(member, 'map', min_games=20)
+            }
             
             # 7. 티어별 성과 (경기 시점 기준 - 중요!)
             member_stats['by_tier_matchup'] = self._analyze_tier_matchup(
-                member, member_df, tier_history, opponent_tier_history
+                agg.counts(member, 'matchup')
             )
             
             # 8. 상대별 성과 (경기수 15+ 상대만)
-            member_stats['by_opponent'] = {}
-            opponent_counts = member_df['상대'].value_counts()
-            
-            for opponent in opponent_counts[opponent_counts >= 15].index:
-                opp_df = member_df[member_df['상대'] == opponent]
-                opp_games = len(opp_df)
-                opp_wins = len(opp_df[opp_df['결과'] == '승'])
-                
-                member_stats['by_opponent'][opponent] = {
-                    'total_games': opp_games,
-                    'wins': opp_wins,
-                    'losses': opp_games - opp_wins,
-                    'win_rate': round(opp_wins / opp_games * 100, 2) if opp_games > 0 else 0
-                }
+            member_stats['by_opponent'] = {
+                entry.value: self._win_loss(entry)
+                for entry in agg.ranked(member, 'opponent', min_games=15)
+            }
             
             all_members_stats[member] = member_stats
             
@@ -359,6 +281,13 @@ class DataPreprocessor:
             print(f"      ✓ 맵별: {len(member_stats['by_map'])}개 (20경기 이상)")
             print(f"      ✓ 상대별: {len(member_stats['by_opponent'])}개 (15경기 이상)")
         
+        # 현재 워크북에 있는 멤버만 이름순으로 유지 (전체 계산과 같은 순서)
+        current = set(self.df['멤버 이름'].unique())
+        all_members_stats = {
+            member: all_members_stats[member]
+            for member in sorted(all_members_stats) if member in current
+        }
+        
         # 저장
         output_path = self.output_dir / 'member_statistics.json'
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -368,36 +297,23 @@ class DataPreprocessor:
         
         return all_members_stats
     
-    def _build_opponent_tier_history(self):
-        """상대방 티어 이력 구축"""
-        opponent_tier_history = {}
+    def _classify_tier_matchups(self, table):
+        """
+        경기 테이블의 티어 매치업 분류 (경기 시점 기준)
         
-        # 상대 이름별로 티어 변동 추적
-        for opponent in self.df['상대'].unique():
-            opp_df = self.df[self.df['상대'] == opponent].sort_values('날짜')
-            
-            tier_changes = []
-            prev_tier = None
-            
-            for _, row in opp_df.iterrows():
-                curr_tier = row['상대 티어']
-                if curr_tier != prev_tier:
-                    tier_changes.append({
-                        'date': row['날짜'].strftime('%Y-%m-%d'),
-                        'tier': curr_tier,
-                        'tier_num': self.tier_order.get(curr_tier, 99)
-                    })
-                    prev_tier = curr_tier
-            
-            opponent_tier_history[opponent] = {
-                'changes': tier_changes,
-                'first_tier': tier_changes[0]['tier'] if tier_changes else None,
-                'last_tier': tier_changes[-1]['tier'] if tier_changes else None
-            }
+        멤버/상대 티어를 경기 날짜 기준으로 일괄 조회한 뒤
+        티어 코드 룩업 테이블로 same/upper/lower/unknown 결정
+        - upper: 상대가 상위 티어, lower: 상대가 하위 티어
+        """
+        if self.tier_changes is None:
+            self.tier_changes = build_tier_changes(self.df)
+        
+        member_tiers = TierTimeline(self.tier_changes, 'member')
+        opponent_tiers = TierTimeline(self.tier_changes, 'opponent')
         
-        return opponent_tier_history
+        return matchup_column(table, member_tiers, opponent_tiers)
     
-    def _analyze_tier_matchup(self, member, member_df, tier_history, opponent_tier_history):
+    def _analyze_tier_matchup(self, matchup_counts):
         """
         티어별 매치업 분석 (경기 시점 기준)
         
@@ -405,40 +321,27 @@ class DataPreprocessor:
         - 11월 3일 경기: 양측 모두 11월 3일 시점 티어
         - 상대가 2주 후 승급해도, 11월 3일엔 동일 티어로 간주
         """
-        tier_matchup_stats = {
-            'same': {'total_games': 0, 'wins': 0, 'losses': 0, 'win_rate': 0},
-            'upper': {'total_games': 0, 'wins': 0, 'losses': 0, 'win_rate': 0},
-            'lower': {'total_games': 0, 'wins': 0, 'losses': 0, 'win_rate': 0},
-            'unknown': {'total_games': 0, 'wins': 0, 'losses': 0, 'win_rate': 0}
+        return {
+            matchup_type: self._win_loss(matchup_counts.get(matchup_type))
+            for matchup_type in MATCHUP_TYPES
+        }
+    
+    @classmethod
+    def _win_loss(cls, entry):
+        """집계 결과(WinLoss) → 경기수/승/패/승률 딕셔너리 (없으면 0경기)"""
+        if not entry:
+            return cls._counts(0, 0)
+        return cls._counts(entry.games, entry.wins)
+    
+    @staticmethod
+    def _counts(games, wins):
+        """경기수/승수 → 경기수/승/패/승률 딕셔너리"""
+        return {
+            'total_games': games,
+            'wins': wins,
+            'losses': games - wins,
+            'win_rate': round(wins / games * 100, 2) if games > 0 else 0
         }
-        
-        for _, row in member_df.iterrows():
-            game_date = row['날짜']
-            opponent = row['상대']
-            result = row['결과']
-            
-            # 경기 시점 양측 티어 확인
-            member_tier = self.get_tier_at_date(member, game_date, tier_history)
-            opponent_tier = self.get_tier_at_date(opponent, game_date, opponent_tier_history)
-            
-            # 매치업 분류
-            matchup_type = self.classify_tier_matchup(member_tier, opponent_tier)
-            
-            # 통계 업데이트
-            tier_matchup_stats[matchup_type]['total_games'] += 1
-            if result == '승':
-                tier_matchup_stats[matchup_type]['wins'] += 1
-            else:
-                tier_matchup_stats[matchup_type]['losses'] += 1
-        
-        # 승률 계산
-        for matchup_type in tier_matchup_stats:
-            games = tier_matchup_stats[matchup_type]['total_games']
-            wins = tier_matchup_stats[matchup_type]['wins']
-            if games > 0:
-                tier_matchup_stats[matchup_type]['win_rate'] = round(wins / games * 100, 2)
-        
-        return tier_matchup_stats
     
     def generate_summary(self, tier_history, team_stats, member_stats):
         """전체 요약 보고서 생성"""
@@ -479,21 +382,79 @@ class DataPreprocessor:
         
         return summary
     
-    def run(self):
-        """전체 전처리 프로세스 실행"""
+    def detect_changes(self):
+        """
+        이전 실행 이후 추가/변경된 경기 확인 (증분 실행용)
+        
+        Returns:
+            IngestDiff (이전 결과 파일이 하나라도 없으면 mode='full')
+        """
+        print("\n[0/4] 이전 수집 상태와 비교 중...")
+        
+        outputs = ['tier_history.json', 'team_statistics.json', 'member_statistics.json',
+                   'preprocessing_summary.json', 'tier_changes.csv']
+        state = None
+        if all((self.output_dir / name).exists() for name in outputs):
+            state = load_state(self.state_path)
+        
+        diff = diff_table(self.df, state, workbook_version(self.excel_path))
+        
+        if diff.mode == 'full':
+            print("  - 이전 수집 상태 없음 → 전체 재계산")
+        elif diff.mode == 'none':
+            print(f"  ✓ 변경 없음 (워터마크 {state['meta']['watermark']}, {state['meta']['rows']:,}경기)")
+        else:
+            label = '추가' if diff.mode == 'append' else '추가/변경'
+            print(f"  ✓ {label} 경기 {len(diff.new_rows):,}개 (워터마크 {state['meta']['watermark']} 이후)")
+            print(f"  - 재계산 대상: 멤버 {len(diff.members)}명, 상대 {len(diff.opponents)}명")
+        
+        return diff
+    
+    def save_ingest_state(self):
+        """현재 워크북을 처리 완료 상태로 저장 (다음 증분 실행의 기준)"""
+        meta = save_state(self.state_path, self.df, workbook_version(self.excel_path))
+        print(f"  ✓ 수집 상태 저장: {self.state_path} ({meta['rows']:,}경기, 워터마크 {meta['watermark']})")
+    
+    def _load_outputs(self):
+        """이전 실행 결과 JSON 로드 (변경이 없을 때 그대로 반환)"""
+        result = {}
+        for key, name in [('tier_history', 'tier_history.json'), ('team_stats', 'team_statistics.json'),
+                          ('member_stats', 'member_statistics.json'), ('summary', 'preprocessing_summary.json')]:
+            with open(self.output_dir / name, 'r', encoding='utf-8') as f:
+                result[key] = json.load(f)
+        return result
+    
+    def run(self, incremental=False):
+        """
+        전체 전처리 프로세스 실행
+        
+        Args:
+            incremental: True면 이전 실행 이후 추가/변경된 경기의 멤버·상대만 다시 계산
+        """
         try:
+            diff = self.detect_changes() if incremental else None
+            if diff is not None and diff.mode == 'none':
+                print("\n✓ Step 1 건너뜀: 워크북 변경 없음 (기존 결과 사용)")
+                return self._load_outputs()
+            if diff is not None and diff.mode == 'full':
+                diff = None
+            
             # 1. 티어 이력 추적
-            tier_history = self.build_tier_history()
+            tier_history = self.build_tier_history(diff)
             
             # 2. 팀 전체 통계
-            team_stats = self.extract_team_statistics()
+            team_stats = self.extract_team_statistics(diff)
             
             # 3. 멤버별 통계
-            member_stats = self.extract_member_statistics(tier_history)
+            member_stats = self.extract_member_statistics(
+                tier_history, members=diff.members if diff is not None else None
+            )
             
             # 4. 요약 보고서
             summary = self.generate_summary(tier_history, team_stats, member_stats)
             
+            self.save_ingest_state()
+            
             print("\n" + "=" * 80)
             print("Step 1 완료: 데이터 전처리 및 기본 통계 추출 성공")
             print("=" * 80)
@@ -518,9 +479,9 @@ class DataPreprocessor:
 
 
 if __name__ == '__main__':
-    # 실행
+    # 실행 (--incremental: 추가/변경된 경기만 반영)
     preprocessor = DataPreprocessor('kuniv_2025_data.xlsx')
-    result = preprocessor.run()
+    result = preprocessor.run(incremental='--incremental' in sys.argv[1:])
     
     if result:
         print("\n✓ Step 1 전처리 완료. Step 2 (패턴 발굴) 준비 완료.")
@@ -10,30 +10,43 @@ Step 2: 패턴 발굴 및 개인별 특성 식별
 4. 개인화된 페이지 구성 결정
 """
 
-import pandas as pd
 import json
 from pathlib import Path
-from collections import defaultdict
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.context import PipelineContext
+from ku_common.schema import TIER_ORDER
+from ku_common.tiers import build_tier_changes, TierTimeline, matchup_column
+
 
 class PatternDiscovery:
-    def __init__(self):
-        """패턴 발굴 초기화"""
+    def __init__(self, context=None):
+        """
+        패턴 발굴 초기화
+        
+        Args:
+            context: PipelineContext (한 프로세스에서 여러 단계를 실행할 때 공유, 없으면 새로 로드)
+        """
         print("=" * 80)
         print("Step 2: 패턴 발굴 및 개인별 특성 식별 (전체 멤버)")
         print("=" * 80)
         
-        # 데이터 로드
-        self.df = pd.read_excel('kuniv_2025_data.xlsx')
+        # 데이터 로드 (매치업 컬럼을 추가하므로 공유 테이블은 복사해서 사용)
+        self.context = context or PipelineContext()
+        self.df = self.context.table.copy()
+        self.cube = self.context.cube
+        
+        self.tier_history = self.context.tier_history
+        self.team_stats = self.context.team_stats
+        self.member_stats = self.context.member_stats
         
-        self.data_dir = Path('output/data')
-        with open(self.data_dir / 'tier_history.json', encoding='utf-8') as f:
-            self.tier_history = json.load(f)
-        with open(self.data_dir / 'team_statistics.json', encoding='utf-8') as f:
-            self.team_stats = json.load(f)
-        with open(self.data_dir / 'member_statistics.json', encoding='utf-8') as f:
-            self.member_stats = json.load(f)
+        # 경기 시점 티어 매치업 컬럼 (멤버: tier_history.json, 상대: 경기 기록 기준 / 티어 순서는 schema.TIER_ORDER)
+        member_tiers = TierTimeline.from_history(self.tier_history)
+        opponent_tiers = TierTimeline(build_tier_changes(self.df), 'opponent')
+        self.df['matchup'] = matchup_column(self.df, member_tiers, opponent_tiers)
         
-        self.output_dir = Path('output/analysis')
+        self.output_dir = self.context.analysis_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         print(f"\n✓ 데이터 로드 완료")
@@ -340,32 +353,17 @@ class PatternDiscovery:
                 weak_race = weakness['details']['weak_race']
                 print(f"  → {weak_race}전 약점 원인 분석 중...")
                 
-                # 해당 종족전만 필터
-                race_df = member_df[member_df['상대 종족'] == weak_race]
-                
-                # 맵별 분석
+                # 해당 종족전 맵별 분석 (상위 5개 맵)
                 race_map_stats = {}
-                for map_name in race_df['맵'].value_counts().index[:5]:  # 상위 5개 맵
-                    map_df = race_df[race_df['맵'] == map_name]
-                    if len(map_df) >= 10:
-                        wins = len(map_df[map_df['결과'] == '승'])
-                        race_map_stats[map_name] = {
-                            'games': len(map_df),
-                            'wins': wins,
-                            'win_rate': round(wins / len(map_df) * 100, 2)
-                        }
+                for entry in self.cube.breakdown('map', member=member_name, opp_race=weak_race)[:5]:
+                    if entry.games >= 10:
+                        race_map_stats[entry.value] = self._games_wins(entry)
                 
                 # 상대별 분석
                 race_opp_stats = {}
-                for opponent in race_df['상대'].value_counts().index[:5]:
-                    opp_df = race_df[race_df['상대'] == opponent]
-                    if len(opp_df) >= 10:
-                        wins = len(opp_df[opp_df['결과'] == '승'])
-                        race_opp_stats[opponent] = {
-                            'games': len(opp_df),
-                            'wins': wins,
-                            'win_rate': round(wins / len(opp_df) * 100, 2)
-                        }
+                for entry in self.cube.breakdown('opponent', member=member_name, opp_race=weak_race)[:5]:
+                    if entry.games >= 10:
+                        race_opp_stats[entry.value] = self._games_wins(entry)
                 
                 deep_analysis[f'{weak_race}전_약점'] = {
                     'reason': f'{weak_race}전 약점 원인 규명',
@@ -387,32 +385,18 @@ class PatternDiscovery:
                 weak_map = weakness['details']['map']
                 print(f"  → {weak_map} 맵 약점 원인 분석 중...")
                 
-                # 해당 맵만 필터
-                map_df = member_df[member_df['맵'] == weak_map]
-                
-                # 종족별 분석
+                # 해당 맵 종족별 분석
                 map_race_stats = {}
                 for race in ['테란', '저그', '프로토스']:
-                    race_df = map_df[map_df['상대 종족'] == race]
-                    if len(race_df) >= 5:
-                        wins = len(race_df[race_df['결과'] == '승'])
-                        map_race_stats[race] = {
-                            'games': len(race_df),
-                            'wins': wins,
-                            'win_rate': round(wins / len(race_df) * 100, 2)
-                        }
+                    entry = self.cube.stats(member=member_name, map=weak_map, opp_race=race)
+                    if entry.games >= 5:
+                        map_race_stats[race] = self._games_wins(entry)
                 
                 # 상대별 분석
                 map_opp_stats = {}
-                for opponent in map_df['상대'].value_counts().index[:5]:
-                    opp_df = map_df[map_df['상대'] == opponent]
-                    if len(opp_df) >= 5:
-                        wins = len(opp_df[opp_df['결과'] == '승'])
-                        map_opp_stats[opponent] = {
-                            'games': len(opp_df),
-                            'wins': wins,
-                            'win_rate': round(wins / len(opp_df) * 100, 2)
-                        }
+                for entry in self.cube.breakdown('opponent', member=member_name, map=weak_map)[:5]:
+                    if entry.games >= 5:
+                        map_opp_stats[entry.value] = self._games_wins(entry)
                 
                 deep_analysis[f'{weak_map}_약점'] = {
                     'reason': f'{weak_map} 맵 약점 원인 규명',
@@ -431,6 +415,15 @@ class PatternDiscovery:
         
         analysis['deep_analysis'] = deep_analysis
     
+    @staticmethod
+    def _games_wins(entry):
+        """큐브 집계 결과 → 경기수/승수/승률 딕셔너리"""
+        return {
+            'games': entry.games,
+            'wins': entry.wins,
+            'win_rate': round(entry.wins / entry.games * 100, 2)
+        }
+    
     def _extract_stories(self, member_name, member_df, stats, analysis):
         """개인 스토리 추출"""
         
@@ -442,8 +435,7 @@ class PatternDiscovery:
             first_tier = self.tier_history[member_name]['first_tier']
             last_tier = self.tier_history[member_name]['last_tier']
             
-            tier_order = {'베이비': 9, '8티어': 8, '7티어': 7, '6티어': 6, '5티어': 5, '4티어': 4, '3티어': 3, '2티어': 2}
-            growth = tier_order[first_tier] - tier_order[last_tier]
+            growth = TIER_ORDER[first_tier] - TIER_ORDER[last_tier]
             
             if growth >= 2:
                 stories.append({
@@ -969,28 +961,15 @@ class PatternDiscovery:
             
             # 동일 티어 내 종족별 약점 분석 (레퍼런스 스타일)
             # 동일 티어 경기만 필터
-            tier_history = self.tier_history
-            same_tier_games = []
-            
-            for _, row in member_df.iterrows():
-                game_date = row['날짜']
-                opponent = row['상대']
-                
-                member_tier = self._get_tier_at_date(member_name, game_date, tier_history)
-                opponent_tier = self._get_tier_at_date_opponent(opponent, game_date)
-                
-                if member_tier == opponent_tier:
-                    same_tier_games.append(row)
+            same_tier_df = member_df[member_df['matchup'] == 'same']
             
-            if same_tier_games:
-                same_tier_df = pd.DataFrame(same_tier_games)
-                
+            if len(same_tier_df) > 0:
                 # 동일 티어 내 종족별 승률
                 race_wrs = {}
                 for race in ['테란', '저그', '프로토스']:
                     race_games = same_tier_df[same_tier_df['상대 종족'] == race]
                     if len(race_games) >= 15:
-                        wins = len(race_games[race_games['결과'] == '승'])
+                        wins = int(race_games['win'].sum())
                         race_wrs[race] = {
                             'win_rate': round(wins / len(race_games) * 100, 2),
                             'games': len(race_games)
@@ -1023,46 +1002,38 @@ class PatternDiscovery:
         
         return '. '.join(comment_parts) + '.' if comment_parts else "티어별 성과는 전반적으로 양호합니다."
     
-    def _get_tier_at_date(self, member, date, tier_history):
-        """특정 날짜의 멤버 티어 반환"""
-        if member not in tier_history:
-            return None
-        
-        changes = tier_history[member]['changes']
-        date_str = date.strftime('%Y-%m-%d') if isinstance(date, pd.Timestamp) else date
-        
-        current_tier = None
-        for change in changes:
-            if change['date'] <= date_str:
-                current_tier = change['tier']
-            else:
-                break
-        
-        return current_tier
-    
-    def _get_tier_at_date_opponent(self, opponent, date):
-        """특정 날짜의 상대 티어 반환"""
-        # 상대 티어 이력에서 찾기
-        opp_df = self.df[self.df['상대'] == opponent].sort_values('날짜')
-        if len(opp_df) == 0:
-            return None
-        
-        date_str = date.strftime('%Y-%m-%d') if isinstance(date, pd.Timestamp) else date
-        
-        # 해당 날짜 이전 가장 최근 경기의 상대 티어
-        before_games = opp_df[opp_df['날짜'] <= date]
-        if len(before_games) > 0:
-            return before_games.iloc[-1]['상대 티어']
+    def run_member(self, member):
+        """멤버 한 명 분석 + 코멘트 생성 후 저장"""
+        # 분석
+        analysis = self.analyze_member_prototype(member)
+        
+        # 코멘트 생성
+        comments = self.generate_comments(member, analysis)
+        
+        # 저장
+        output_path = self.output_dir / f'{member}_analysis.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(analysis, f, ensure_ascii=False, indent=2)
+        self.context.set_analysis(member, analysis)
+        
+        print(f"\n✓ {member} 분석 완료")
+        print(f"  - 저장 위치: {output_path}")
+        print(f"  - 강점: {len(analysis['strengths'])}개")
+        print(f"  - 약점: {len(analysis['weaknesses'])}개")
+        print(f"  - 스토리: {len(analysis['stories'])}개")
+        print(f"  - 심층 분석: {len(analysis['deep_analysis'])}개")
+        
+        # 코멘트 출력
+        print(f"\n[생성된 코멘트]")
+        for page, comment in comments.items():
+            print(f"  {page}: {comment[:80]}..." if len(comment) > 80 else f"  {page}: {comment}")
         
-        return None
+        return analysis
     
     def run_all(self):
         """전체 멤버 실행"""
-        # member_statistics.json에서 멤버 목록 로드
-        with open(self.data_dir / 'member_statistics.json', encoding='utf-8') as f:
-            member_stats = json.load(f)
-        
-        target_members = list(member_stats.keys())
+        # member_statistics.json 멤버 목록
+        target_members = self.context.members
         results = {}
         
         print(f"\n총 {len(target_members)}명 멤버 분석 시작...")
@@ -1073,30 +1044,7 @@ class PatternDiscovery:
             print(f"[{i}/{len(target_members)}] {member} 분석 중...")
             print(f"{'=' * 80}")
             
-            # 분석
-            analysis = self.analyze_member_prototype(member)
-            
-            # 코멘트 생성
-            comments = self.generate_comments(member, analysis)
-            
-            # 저장
-            output_path = self.output_dir / f'{member}_analysis.json'
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, ensure_ascii=False, indent=2)
-            
-            print(f"\n✓ {member} 분석 완료")
-            print(f"  - 저장 위치: {output_path}")
-            print(f"  - 강점: {len(analysis['strengths'])}개")
-            print(f"  - 약점: {len(analysis['weaknesses'])}개")
-            print(f"  - 스토리: {len(analysis['stories'])}개")
-            print(f"  - 심층 분석: {len(analysis['deep_analysis'])}개")
-            
-            # 코멘트 출력
-            print(f"\n[생성된 코멘트]")
-            for page, comment in comments.items():
-                print(f"  {page}: {comment[:80]}..." if len(comment) > 80 else f"  {page}: {comment}")
-            
-            results[member] = analysis
+            results[member] = self.run_member(member)
         
         print(f"\n{'=' * 80}")
         print(f"Step 2 전체 멤버 분석 완료 ({len(target_members)}명)")
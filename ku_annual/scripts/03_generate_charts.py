@@ -7,16 +7,19 @@ matplotlib 기반 레퍼런스 스타일 차트 생성
 - 차트: 회색 막대 + 파란 선
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 import numpy as np
 import json
 from pathlib import Path
-import pandas as pd
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.cube import cube_for_workbook
+from ku_common.opponents import TopOpponents
+from ku_common.charts import setup_matplotlib
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+# Agg 백엔드 + 한글 폰트 설정 (ku_common.fonts가 프로젝트 폰트 캐시를 쓰도록 pyplot보다 먼저)
+setup_matplotlib()
+import matplotlib.pyplot as plt
 
 class ChartGenerator:
     def __init__(self):
@@ -26,7 +29,8 @@ class ChartGenerator:
         print("=" * 80)
         
         # 데이터 로드
-        self.df = pd.read_excel('kuniv_2025_data.xlsx')
+        self.cube = cube_for_workbook('kuniv_2025_data.xlsx')
+        self.top_opponents = TopOpponents(self.cube)
         
         data_dir = Path('output/data')
         with open(data_dir / 'member_statistics.json', encoding='utf-8') as f:
@@ -179,43 +183,28 @@ class ChartGenerator:
         
         return output_path
     
-    def _calculate_top_opponents(self, member_name, filter_func=None, top_n=5):
-        """주요 상대별 전적 계산
+    def _calculate_top_opponents(self, member_name, top_n=5, **filter_):
+        """주요 상대별 전적 (주요 상대 표에서 조회)
         
         Args:
             member_name: 멤버 이름
-            filter_func: DataFrame 필터 함수 (예: lambda df: df['상대 종족'] == '테란')
-            top_n: 상위 N명
+            top_n: 상위 N명 (최대 5)
+            **filter_: 필터 하나 (예: opp_race='테란', map='투혼', same_tier=True)
             
         Returns:
             [(상대이름, {games, wins, win_rate}), ...]
         """
-        # 멤버 데이터 추출
-        member_df = self.df[self.df['멤버 이름'] == member_name].copy()
-        
-        # 조건 필터링
-        if filter_func is not None:
-            member_df = member_df[filter_func(member_df)]
-        
-        # 상대별 집계
-        opponent_stats = {}
-        for _, row in member_df.iterrows():
-            opp = row['상대']
-            if opp not in opponent_stats:
-                opponent_stats[opp] = {'games': 0, 'wins': 0}
-            opponent_stats[opp]['games'] += 1
-            if row['결과'] == '승':
-                opponent_stats[opp]['wins'] += 1
-        
-        # 승률 계산
-        for opp in opponent_stats:
-            stats = opponent_stats[opp]
-            stats['win_rate'] = round(stats['wins'] / stats['games'] * 100, 2) if stats['games'] > 0 else 0
-        
-        # 경기수 많은 순으로 정렬
-        sorted_opponents = sorted(opponent_stats.items(), key=lambda x: x[1]['games'], reverse=True)[:top_n]
-        
-        return sorted_opponents
+        # 상대별 집계 (경기수 많은 순, 동점은 첫 경기 순)
+        entries = self.top_opponents.top(member_name, n=top_n, **filter_)
+        
+        return [
+            (entry.value, {
+                'games': entry.games,
+                'wins': entry.wins,
+                'win_rate': round(entry.wins / entry.games * 100, 2) if entry.games > 0 else 0
+            })
+            for entry in entries
+        ]
     
     def generate_race_comparison(self, member_name='정서린'):
         """종족별 성과 비교 차트 (Page 3 좌측) - 막대+선 복합"""
@@ -298,8 +287,7 @@ class ChartGenerator:
         target_race = races_by_wr[0][0]
         
         # 해당 종족 상대 중 경기수 많은 상위 5명
-        filter_func = lambda df: df['상대 종족'] == target_race
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
+        opponents = self._calculate_top_opponents(member_name, top_n=5, opp_race=target_race)
         
         if not opponents:
             print(f"  ! {target_race}전 주요 상대 데이터 없음 - 건너뜀")
@@ -457,8 +445,7 @@ class ChartGenerator:
         target_map = sorted_maps[1][0] if len(sorted_maps) > 1 else sorted_maps[0][0]
         
         # 해당 맵에서 경기수 많은 상위 5명
-        filter_func = lambda df: df['맵'] == target_map
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
+        opponents = self._calculate_top_opponents(member_name, top_n=5, map=target_map)
         
         if not opponents:
             print(f"  ! {target_map} 주요 상대 데이터 없음 - 건너뜀")
@@ -616,12 +603,8 @@ class ChartGenerator:
         """동일 티어 주요 상대별 전적 차트 (Page 5 우측) - 막대+선 복합"""
         print(f"\n[8/8] {member_name} - 동일 티어 주요 상대별 전적 차트 생성 중...")
         
-        # 동일 티어 경기만 필터링
-        member_df = self.df[self.df['멤버 이름'] == member_name].copy()
-        
-        # 동일 티어 필터 (멤버 티어 == 상대 티어)
-        filter_func = lambda df: df['멤버 티어'] == df['상대 티어']
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
+        # 동일 티어 경기만 (멤버 티어 == 상대 티어)
+        opponents = self._calculate_top_opponents(member_name, top_n=5, same_tier=True)
         
         if not opponents:
             print(f"  ! 동일 티어 주요 상대 데이터 없음 - 건너뜀")
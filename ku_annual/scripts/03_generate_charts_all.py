@@ -6,68 +6,128 @@ matplotlib 기반 레퍼런스 스타일 차트 생성
 - 텍스트: 흰색/회색
 - 차트: 회색 막대 + 파란 선
 - 개선: 8개 차트 생성 (막대+선 복합, 주요 상대별 전적)
+- 병렬: 멤버×차트 작업을 프로세스 풀에서 렌더링 (--jobs N, 기본 CPU 수, 1이면 순차)
+  워커는 멤버별 데이터 묶음(member_bundle)만 받아 차트 생성, 차트별 소요 시간 보고
+- 차트 템플릿(ku_common.chart_templates): 종류별 figure를 한 번 만들어 막대/선/라벨만 바꿔 저장
+- 캐시: 그리는 입력(라벨/값/색상/dpi/템플릿 버전)이 같은 PNG가 있으면 저장 생략 (output/charts/.chart_cache.json)
+  --full: 캐시 목록을 지우고 모두 다시 렌더링
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import numpy as np
-import json
 from pathlib import Path
-import pandas as pd
+import os
+import sys
+import time
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.context import PipelineContext
+from ku_common.charts import setup_matplotlib, render_charts, timed_chart, print_chart_timings
+from ku_common.chart_templates import BarLineChart, BarChart, ChartCache
+
+
+# Agg 백엔드 + 한글 폰트 설정 (ku_common.fonts, 병렬 모드 워커도 같은 설정으로 초기화)
+setup_matplotlib()
 
 class ChartGenerator:
-    def __init__(self):
-        """차트 생성기 초기화"""
+    # 멤버별 차트 종류 (generate_<이름> 메서드, 파일명 <멤버>_<이름>.png)
+    CHART_NAMES = [
+        'monthly_trend', 'performance_breakdown',
+        'race_comparison', 'race_opponents',
+        'map_comparison', 'map_opponents',
+        'tier_comparison', 'tier_opponents',
+    ]
+    
+    # 주요 상대별 전적 차트 종류 (opponent_chart_data kind)
+    OPPONENT_KINDS = ['race', 'map', 'tier']
+    
+    # 레퍼런스 스타일 색상
+    colors = {
+        'bg_dark': '#0a0e1a',
+        'bg_light': '#1a2332',
+        'text_white': '#ffffff',
+        'text_gray': '#9ca3af',
+        'bar_gray': '#4b5563',
+        'line_blue': '#3b82f6',
+        'accent_blue': '#0066ff'
+    }
+    
+    def __init__(self, context=None):
+        """
+        차트 생성기 초기화
+        
+        Args:
+            context: PipelineContext (한 프로세스에서 여러 단계를 실행할 때 공유, 없으면 새로 로드)
+        """
         print("=" * 80)
         print("Step 3: 차트 생성 (전체 멤버)")
         print("=" * 80)
         
         # 데이터 로드
-        self.df = pd.read_excel('kuniv_2025_data.xlsx')
+        self.context = context or PipelineContext()
+        self.cube = self.context.cube
+        self.member_stats = self.context.member_stats
         
-        data_dir = Path('output/data')
-        with open(data_dir / 'member_statistics.json', encoding='utf-8') as f:
-            self.member_stats = json.load(f)
-        
-        self.output_dir = Path('output/charts')
+        self.output_dir = self.context.base_dir / 'output' / 'charts'
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # 레퍼런스 스타일 색상
-        self.colors = {
-            'bg_dark': '#0a0e1a',
-            'bg_light': '#1a2332',
-            'text_white': '#ffffff',
-            'text_gray': '#9ca3af',
-            'bar_gray': '#4b5563',
-            'line_blue': '#3b82f6',
-            'accent_blue': '#0066ff'
-        }
+        # 워커 프로세스(from_bundles)에서만 사용하는 미리 계산한 멤버 데이터
+        self._bundles = None
+        # 차트 템플릿 (종류별 figure 재사용)
+        self._templates = {}
+        # 입력이 같은 차트는 이전 PNG 재사용
+        self.chart_cache = ChartCache(self.output_dir)
         
         print(f"\n✓ 데이터 로드 완료")
         print(f"  - 전체 멤버 차트 생성 모드")
     
-    def set_chart_style(self, fig, ax):
-        """레퍼런스 스타일 적용"""
-        # 배경색
-        fig.patch.set_facecolor(self.colors['bg_dark'])
-        ax.set_facecolor(self.colors['bg_dark'])
-        
-        # 축 색상
-        ax.spines['bottom'].set_color(self.colors['text_gray'])
-        ax.spines['left'].set_color(self.colors['text_gray'])
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        # 눈금 색상
-        ax.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 그리드
-        ax.grid(True, alpha=0.1, color=self.colors['text_gray'], linestyle='-', linewidth=0.5)
-        ax.set_axisbelow(True)
+    @classmethod
+    def from_bundles(cls, bundles, output_dir):
+        """멤버별 데이터 묶음으로 생성 (병렬 모드 워커용, 워크북/큐브 로드 없음)"""
+        generator = cls.__new__(cls)
+        generator.context = None
+        generator.cube = None
+        generator.member_stats = {name: bundle['stats'] for name, bundle in bundles.items()}
+        generator.output_dir = Path(output_dir)
+        generator._bundles = bundles
+        generator._templates = {}
+        generator.chart_cache = ChartCache(generator.output_dir)
+        return generator
+    
+    def member_bundle(self, member_name):
+        """멤버 차트에 필요한 데이터 (member_stats + 주요 상대별 전적, pickle 가능)"""
+        return {
+            'stats': self.member_stats[member_name],
+            'opponents': {kind: self.opponent_chart_data(member_name, kind) for kind in self.OPPONENT_KINDS},
+        }
+    
+    def _chart(self, kind, items=0):
+        """차트 템플릿 (프로세스마다 종류/크기별로 한 번 만들고 재사용)
+        
+        Args:
+            kind: 'monthly' (월별 추세, 기본 12개월), 'bar_line' (비교/주요 상대, 기본 5개), 'breakdown' (성과 세부 내역)
+            items: 그릴 항목 수 (기본 크기보다 많으면 그 수만큼 막대를 가진 템플릿 사용)
+        """
+        default_slots = {'monthly': 12, 'bar_line': 5, 'breakdown': 2}[kind]
+        # 항목 수로 크기를 정함 → 렌더링 순서와 관계없이 같은 멤버는 같은 템플릿
+        slots = max(default_slots, items)
+        key = (kind, slots)
+        if key not in self._templates:
+            if kind == 'monthly':
+                self._templates[key] = BarLineChart(self.colors, figsize=(12, 6), slots=slots, bar_width=0.8,
+                                                    xlabel='월', value_labels=False)
+            elif kind == 'bar_line':
+                self._templates[key] = BarLineChart(self.colors, slots=slots)
+            else:
+                self._templates[key] = BarChart(self.colors, slots=slots)
+        return self._templates[key]
+    
+    def _save(self, chart, member_name, chart_name):
+        output_path = self.output_dir / f'{member_name}_{chart_name}.png'
+        if chart.save(output_path, self.chart_cache):
+            print(f"  ✓ 저장: {output_path}")
+        else:
+            print(f"  ✓ 변경 없음 (캐시): {output_path}")
+        
+        return output_path
     
     def generate_monthly_trend(self, member_name='정서린'):
         """월별 성과 추세 차트 (Page 1)"""
@@ -84,44 +144,8 @@ class ChartGenerator:
         # 월 라벨 (2025-01 → 1월)
         month_labels = [m.split('-')[1] + '월' for m in months]
         
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(12, 6))
-        
-        # 막대 (경기수)
-        bars = ax1.bar(month_labels, games, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_xlabel('월', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(month_labels, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title('월별 성과 추세', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_monthly_trend.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        chart = self._chart('monthly', len(month_labels)).update(month_labels, games, win_rates, '월별 성과 추세')
+        return self._save(chart, member_name, 'monthly_trend')
     
     def generate_performance_breakdown(self, member_name='정서린'):
         """성과 세부 내역 차트 (Page 2)"""
@@ -135,84 +159,73 @@ class ChartGenerator:
         win_rates = [type_stats['스폰']['win_rate'], type_stats['대회']['win_rate']]
         games = [type_stats['스폰']['total_games'], type_stats['대회']['total_games']]
         
-        # 차트 생성
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(categories))
-        width = 0.5
-        
-        # 막대
-        bars = ax.bar(x, win_rates, width, color=self.colors['bar_gray'], alpha=0.8)
-        
-        # 막대 위에 값 표시
-        for i, (bar, wr, game) in enumerate(zip(bars, win_rates, games)):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                   f'{wr}%\n({game}경기)',
-                   ha='center', va='bottom', color=self.colors['text_white'],
-                   fontsize=11, fontweight='bold')
-        
-        ax.set_xticks(x)
-        ax.set_xticklabels(categories)
-        ax.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax.set_ylim(0, 100)
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax)
-        
-        # 타이틀
-        plt.title('성과 세부 내역', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_performance_breakdown.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        chart = self._chart('breakdown', len(categories)).update(categories, win_rates, games, '성과 세부 내역')
+        return self._save(chart, member_name, 'performance_breakdown')
     
-    def _calculate_top_opponents(self, member_name, filter_func=None, top_n=5):
-        """주요 상대별 전적 계산
+    def _calculate_top_opponents(self, member_name, top_n=5, **filter_):
+        """주요 상대별 전적 (공용 주요 상대 표에서 조회)
         
         Args:
             member_name: 멤버 이름
-            filter_func: DataFrame 필터 함수 (예: lambda df: df['상대 종족'] == '테란')
-            top_n: 상위 N명
+            top_n: 상위 N명 (최대 5)
+            **filter_: 필터 하나 (예: opp_race='테란', map='투혼', same_tier=True)
             
         Returns:
             [(상대이름, {games, wins, win_rate}), ...]
         """
-        # 멤버 데이터 추출
-        member_df = self.df[self.df['멤버 이름'] == member_name].copy()
-        
-        # 조건 필터링
-        if filter_func is not None:
-            member_df = member_df[filter_func(member_df)]
-        
-        # 상대별 집계
-        opponent_stats = {}
-        for _, row in member_df.iterrows():
-            opp = row['상대']
-            if opp not in opponent_stats:
-                opponent_stats[opp] = {'games': 0, 'wins': 0}
-            opponent_stats[opp]['games'] += 1
-            if row['결과'] == '승':
-                opponent_stats[opp]['wins'] += 1
-        
-        # 승률 계산
-        for opp in opponent_stats:
-            stats = opponent_stats[opp]
-            stats['win_rate'] = round(stats['wins'] / stats['games'] * 100, 2) if stats['games'] > 0 else 0
-        
-        # 경기수 많은 순으로 정렬
-        sorted_opponents = sorted(opponent_stats.items(), key=lambda x: x[1]['games'], reverse=True)[:top_n]
-        
-        return sorted_opponents
+        # 상대별 집계 (경기수 많은 순, 동점은 첫 경기 순)
+        entries = self.context.top_opponents.top(member_name, n=top_n, **filter_)
+        
+        return [
+            (entry.value, {
+                'games': entry.games,
+                'wins': entry.wins,
+                'win_rate': round(entry.wins / entry.games * 100, 2) if entry.games > 0 else 0
+            })
+            for entry in entries
+        ]
+    
+    def opponent_chart_data(self, member_name, kind):
+        """주요 상대별 전적 차트 데이터
+        
+        Args:
+            member_name: 멤버 이름
+            kind: 'race' (승률 가장 낮은 종족), 'map' (경기수 2번째 맵), 'tier' (동일 티어)
+            
+        Returns:
+            (대상 종족/맵, [(상대이름, {games, wins, win_rate}), ...]), 맵이 2개 미만이거나 tier면 대상 None
+        """
+        if self._bundles is not None:
+            return self._bundles[member_name]['opponents'][kind]
+        
+        stats = self.member_stats[member_name]
+        
+        if kind == 'race':
+            # 승률 낮은 종족 찾기 (약점 종족) → 해당 종족 상대 중 경기수 많은 상위 5명
+            races_by_wr = sorted(stats['by_opponent_race'].items(), key=lambda x: x[1]['win_rate'])
+            target_race = races_by_wr[0][0]
+            return target_race, self._calculate_top_opponents(member_name, top_n=5, opp_race=target_race)
+        
+        if kind == 'map':
+            sorted_maps = sorted(stats['by_map'].items(), key=lambda x: x[1]['total_games'], reverse=True)
+            if len(sorted_maps) < 2:
+                return None, []
+            
+            # 경기수 2번째로 많은 맵 선택 (1번째는 너무 흔할 수 있음) → 해당 맵에서 경기수 많은 상위 5명
+            target_map = sorted_maps[1][0]
+            return target_map, self._calculate_top_opponents(member_name, top_n=5, map=target_map)
+        
+        # 동일 티어 경기만 (멤버 티어 == 상대 티어)
+        return None, self._calculate_top_opponents(member_name, top_n=5, same_tier=True)
+    
+    def _opponents_chart(self, member_name, chart_name, opponents, title):
+        """주요 상대별 전적 차트 (막대: 경기수, 선: 승률)"""
+        opp_names = [o[0] for o in opponents]
+        win_rates = [o[1]['win_rate'] for o in opponents]
+        games = [o[1]['games'] for o in opponents]
+        
+        chart = self._chart('bar_line', len(opp_names)).update(opp_names, games, win_rates, title)
+        return self._save(chart, member_name, chart_name)
     
     def generate_race_comparison(self, member_name):
         """종족별 성과 비교 차트 (Page 3 좌측) - 막대+선 복합"""
@@ -226,144 +239,21 @@ class ChartGenerator:
         win_rates = [race_stats[r]['win_rate'] for r in races]
         games = [race_stats[r]['total_games'] for r in races]
         
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(races))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(races)
-        
-        # 막대 위에 경기수 표시
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + max(games)*0.02,
-                    f'{game}경기',
-                    ha='center', va='bottom', color=self.colors['text_gray'],
-                    fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            ax2.text(i, wr + 3, f'{wr}%',
-                    ha='center', va='bottom', color=self.colors['line_blue'],
-                    fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title('종족별 전적 비교', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_race_comparison.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        chart = self._chart('bar_line', len(races)).update(races, games, win_rates, '종족별 전적 비교')
+        return self._save(chart, member_name, 'race_comparison')
     
     def generate_race_opponents(self, member_name):
         """종족전 주요 상대별 전적 차트 (Page 3 우측) - 막대+선 복합"""
         print(f"\n[4/8] {member_name} - 종족전 주요 상대별 전적 차트 생성 중...")
         
-        # 승률 낮은 종족 찾기 (약점 종족)
-        stats = self.member_stats[member_name]
-        race_stats = stats['by_opponent_race']
-        
-        races_by_wr = sorted(race_stats.items(), key=lambda x: x[1]['win_rate'])
-        target_race = races_by_wr[0][0]
-        
-        # 해당 종족 상대 중 경기수 많은 상위 5명
-        filter_func = lambda df: df['상대 종족'] == target_race
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
+        # 약점 종족 상대 중 경기수 많은 상위 5명
+        target_race, opponents = self.opponent_chart_data(member_name, 'race')
         
         if not opponents:
             print(f"  ! {target_race}전 주요 상대 데이터 없음 - 건너뜀")
             return None
         
-        # 데이터 준비
-        opp_names = [o[0] for o in opponents]
-        win_rates = [o[1]['win_rate'] for o in opponents]
-        games = [o[1]['games'] for o in opponents]
-        
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(opp_names))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(opp_names)
-        
-        # 막대 위에 경기수 표시
-        max_games = max(games) if games else 1
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + max_games*0.02,
-                    f'{game}경기',
-                    ha='center', va='bottom', color=self.colors['text_gray'],
-                    fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            ax2.text(i, wr + 3, f'{wr}%',
-                    ha='center', va='bottom', color=self.colors['line_blue'],
-                    fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title(f'{target_race}전 주요 상대별 전적', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_race_opponents.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        return self._opponents_chart(member_name, 'race_opponents', opponents, f'{target_race}전 주요 상대별 전적')
     
     def generate_map_comparison(self, member_name):
         """맵별 성과 비교 차트 (Page 4 좌측) - 막대+선 복합"""
@@ -380,149 +270,24 @@ class ChartGenerator:
         win_rates = [m[1]['win_rate'] for m in sorted_maps]
         games = [m[1]['total_games'] for m in sorted_maps]
         
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(maps))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(maps)
-        
-        # 막대 위에 경기수 표시
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + max(games)*0.02,
-                    f'{game}경기',
-                    ha='center', va='bottom', color=self.colors['text_gray'],
-                    fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            ax2.text(i, wr + 3, f'{wr}%',
-                    ha='center', va='bottom', color=self.colors['line_blue'],
-                    fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title('주요 맵별 전적 비교', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_map_comparison.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        chart = self._chart('bar_line', len(maps)).update(maps, games, win_rates, '주요 맵별 전적 비교')
+        return self._save(chart, member_name, 'map_comparison')
     
     def generate_map_opponents(self, member_name):
         """맵별 주요 상대별 전적 차트 (Page 4 우측) - 막대+선 복합"""
         print(f"\n[6/8] {member_name} - 맵별 주요 상대별 전적 차트 생성 중...")
         
-        # 경기수 많은 맵 찾기
-        stats = self.member_stats[member_name]
-        map_stats = stats['by_map']
-        
-        sorted_maps = sorted(map_stats.items(), key=lambda x: x[1]['total_games'], reverse=True)
-        if len(sorted_maps) < 2:
+        # 경기수 2번째로 많은 맵에서 경기수 많은 상위 5명
+        target_map, opponents = self.opponent_chart_data(member_name, 'map')
+        if target_map is None:
             print(f"  ! 맵 데이터 부족 - 건너뜀")
             return None
         
-        # 경기수 2번째로 많은 맵 선택 (1번째는 너무 흔할 수 있음)
-        target_map = sorted_maps[1][0] if len(sorted_maps) > 1 else sorted_maps[0][0]
-        
-        # 해당 맵에서 경기수 많은 상위 5명
-        filter_func = lambda df: df['맵'] == target_map
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
-        
         if not opponents:
             print(f"  ! {target_map} 주요 상대 데이터 없음 - 건너뜀")
             return None
         
-        # 데이터 준비
-        opp_names = [o[0] for o in opponents]
-        win_rates = [o[1]['win_rate'] for o in opponents]
-        games = [o[1]['games'] for o in opponents]
-        
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(opp_names))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(opp_names)
-        
-        # 막대 위에 경기수 표시
-        max_games = max(games) if games else 1
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + max_games*0.02,
-                    f'{game}경기',
-                    ha='center', va='bottom', color=self.colors['text_gray'],
-                    fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            ax2.text(i, wr + 3, f'{wr}%',
-                    ha='center', va='bottom', color=self.colors['line_blue'],
-                    fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title(f'{target_map} 주요 상대별 전적', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_map_opponents.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        return self._opponents_chart(member_name, 'map_opponents', opponents, f'{target_map} 주요 상대별 전적')
     
     def generate_tier_comparison(self, member_name):
         """티어별 성과 비교 차트 (Page 5 좌측) - 막대+선 복합"""
@@ -531,197 +296,92 @@ class ChartGenerator:
         stats = self.member_stats[member_name]
         tier_stats = stats['by_tier_matchup']
         
-        # 데이터 준비
+        # 데이터 준비 (경기 없는 티어는 0으로 두고 값 라벨 숨김)
         tiers = ['상위 티어', '동일 티어', '하위 티어']
         tier_keys = ['upper', 'same', 'lower']
         
-        win_rates = []
-        games = []
-        tier_labels = []
-        
-        for key, label in zip(tier_keys, tiers):
-            if tier_stats[key]['total_games'] > 0:
-                win_rates.append(tier_stats[key]['win_rate'])
-                games.append(tier_stats[key]['total_games'])
-                tier_labels.append(label)
-            else:
-                win_rates.append(0)
-                games.append(0)
-                tier_labels.append(label)
-        
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(tier_labels))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(tier_labels)
-        
-        # 막대 위에 경기수 표시
-        max_games = max(games) if games else 1
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            if game > 0:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + max_games*0.02,
-                        f'{game}경기',
-                        ha='center', va='bottom', color=self.colors['text_gray'],
-                        fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            if games[i] > 0:
-                ax2.text(i, wr + 3, f'{wr}%',
-                        ha='center', va='bottom', color=self.colors['line_blue'],
-                        fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title('상대 티어별 전적 비교', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_tier_comparison.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
+        games = [tier_stats[key]['total_games'] for key in tier_keys]
+        win_rates = [tier_stats[key]['win_rate'] if game > 0 else 0 for key, game in zip(tier_keys, games)]
         
-        return output_path
+        chart = self._chart('bar_line', len(tiers)).update(tiers, games, win_rates, '상대 티어별 전적 비교',
+                                                          show=[game > 0 for game in games])
+        return self._save(chart, member_name, 'tier_comparison')
     
     def generate_tier_opponents(self, member_name):
         """동일 티어 주요 상대별 전적 차트 (Page 5 우측) - 막대+선 복합"""
         print(f"\n[8/8] {member_name} - 동일 티어 주요 상대별 전적 차트 생성 중...")
         
-        # 동일 티어 경기만 필터링
-        member_df = self.df[self.df['멤버 이름'] == member_name].copy()
-        
-        # 동일 티어 필터 (멤버 티어 == 상대 티어)
-        filter_func = lambda df: df['멤버 티어'] == df['상대 티어']
-        opponents = self._calculate_top_opponents(member_name, filter_func, top_n=5)
+        # 동일 티어 경기만 (멤버 티어 == 상대 티어)
+        _, opponents = self.opponent_chart_data(member_name, 'tier')
         
         if not opponents:
             print(f"  ! 동일 티어 주요 상대 데이터 없음 - 건너뜀")
             return None
         
-        # 데이터 준비
-        opp_names = [o[0] for o in opponents]
-        win_rates = [o[1]['win_rate'] for o in opponents]
-        games = [o[1]['games'] for o in opponents]
-        
-        # 차트 생성
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        x = np.arange(len(opp_names))
-        width = 0.5
-        
-        # 막대 (경기수)
-        bars = ax1.bar(x, games, width, color=self.colors['bar_gray'], alpha=0.7, label='경기수')
-        ax1.set_ylabel('경기수', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(opp_names)
-        
-        # 막대 위에 경기수 표시
-        max_games = max(games) if games else 1
-        for i, (bar, game) in enumerate(zip(bars, games)):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + max_games*0.02,
-                    f'{game}경기',
-                    ha='center', va='bottom', color=self.colors['text_gray'],
-                    fontsize=10)
-        
-        # 선 (승률)
-        ax2 = ax1.twinx()
-        line = ax2.plot(x, win_rates, color=self.colors['line_blue'], 
-                       marker='o', linewidth=2.5, markersize=8, label='승률')
-        ax2.set_ylabel('승률 (%)', color=self.colors['text_white'], fontsize=12, fontweight='bold')
-        ax2.set_ylim(0, 100)
-        
-        # 승률 값 표시 (선 위)
-        for i, wr in enumerate(win_rates):
-            ax2.text(i, wr + 3, f'{wr}%',
-                    ha='center', va='bottom', color=self.colors['line_blue'],
-                    fontsize=11, fontweight='bold')
-        
-        # 스타일 적용
-        self.set_chart_style(fig, ax1)
-        ax2.spines['bottom'].set_color(self.colors['text_gray'])
-        ax2.spines['right'].set_color(self.colors['text_gray'])
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['left'].set_visible(False)
-        ax2.tick_params(colors=self.colors['text_gray'], labelsize=10)
-        
-        # 타이틀
-        plt.title('동일 티어 주요 상대별 전적', color=self.colors['text_white'], 
-                 fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        
-        # 저장
-        output_path = self.output_dir / f'{member_name}_tier_opponents.png'
-        plt.savefig(output_path, dpi=150, facecolor=self.colors['bg_dark'], 
-                   edgecolor='none', bbox_inches='tight')
-        plt.close()
-        
-        print(f"  ✓ 저장: {output_path}")
-        
-        return output_path
+        return self._opponents_chart(member_name, 'tier_opponents', opponents, '동일 티어 주요 상대별 전적')
     
-    def generate_all_charts(self, member_name):
-        """멤버의 모든 차트 생성 (8개)"""
+    def generate_all_charts(self, member_name, timings=None):
+        """멤버의 모든 차트 생성 (8개, timings가 있으면 {차트: [소요 초]}에 추가)"""
         print(f"\n{member_name} 차트 생성 시작...")
         
         charts = {}
         
-        charts['monthly_trend'] = self.generate_monthly_trend(member_name)
-        charts['performance_breakdown'] = self.generate_performance_breakdown(member_name)
-        charts['race_comparison'] = self.generate_race_comparison(member_name)
-        charts['race_opponents'] = self.generate_race_opponents(member_name)
-        charts['map_comparison'] = self.generate_map_comparison(member_name)
-        charts['map_opponents'] = self.generate_map_opponents(member_name)
-        charts['tier_comparison'] = self.generate_tier_comparison(member_name)
-        charts['tier_opponents'] = self.generate_tier_opponents(member_name)
+        for chart_name in self.CHART_NAMES:
+            _, _, charts[chart_name], seconds = timed_chart(self, member_name, chart_name)
+            if timings is not None:
+                timings.setdefault(chart_name, []).append(seconds)
         
         return charts
     
-    def generate_for_all_members(self):
-        """모든 멤버의 차트 생성"""
-        # member_statistics.json에서 멤버 목록 로드
-        stats_file = Path('output/data/member_statistics.json')
-        with open(stats_file, 'r', encoding='utf-8') as f:
-            member_stats = json.load(f)
+    def generate_chart(self, member_name, chart_name):
+        """차트 한 종류 생성 (CHART_NAMES 중 하나, 캐시 기록은 close()/save()에서 저장)"""
+        return getattr(self, f'generate_{chart_name}')(member_name)
+    
+    def close(self):
+        """차트 캐시 기록 저장 (--dag에서 노드별로 생성한 뒤 한 번)"""
+        self.chart_cache.save()
+    
+    def generate_for_all_members(self, workers=None):
+        """
+        모든 멤버의 차트 생성
         
-        all_members = list(member_stats.keys())
+        Args:
+            workers: 프로세스 수 (기본 CPU 수, 1이면 현재 프로세스에서 순차 생성)
+        """
+        # member_statistics.json 멤버 목록
+        all_members = self.context.members
+        workers = workers or os.cpu_count() or 1
         
         print(f"\n총 {len(all_members)}명 멤버 차트 생성 시작...")
         print(f"멤버 목록: {', '.join(all_members)}\n")
         
-        for i, member in enumerate(all_members, 1):
-            print(f"\n{'=' * 80}")
-            print(f"[{i}/{len(all_members)}] {member} 차트 생성")
-            print(f"{'=' * 80}")
+        timings = {}
+        start = time.perf_counter()
+        
+        if workers > 1:
+            # 멤버별 데이터 묶음을 미리 계산 → 워커는 큐브/DataFrame 없이 차트만 렌더링
+            bundles = {member: self.member_bundle(member) for member in all_members}
+            jobs = [(member, chart_name) for member in all_members for chart_name in self.CHART_NAMES]
+            print(f"프로세스 {workers}개로 {len(jobs)}개 차트 렌더링")
             
-            self.generate_all_charts(member)
+            results = render_charts(Path(__file__).resolve(), type(self).__name__, bundles,
+                                    self.output_dir, jobs, workers, cache=self.chart_cache)
+            for member, chart_name, path, seconds in results:
+                timings.setdefault(chart_name, []).append(seconds)
+                if path is None:
+                    print(f"  ! {member} {chart_name} - 데이터 없음, 건너뜀")
+                else:
+                    print(f"  ✓ {path.name} ({seconds:.2f}초)")
+        else:
+            for i, member in enumerate(all_members, 1):
+                print(f"\n{'=' * 80}")
+                print(f"[{i}/{len(all_members)}] {member} 차트 생성")
+                print(f"{'=' * 80}")
+                
+                self.generate_all_charts(member, timings)
+        self.chart_cache.save()
+        
+        print_chart_timings(timings, time.perf_counter() - start)
         
         print(f"\n{'=' * 80}")
         print(f"Step 3 완료: 전체 멤버 차트 생성 성공 ({len(all_members)}명)")
@@ -732,5 +392,11 @@ class ChartGenerator:
 
 
 if __name__ == '__main__':
+    # --jobs N: 차트 렌더링 프로세스 수 (기본 CPU 수), --full: 캐시 무시
+    args = sys.argv[1:]
+    workers = int(args[args.index('--jobs') + 1]) if '--jobs' in args else None
+    
     generator = ChartGenerator()
-    generator.generate_for_all_members()
+    if '--full' in args:
+        generator.chart_cache.clear()
+    generator.generate_for_all_members(workers)
@@ -11,6 +11,10 @@ import json
 from pathlib import Path
 from jinja2 import Template
 import base64
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.fonts import CSS_FONT_STACK, font_face_css
 
 class SlideGenerator:
     def __init__(self):
@@ -47,8 +51,8 @@ class SlideGenerator:
             return base64.b64encode(f.read()).decode('utf-8')
     
     def _get_base_style(self):
-        """공통 스타일 CSS"""
-        return """
+        """공통 스타일 CSS (차트와 같은 한글 폰트 파일, ku_common.fonts)"""
+        return font_face_css() + """
         * {
             margin: 0;
             padding: 0;
@@ -58,7 +62,7 @@ class SlideGenerator:
         body {
             width: 1920px;
             height: 1080px;
-            font-family: 'Malgun Gothic', sans-serif;
+            font-family: """ + CSS_FONT_STACK + """;
             background: linear-gradient(135deg, #0a0e1a 0%, #1a2332 100%);
             color: #ffffff;
             overflow: hidden;
@@ -11,10 +11,32 @@ import json
 from pathlib import Path
 from jinja2 import Template
 import base64
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.context import PipelineContext
+from ku_common.fonts import CSS_FONT_STACK, font_face_css
 
 class SlideGenerator:
-    def __init__(self):
-        """슬라이드 생성기 초기화"""
+    # 페이지 이름 (generate_<이름> 메서드, 파일명 <멤버>_<이름>.html)
+    PAGES = ['page_1_cover', 'page_2_performance', 'page_3_race', 'page_4_map', 'page_5_tier']
+    
+    # 페이지별로 삽입하는 차트 (Step 3 결과)
+    PAGE_CHARTS = {
+        'page_1_cover': [],
+        'page_2_performance': ['monthly_trend', 'performance_breakdown'],
+        'page_3_race': ['race_comparison', 'race_opponents'],
+        'page_4_map': ['map_comparison', 'map_opponents'],
+        'page_5_tier': ['tier_comparison', 'tier_opponents'],
+    }
+    
+    def __init__(self, context=None):
+        """
+        슬라이드 생성기 초기화
+        
+        Args:
+            context: PipelineContext (한 프로세스에서 여러 단계를 실행할 때 공유, 없으면 새로 로드)
+        """
         self.base_dir = Path(__file__).parent.parent
         self.output_dir = self.base_dir / 'output'
         self.charts_dir = self.output_dir / 'charts'
@@ -22,7 +44,8 @@ class SlideGenerator:
         self.slides_dir.mkdir(parents=True, exist_ok=True)
         
         # 분석 데이터 로드
-        self.member_stats = self._load_json('data/member_statistics.json')
+        self.context = context or PipelineContext(self.base_dir)
+        self.member_stats = self.context.member_stats
         
         print("✓ 데이터 로드 완료")
         print(f"  - 전체 멤버 슬라이드 생성 모드")
@@ -39,8 +62,8 @@ class SlideGenerator:
             return base64.b64encode(f.read()).decode('utf-8')
     
     def _get_base_style(self):
-        """공통 스타일 CSS"""
-        return """
+        """공통 스타일 CSS (차트와 같은 한글 폰트 파일, ku_common.fonts)"""
+        return font_face_css() + """
         * {
             margin: 0;
             padding: 0;
@@ -50,7 +73,7 @@ class SlideGenerator:
         body {
             width: 1920px;
             height: 1080px;
-            font-family: 'Malgun Gothic', sans-serif;
+            font-family: """ + CSS_FONT_STACK + """;
             background: linear-gradient(135deg, #0a0e1a 0%, #1a2332 100%);
             color: #ffffff;
             overflow: hidden;
@@ -570,31 +593,26 @@ class SlideGenerator:
     
     def generate_all_slides(self, member_name):
         """멤버의 모든 슬라이드 생성"""
-        # 멤버별 분석 파일 로드
-        analysis_file = self.output_dir / 'analysis' / f'{member_name}_analysis.json'
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            self.analysis = json.load(f)
+        # 멤버별 분석 (Step 2 결과, 메모리에 없으면 파일에서 로드)
+        self.analysis = self.context.analysis(member_name)
         
         print(f"\n{member_name} 슬라이드 생성 시작...\n")
         
-        pages = [
-            ('page_1_cover', self.generate_page_1_cover),
-            ('page_2_performance', self.generate_page_2_performance),
-            ('page_3_race', self.generate_page_3_race),
-            ('page_4_map', self.generate_page_4_map),
-            ('page_5_tier', self.generate_page_5_tier)
-        ]
-        
         generated_files = []
         
-        for i, (page_name, generator_func) in enumerate(pages, 1):
+        for i, page_name in enumerate(self.PAGES, 1):
             print(f"[{i}/5] {member_name} - {page_name} 생성 중...")
-            output_path = generator_func(member_name)
+            output_path = getattr(self, f'generate_{page_name}')(member_name)
             print(f"  ✓ 저장: {output_path.relative_to(self.base_dir)}")
             generated_files.append(output_path)
         
         return generated_files
     
+    def generate_page(self, member_name, page_name):
+        """슬라이드 한 페이지 생성 (PAGES 중 하나)"""
+        self.analysis = self.context.analysis(member_name)
+        return getattr(self, f'generate_{page_name}')(member_name)
+    
     def generate_for_all_members(self):
         """모든 멤버의 슬라이드 생성"""
         all_members = list(self.member_stats.keys())
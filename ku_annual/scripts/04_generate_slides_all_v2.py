@@ -9,17 +9,28 @@ matplotlib 차트 이미지 대신 HTML/CSS로 차트 직접 렌더링
 
 import json
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.context import PipelineContext
+from ku_common.fonts import CSS_FONT_STACK, font_face_css
 
 class SlideGeneratorV2:
-    def __init__(self):
-        """슬라이드 생성기 초기화"""
+    def __init__(self, context=None):
+        """
+        슬라이드 생성기 초기화
+        
+        Args:
+            context: PipelineContext (한 프로세스에서 여러 단계를 실행할 때 공유, 없으면 새로 로드)
+        """
         self.base_dir = Path(__file__).parent.parent
         self.output_dir = self.base_dir / 'output'
         self.slides_dir = self.output_dir / 'slides_v2'
         self.slides_dir.mkdir(parents=True, exist_ok=True)
         
         # 데이터 로드
-        self.member_stats = self._load_json('data/member_statistics.json')
+        self.context = context or PipelineContext(self.base_dir)
+        self.member_stats = self.context.member_stats
         
         # 색상 팔레트
         self.colors = {
@@ -45,8 +56,10 @@ class SlideGeneratorV2:
             return json.load(f)
     
     def _get_base_style(self):
-        """공통 스타일 CSS"""
+        """공통 스타일 CSS (차트와 같은 한글 폰트 파일, ku_common.fonts)"""
         return f"""
+        {font_face_css()}
+        
         * {{
             margin: 0;
             padding: 0;
@@ -56,7 +69,7 @@ class SlideGeneratorV2:
         body {{
             width: 1920px;
             height: 1080px;
-            font-family: 'Malgun Gothic', sans-serif;
+            font-family: {CSS_FONT_STACK};
             background: linear-gradient(135deg, {self.colors['bg_dark']} 0%, {self.colors['bg_light']} 100%);
             color: {self.colors['text_white']};
             overflow: hidden;
@@ -94,10 +107,11 @@ class SlideGeneratorV2:
         }}
         """
     
-    def _get_top_opponents(self, analysis):
-        """약점 종족 주요 상대 5명 추출
+    def _get_top_opponents(self, member_name, analysis):
+        """약점 종족 주요 상대 5명 추출 (차트와 같은 공용 주요 상대 표에서 조회)
         
         Args:
+            member_name: 멤버 이름
             analysis: 분석 JSON 데이터
             
         Returns:
@@ -113,23 +127,17 @@ class SlideGeneratorV2:
         if not weak_race:
             return None
         
-        # deep_analysis에서 주요 상대 찾기
+        # deep_analysis에서 원인을 분석한 약점 종족만
         deep_key = f"{weak_race}전_약점"
         if deep_key not in analysis.get('deep_analysis', {}):
             return None
         
-        opponent_breakdown = analysis['deep_analysis'][deep_key].get('opponent_breakdown', {})
-        
-        # [(이름, 경기수, 승률), ...] 형식으로 변환
-        opponents_data = []
-        for name, stats in opponent_breakdown.items():
-            opponents_data.append((name, stats['games'], stats['win_rate']))
-        
-        # 경기수 순으로 정렬 (이미 정렬되어 있지만 확실하게)
-        opponents_data.sort(key=lambda x: x[1], reverse=True)
-        
-        # 상위 5명
-        return opponents_data[:5]
+        # 경기수 상위 5명 중 10경기 이상 (Step 2 opponent_breakdown과 같은 기준)
+        return [
+            (entry.value, entry.games, round(entry.wins / entry.games * 100, 2))
+            for entry in self.context.top_opponents.top(member_name, opp_race=weak_race)
+            if entry.games >= 10
+        ]
     
     def _create_bar_chart_svg(self, data, max_games, chart_width=800, chart_height=400):
         """막대 차트 SVG 생성 (선 없음)
@@ -370,10 +378,8 @@ class SlideGeneratorV2:
     
     def generate_page_3_race(self, member_name):
         """Page 3: 종족별 성과 비교 (HTML/CSS 차트)"""
-        # 분석 JSON 로드
-        analysis_file = self.output_dir / 'analysis' / f'{member_name}_analysis.json'
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
+        # 분석 결과 (Step 2 결과, 메모리에 없으면 파일에서 로드)
+        analysis = self.context.analysis(member_name)
         
         comment = analysis['comments']['page_3_race']
         stats = self.member_stats[member_name]
@@ -388,7 +394,7 @@ class SlideGeneratorV2:
         chart1_svg = self._create_bar_line_chart_svg(chart_data, max_games, chart_width=800, chart_height=400)
         
         # 차트 2: 약점 종족 주요 상대
-        top_opponents = self._get_top_opponents(analysis)
+        top_opponents = self._get_top_opponents(member_name, analysis)
         if top_opponents:
             opponent_chart_data = top_opponents
             max_opponent_games = max(games for _, games, _ in opponent_chart_data)
@@ -490,9 +496,7 @@ class SlideGeneratorV2:
     
     def generate_page_2_performance(self, member_name):
         """Page 2: 전적 상세 (타입별 + 월별 승률)"""
-        analysis_file = self.output_dir / 'analysis' / f'{member_name}_analysis.json'
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
+        analysis = self.context.analysis(member_name)
         
         comment = analysis['comments']['page_2_performance']
         stats = self.member_stats[member_name]
@@ -610,9 +614,7 @@ class SlideGeneratorV2:
     
     def generate_page_4_map(self, member_name):
         """Page 4: 맵별 성과 비교"""
-        analysis_file = self.output_dir / 'analysis' / f'{member_name}_analysis.json'
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
+        analysis = self.context.analysis(member_name)
         
         comment = analysis['comments']['page_4_map']
         stats = self.member_stats[member_name]
@@ -625,7 +627,7 @@ class SlideGeneratorV2:
         max_map_games = max(m[1] for m in map_data) if map_data else 1
         chart1_svg = self._create_bar_line_chart_svg(map_data, max_map_games, chart_width=800, chart_height=400)
         
-        top_opponents = self._get_top_opponents(analysis)
+        top_opponents = self._get_top_opponents(member_name, analysis)
         if top_opponents:
             max_opponent_games = max(games for _, games, _ in top_opponents)
             chart2_svg = self._create_bar_line_chart_svg(top_opponents, max_opponent_games, chart_width=800, chart_height=400)
@@ -726,9 +728,7 @@ class SlideGeneratorV2:
     
     def generate_page_5_tier(self, member_name):
         """Page 5: 티어별 성과 비교"""
-        analysis_file = self.output_dir / 'analysis' / f'{member_name}_analysis.json'
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
+        analysis = self.context.analysis(member_name)
         
         comment = analysis['comments']['page_5_tier']
         stats = self.member_stats[member_name]
@@ -901,7 +901,6 @@ def main():
     
     generator = SlideGeneratorV2()
     
-    import sys
     if len(sys.argv) > 1 and sys.argv[1] == '--test':
         member_name = "정서린"
         print(f"\n테스트 모드: {member_name} 슬라이드만 생성")
@@ -4,49 +4,63 @@ Step 5: PNG 변환 (전체 멤버)
 Chrome Headless를 사용한 HTML → PNG 변환
 - 해상도: 1920x1080px
 - 각 슬라이드를 고품질 PNG로 저장
+- Playwright가 있으면 브라우저 하나를 계속 실행하며 페이지 이동 + 스크린샷 (ku_common.browser)
+  없으면 슬라이드마다 Chrome CLI(--screenshot) 실행
 """
 
 import subprocess
 from pathlib import Path
-import os
 import sys
-import json
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.context import PipelineContext
+from ku_common.browser import BrowserSession, chrome_candidates, find_chromium, sync_playwright
 
 class PNGConverter:
-    def __init__(self):
-        """PNG 변환기 초기화"""
+    # 슬라이드 파일 목록 (<멤버>_<페이지>.html → .png)
+    PAGES = ['page_1_cover', 'page_2_performance', 'page_3_race', 'page_4_map', 'page_5_tier']
+    
+    def __init__(self, context=None):
+        """
+        PNG 변환기 초기화
+        
+        Args:
+            context: PipelineContext (한 프로세스에서 여러 단계를 실행할 때 공유, 없으면 새로 로드)
+        """
         self.base_dir = Path(__file__).parent.parent
+        self.context = context or PipelineContext(self.base_dir)
         self.slides_dir = self.base_dir / 'output' / 'slides'
         self.images_dir = self.base_dir / 'output' / 'images'
         self.images_dir.mkdir(parents=True, exist_ok=True)
         
-        # Chrome 실행 파일 찾기
-        self.chrome_path = self._find_chrome()
+        # 변환 방식: Playwright 세션(브라우저 1회 실행) 우선, 없으면 Chrome CLI
+        self.use_session = sync_playwright is not None
+        self.session = None
+        self.launch_error = None  # 브라우저 실행 실패 (이후 슬라이드는 다시 시도하지 않음)
+        self.chrome_path = find_chromium() if self.use_session else self._find_chrome()
         
         print("✓ PNG 변환기 초기화 완료")
-        print(f"  - Chrome 경로: {self.chrome_path}")
+        print(f"  - 변환 방식: {'Playwright 세션 (브라우저 재사용)' if self.use_session else 'Chrome CLI (슬라이드마다 실행)'}")
+        print(f"  - Chrome 경로: {self.chrome_path or 'Playwright 내장 Chromium'}")
         print(f"  - 전체 멤버 PNG 변환 모드")
     
     def _find_chrome(self):
-        """Chrome 실행 파일 경로 찾기"""
-        possible_paths = [
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
+        """Chrome 실행 파일 경로 찾기 (CHROME_PATH 환경 변수, OS별 설치 경로, PATH)"""
+        path = find_chromium()
+        if path:
+            return path
         
         print("❌ Chrome을 찾을 수 없습니다.")
-        print("다음 경로 중 하나에 Chrome이 설치되어 있어야 합니다:")
-        for path in possible_paths:
-            print(f"  - {path}")
+        print("CHROME_PATH 환경 변수를 지정하거나 다음 중 하나에 Chrome/Chromium이 설치되어 있어야 합니다:")
+        for candidate in chrome_candidates() or ['google-chrome', 'chromium (PATH)']:
+            print(f"  - {candidate}")
         sys.exit(1)
     
     def convert_html_to_png(self, html_path, output_path):
         """HTML 파일을 PNG로 변환"""
+        if self.use_session:
+            return self._screenshot_in_session(html_path, output_path)
+        
         # Chrome Headless 명령어
         cmd = [
             self.chrome_path,
@@ -54,7 +68,7 @@ class PNGConverter:
             f'--screenshot={output_path}',
             '--window-size=1920,1080',
             '--hide-scrollbars',
-            f'file:///{html_path.as_posix()}'
+            html_path.resolve().as_uri()
         ]
         
         try:
@@ -78,63 +92,92 @@ class PNGConverter:
             print(f"  ❌ 오류: {e}")
             return False
     
+    def _screenshot_in_session(self, html_path, output_path):
+        """실행 중인 브라우저에서 페이지 이동 + 스크린샷 (처음 호출 시 브라우저 실행)"""
+        if self.launch_error is not None:
+            print("  ❌ 건너뜀: 브라우저 실행 실패 (첫 실패 후 다시 시도하지 않음)")
+            return False
+        if self.session is None:
+            try:
+                self.session = BrowserSession(timeout=30).start()
+            except Exception as e:
+                self.launch_error = e
+                print(f"  ❌ 브라우저 실행 실패: {e}")
+                return False
+            print(f"  - 브라우저 실행: {self.session.executable_path}")
+        try:
+            self.session.screenshot(html_path, output_path)
+            return output_path.exists()
+        except Exception as e:
+            print(f"  ❌ 변환 실패: {e}")
+            return False
+    
+    def close(self):
+        """브라우저 세션 종료"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+    
     def convert_member_slides(self, member_name):
         """멤버의 모든 슬라이드를 PNG로 변환"""
         print(f"\n{member_name} 슬라이드 PNG 변환 시작...\n")
         
-        # 슬라이드 파일 목록
-        pages = [
-            'page_1_cover',
-            'page_2_performance',
-            'page_3_race',
-            'page_4_map',
-            'page_5_tier'
-        ]
-        
         converted_files = []
         
-        for i, page_name in enumerate(pages, 1):
-            html_filename = f'{member_name}_{page_name}.html'
-            png_filename = f'{member_name}_{page_name}.png'
-            
-            html_path = self.slides_dir / html_filename
-            output_path = self.images_dir / png_filename
-            
-            if not html_path.exists():
-                print(f"[{i}/5] ❌ HTML 파일이 없습니다: {html_filename}")
-                continue
-            
-            print(f"[{i}/5] {member_name} - {page_name} 변환 중...")
-            
-            if self.convert_html_to_png(html_path, output_path):
-                print(f"  ✓ 저장: {output_path.relative_to(self.base_dir)}")
+        for i, page_name in enumerate(self.PAGES, 1):
+            print(f"[{i}/5] ", end='')
+            output_path = self.convert_page(member_name, page_name)
+            if output_path:
                 converted_files.append(output_path)
-            else:
-                print(f"  ❌ 실패: {page_name}")
         
         return converted_files
     
+    def convert_page(self, member_name, page_name):
+        """슬라이드 한 페이지 PNG 변환 (실패 시 None)"""
+        html_filename = f'{member_name}_{page_name}.html'
+        png_filename = f'{member_name}_{page_name}.png'
+        
+        html_path = self.slides_dir / html_filename
+        output_path = self.images_dir / png_filename
+        
+        if not html_path.exists():
+            print(f"❌ HTML 파일이 없습니다: {html_filename}")
+            return None
+        
+        print(f"{member_name} - {page_name} 변환 중...")
+        
+        if self.convert_html_to_png(html_path, output_path):
+            print(f"  ✓ 저장: {output_path.relative_to(self.base_dir)}")
+            return output_path
+        
+        print(f"  ❌ 실패: {page_name}")
+        return None
+    
     def convert_for_all_members(self):
         """모든 멤버의 슬라이드를 PNG로 변환"""
-        # member_statistics.json에서 멤버 목록 로드
-        stats_file = self.base_dir / 'output' / 'data' / 'member_statistics.json'
-        with open(stats_file, 'r', encoding='utf-8') as f:
-            member_stats = json.load(f)
-        
-        all_members = list(member_stats.keys())
+        # member_statistics.json 멤버 목록
+        all_members = self.context.members
         
         print(f"\n총 {len(all_members)}명 멤버 PNG 변환 시작...")
         print(f"멤버 목록: {', '.join(all_members)}\n")
         
         total_files = []
         
-        for i, member in enumerate(all_members, 1):
-            print(f"\n{'=' * 80}")
-            print(f"[{i}/{len(all_members)}] {member} PNG 변환")
-            print(f"{'=' * 80}")
-            
-            files = self.convert_member_slides(member)
-            total_files.extend(files)
+        try:
+            for i, member in enumerate(all_members, 1):
+                print(f"\n{'=' * 80}")
+                print(f"[{i}/{len(all_members)}] {member} PNG 변환")
+                print(f"{'=' * 80}")
+                
+                files = self.convert_member_slides(member)
+                total_files.extend(files)
+        finally:
+            self.close()
+        
+        expected = len(all_members) * len(self.PAGES)
+        if len(total_files) < expected:
+            print(f"\n❌ Step 5 실패: PNG {len(total_files)}/{expected}개만 변환됨")
+            sys.exit(1)
         
         print(f"\n{'=' * 80}")
         print(f"Step 5 완료: 전체 멤버 PNG 변환 성공 ({len(all_members)}명)")
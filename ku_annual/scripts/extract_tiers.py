@@ -1,7 +1,12 @@
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from ku_common.match_store import load_matches
 
 # Read Excel data
-df = pd.read_excel('kuniv_2025_data.xlsx')
+df = load_matches('kuniv_2025_data.xlsx')
 
 print('=== 전체 데이터 정보 ===')
 print(f'총 경기 수: {len(df)}')
@@ -0,0 +1,23 @@
+"""
+K UNIVERSITY 보고서 공용 모듈
+
+ku_annual 파이프라인과 Analysis Report 생성 스크립트가 함께 사용하는 코드
+- match_store: 경기 기록 워크북 로더 (컬럼형 캐시)
+- schema: 카테고리/정수 코드 경기 테이블 (win, date_ord)
+- tiers: 멤버/상대 티어 변동 이력, 경기 시점 티어 조회, 티어 매치업 분류
+- aggregate: 멤버 × 차원 승/패 집계 엔진
+- cube: 축 조합별 승/패 카운트 큐브 (드릴다운 질의, npz 캐시)
+- daily: 멤버별 일 단위 누적 승/패 배열 (임의 기간 통계)
+- ingest: 증분 수집 상태 (행 해시 + 날짜 워터마크, 영향받은 멤버/상대 계산)
+- context: 파이프라인 단계 간 공유 데이터 (지연 로드)
+- dag: 입력 지문 기반 증분 빌드 그래프 (건너뜀/재실행 이유 보고)
+- browser: 헤드리스 Chromium 세션 (브라우저 재사용 스크린샷, Chrome/Chromium 탐색)
+- render: 비동기 페이지 렌더링 풀 (페이지 재사용, 동시 렌더링, 재시도/제한 시간)
+- assets: 렌더링용 로컬 폰트/CSS 번들 (page.route로 오프라인 응답)
+- pdf: 이미지 → PDF 스트리밍 병합 (PNG 그대로 사용, 병렬 페이지 준비)
+- manifest: 보고서 페이지 목록 (렌더러가 기록, PDF 병합 순서/증분 병합 기준)
+- charts: matplotlib 차트 렌더링 (Agg/폰트 설정, 멤버×차트 프로세스 병렬, 차트별 소요 시간)
+- chart_templates: 미리 스타일을 적용한 차트 figure (막대/선/라벨만 바꿔 재사용)
+- fonts: 한글 폰트 부트스트랩 (저장소의 나눔고딕 등록/고정, 고정 폰트 목록으로 캐시 준비, HTML @font-face)
+- opponents: 멤버별 주요 상대 표 (상대 종족/맵/동일 티어별 경기수 상위 N명을 한 번에 계산)
+"""
@@ -0,0 +1,97 @@
+"""
+멤버 × 차원 승/패 집계 엔진
+
+멤버별로 DataFrame을 반복 필터링하는 대신, 차원(월, 상대 종족, 맵, 상대 등)마다
+(멤버, 차원 값) groupby를 한 번만 수행해 전체 멤버의 (경기수, 승수)를 미리 계산
+
+- 차원 값 순서: 멤버 경기 기록 내 첫 등장 순서 (boolean 필터 + unique()와 동일)
+- ranked(): 경기수 내림차순, 동점은 첫 등장 순서 (value_counts()와 동일)
+- first_row/last_row: 그룹의 첫/마지막 행 위치 (iloc[0]/iloc[-1] 값 조회용)
+
+사용 예:
+    agg = MemberAggregates(df, {'map': df['맵'], 'opponent': df['상대']})
+    agg.total('정서린')                       # WinLoss(value=None, games, wins, ...)
+    agg.counts('정서린', 'map')               # {맵: WinLoss}
+    agg.ranked('정서린', 'opponent')[:5]      # 경기수 상위 5명
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+WinLoss = namedtuple('WinLoss', ['value', 'games', 'wins', 'first_row', 'last_row'])
+
+
+class MemberAggregates:
+    """멤버 × 차원 값별 (경기수, 승수) 집계"""
+
+    def __init__(self, df, dimensions, key='멤버 이름'):
+        """
+        Args:
+            df: win 컬럼이 있는 경기 테이블 (schema.to_match_table 결과)
+            dimensions: {차원 이름: 컬럼명 또는 df와 같은 길이의 값 배열}
+            key: 멤버 컬럼명
+        """
+        self.df = df
+        self.key = key
+
+        base = pd.DataFrame({
+            'key': df[key].to_numpy(),
+            'win': df['win'].to_numpy(),
+            'row': np.arange(len(df)),
+        })
+
+        self._totals = self._aggregate(base, ['key'])
+        self._tables = {}
+        for name, values in dimensions.items():
+            values = df[values] if isinstance(values, str) else values
+            frame = base.assign(value=np.asarray(values))
+            self._tables[name] = self._aggregate(frame, ['key', 'value'])
+
+    @staticmethod
+    def _aggregate(frame, keys):
+        """groupby 한 번으로 그룹별 집계 후 멤버별 WinLoss 목록으로 분리"""
+        grouped = frame.groupby(keys, observed=True, sort=False).agg(
+            games=('win', 'size'),
+            wins=('win', 'sum'),
+            first_row=('row', 'min'),
+            last_row=('row', 'max'),
+        ).reset_index()
+
+        members = grouped['key'].tolist()
+        values = grouped['value'].tolist() if 'value' in grouped else [None] * len(grouped)
+        rows = zip(values, grouped['games'].tolist(), grouped['wins'].tolist(),
+                   grouped['first_row'].tolist(), grouped['last_row'].tolist())
+
+        by_member = {}
+        for member, row in zip(members, rows):
+            by_member.setdefault(member, []).append(WinLoss(*row))
+        return by_member
+
+    @property
+    def members(self):
+        """멤버 목록 (첫 등장 순서)"""
+        return list(self._totals)
+
+    def total(self, member):
+        """멤버 전체 (경기수, 승수) - 기록이 없으면 0경기"""
+        entries = self._totals.get(member)
+        return entries[0] if entries else WinLoss(None, 0, 0, -1, -1)
+
+    def entries(self, member, dimension):
+        """멤버의 차원 값별 WinLoss 목록 (첫 등장 순서)"""
+        return self._tables[dimension].get(member, [])
+
+    def counts(self, member, dimension):
+        """{차원 값: WinLoss} (첫 등장 순서)"""
+        return {entry.value: entry for entry in self.entries(member, dimension)}
+
+    def ranked(self, member, dimension, min_games=0):
+        """경기수 내림차순 WinLoss 목록 (동점은 첫 등장 순서, min_games 이상만)"""
+        ranked = sorted(self.entries(member, dimension), key=lambda e: e.games, reverse=True)
+        return [entry for entry in ranked if entry.games >= min_games]
+
+    def value_at(self, column, row):
+        """행 위치의 컬럼 값 (first_row/last_row와 함께 사용)"""
+        return self.df[column].iloc[row]
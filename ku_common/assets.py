@@ -0,0 +1,156 @@
+"""
+렌더링용 로컬 웹 자산 번들 (폰트/CSS 오프라인 제공)
+
+보고서 HTML의 COMMON_STYLE은 Pretendard(jsdelivr)와 Montserrat(Google Fonts)를 @import로 불러옴
+→ 페이지마다 네트워크 요청, 오프라인 렌더링 장비에서는 실패하거나 다른 폰트로 대체됨
+
+- 번들: assets/web/ (index.json {URL: {file, content_type}} + 파일)
+  인터넷이 되는 곳에서 `python -m ku_common.assets`로 한 번 내려받고 렌더링 장비에 복사
+- 렌더링: Playwright page.route로 요청을 가로채 메모리의 번들에서 응답
+  (offline=True면 번들에 없는 외부 요청은 차단 → 네트워크 상태와 무관하게 같은 결과)
+- 오프라인(기본)인데 번들이 없으면 require()가 FileNotFoundError → 렌더링 시작 전에 중단
+  (대체 폰트로 조용히 렌더링하지 않음, 네트워크 폰트를 쓰려면 KU_ASSETS_ONLINE=1)
+- version: index.json 해시 (렌더 결과가 자산에 따라 달라지는지 구분하는 용도)
+
+사용 예:
+    bundle = AssetBundle()
+    await page.route('**/*', bundle.handle)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import urllib.request
+from pathlib import Path
+from urllib.parse import urljoin
+
+DEFAULT_ASSET_DIR = Path(__file__).resolve().parents[1] / 'assets' / 'web'
+
+# 1이면 번들 없이 네트워크에서 폰트/CSS 로드 허용 (AssetBundle offline 기본값 False)
+ONLINE_ENV = 'KU_ASSETS_ONLINE'
+
+# COMMON_STYLE이 @import하는 스타일시트 (하위 폰트 파일까지 함께 내려받음)
+STYLESHEETS = [
+    'https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css',
+    'https://fonts.googleapis.com/css2?family=Montserrat:wght@400;700&display=swap',
+]
+
+# Google Fonts는 User-Agent에 따라 다른 CSS를 주므로 Chromium과 같은 값으로 요청 (woff2)
+BROWSER_USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+_IMPORT_RE = re.compile(r"@import\s+url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+_SRC_RE = re.compile(r"src\s*:\s*url\(\s*['\"]?([^'\")]+)['\"]?\s*\)")
+
+
+class AssetBundle:
+    """URL → 로컬 파일 (처음 요청될 때 읽어 메모리에 보관)"""
+
+    def __init__(self, root=DEFAULT_ASSET_DIR, offline=None):
+        """
+        Args:
+            root: 번들 디렉토리 (index.json 위치)
+            offline: True면 번들 필수 + 번들에 없는 http(s) 요청 차단
+                     (기본: KU_ASSETS_ONLINE=1이 아니면 True)
+        """
+        self.root = Path(root)
+        self.offline = os.environ.get(ONLINE_ENV) != '1' if offline is None else offline
+        self._bodies = {}
+
+        index_path = self.root / 'index.json'
+        if index_path.exists():
+            raw = index_path.read_bytes()
+            self.index = json.loads(raw)
+            self.version = hashlib.sha256(raw).hexdigest()[:16]
+        else:
+            self.index = {}
+            self.version = 'none'
+
+    @property
+    def available(self):
+        return bool(self.index)
+
+    def require(self):
+        """오프라인 렌더링인데 번들이 없으면 FileNotFoundError"""
+        if self.offline and not self.available:
+            raise FileNotFoundError(
+                f"로컬 자산 번들 없음: {self.root / 'index.json'} "
+                f"→ 인터넷이 되는 곳에서 python -m ku_common.assets 로 내려받아 복사 "
+                f"(네트워크 폰트로 렌더링하려면 {ONLINE_ENV}=1)"
+            )
+
+    def get(self, url):
+        """(본문 bytes, content_type), 번들에 없으면 None"""
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+        if url not in self._bodies:
+            self._bodies[url] = (self.root / entry['file']).read_bytes()
+        return self._bodies[url], entry['content_type']
+
+    async def handle(self, route):
+        """page.route 핸들러: 번들 응답 → (offline) 외부 요청 차단 → 나머지 통과"""
+        url = route.request.url
+        hit = self.get(url)
+        if hit is not None:
+            body, content_type = hit
+            await route.fulfill(status=200, body=body, content_type=content_type,
+                                headers={'Access-Control-Allow-Origin': '*'})
+        elif self.offline and url.startswith(('http://', 'https://')):
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+def _fetch(url):
+    request = urllib.request.Request(url, headers={'User-Agent': BROWSER_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        content_type = response.headers.get('Content-Type', 'application/octet-stream').split(';')[0]
+        return response.read(), content_type
+
+
+def download_bundle(root=DEFAULT_ASSET_DIR, stylesheets=STYLESHEETS):
+    """
+    스타일시트와 참조 자산(@import, @font-face src의 첫 번째 url = woff2)을 내려받아 번들 생성
+
+    Returns:
+        index {URL: {file, content_type}}
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    index, queue = {}, list(stylesheets)
+    while queue:
+        url = queue.pop(0)
+        if url in index:
+            continue
+
+        body, content_type = _fetch(url)
+        suffix = Path(url.split('?')[0]).suffix or ('.css' if content_type == 'text/css' else '')
+        file_name = hashlib.sha256(url.encode('utf-8')).hexdigest()[:20] + suffix
+        (root / file_name).write_bytes(body)
+        index[url] = {'file': file_name, 'content_type': content_type}
+        print(f"  ✓ {url} ({len(body) / 1024:.0f} KB)")
+
+        if content_type == 'text/css':
+            text = body.decode('utf-8')
+            # 브라우저는 src 목록의 첫 형식(woff2)을 사용 → 나머지(woff 등)는 받지 않음
+            queue.extend(urljoin(url, ref) for ref in _IMPORT_RE.findall(text) + _SRC_RE.findall(text))
+
+    with open(root / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return index
+
+
+def main():
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ASSET_DIR
+    print(f"웹 자산 번들 다운로드: {root}")
+    index = download_bundle(root)
+    total = sum((root / entry['file']).stat().st_size for entry in index.values()) / (1024 * 1024)
+    print(f"\n✓ {len(index)}개 파일 ({total:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
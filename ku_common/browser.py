@@ -0,0 +1,140 @@
+"""
+헤드리스 Chromium 세션 (HTML → PNG)
+
+슬라이드마다 Chrome 프로세스를 새로 띄우지 않고 브라우저 하나를 계속 실행한 채
+페이지 이동 + 스크린샷만 반복 (슬라이드당 브라우저 실행 ~1초 → 페이지 이동 수십 ms)
+
+- Playwright(sync API) 사용, 처음 변환할 때 브라우저 실행
+- 실행 파일: CHROME_PATH 환경 변수 → Playwright 내장 Chromium → 설치된 Chrome/Chromium
+  (Windows/macOS 기본 설치 경로, Linux는 PATH의 google-chrome/chromium 등)
+- Playwright가 없으면 sync_playwright가 None → 호출한 쪽에서 Chrome CLI로 대체
+
+사용 예:
+    with BrowserSession() as session:
+        session.screenshot(Path('output/slides/정서린_page_1_cover.html'), Path('out.png'))
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:  # Playwright 미설치 → Chrome CLI 사용
+    sync_playwright = None
+
+VIEWPORT = {'width': 1920, 'height': 1080}
+LAUNCH_ARGS = ['--hide-scrollbars', '--disable-gpu', '--no-first-run']
+
+# OS별 기본 설치 경로 (Linux는 PATH에서 실행 파일 이름으로 탐색)
+CHROME_PATHS = {
+    'win32': [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+    ],
+    'darwin': [
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        '/Applications/Chromium.app/Contents/MacOS/Chromium',
+    ],
+}
+CHROME_NAMES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+
+def chrome_candidates():
+    """Chrome/Chromium 후보 경로 목록 (확인 순서대로)"""
+    candidates = []
+    if os.environ.get('CHROME_PATH'):
+        candidates.append(os.environ['CHROME_PATH'])
+    candidates.extend(CHROME_PATHS.get(sys.platform, []))
+    candidates.extend(path for path in map(shutil.which, CHROME_NAMES) if path)
+    return candidates
+
+
+def find_chromium():
+    """설치된 Chrome/Chromium 실행 파일 경로 (없으면 None)"""
+    return next((path for path in chrome_candidates() if os.path.exists(path)), None)
+
+
+def launch_candidates():
+    """Playwright executable_path 시도 순서: CHROME_PATH → 내장 Chromium(None) → 설치된 Chrome"""
+    explicit = os.environ.get('CHROME_PATH')
+    attempts = [explicit] if explicit else []
+    attempts.append(None)
+    attempts.extend(path for path in chrome_candidates() if path != explicit and os.path.exists(path))
+    return attempts
+
+
+class BrowserSession:
+    """브라우저 하나 + 페이지 하나를 재사용하는 스크린샷 세션"""
+
+    def __init__(self, viewport=VIEWPORT, timeout=30):
+        """
+        Args:
+            viewport: 페이지 크기 {'width', 'height'}
+            timeout: 페이지 이동/스크린샷 제한 시간 (초)
+        """
+        if sync_playwright is None:
+            raise RuntimeError("Playwright가 설치되어 있지 않습니다 (pip install playwright)")
+
+        self.viewport = dict(viewport)
+        self.timeout_ms = timeout * 1000
+        self.executable_path = None
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    def _launch(self):
+        """CHROME_PATH → 내장 Chromium → 설치된 Chrome 순서로 실행 시도"""
+        error = None
+        for path in launch_candidates():
+            try:
+                browser = self._playwright.chromium.launch(headless=True, executable_path=path, args=LAUNCH_ARGS)
+            except Exception as e:  # 내장 Chromium 미설치(playwright install 안 함) 등
+                error = e
+                continue
+            self.executable_path = path or self._playwright.chromium.executable_path
+            return browser
+        raise RuntimeError(f"Chromium을 실행할 수 없습니다: {error}")
+
+    def start(self):
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            try:
+                self._browser = self._launch()
+            except Exception:
+                self.close()
+                raise
+        return self
+
+    def _get_page(self):
+        self.start()
+        if self._page is None or self._page.is_closed():
+            self._page = self._browser.new_page(viewport=self.viewport)
+            self._page.set_default_timeout(self.timeout_ms)
+        return self._page
+
+    def screenshot(self, html_path, output_path):
+        """HTML 파일로 이동 → 뷰포트 크기 PNG 저장 (실패 시 예외, 다음 호출은 새 페이지 사용)"""
+        page = self._get_page()
+        try:
+            page.goto(Path(html_path).resolve().as_uri(), wait_until='load')
+            page.screenshot(path=str(output_path), type='png')
+        except Exception:
+            page.close()
+            raise
+        return Path(output_path)
+
+    def close(self):
+        if self._browser is not None:
+            self._browser.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._playwright = self._browser = self._page = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
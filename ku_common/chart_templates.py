@@ -0,0 +1,345 @@
+"""
+미리 스타일을 적용한 차트 템플릿 (ku_annual Step 3)
+
+차트마다 figure와 twin 축을 새로 만들고 색상/폰트/축선/눈금 스타일을 다시 적용하는 대신
+종류별 figure를 한 번 만들어 두고 막대 높이, 선 데이터, 라벨만 바꿔서 저장
+
+- BarLineChart: 막대(경기수) + 선(승률) 이중 축 (월별 추세, 종족/맵/티어 비교, 주요 상대별 전적)
+- BarChart: 막대(승률) + 값 라벨 (성과 세부 내역)
+- 막대/값 라벨은 최대 개수(slots)만큼 미리 만들고 쓰지 않는 것은 숨김 (항목이 더 많으면 호출하는 쪽에서 더 큰 템플릿 사용)
+- 여백 배치(tight_layout)는 템플릿을 만들 때 한 번만 계산 (데이터와 무관 → 렌더링 순서와 관계없이 같은 결과)
+  저장은 기존처럼 bbox_inches='tight' → 라벨 길이가 달라도 잘리지 않음
+- pyplot을 거치지 않는 Figure 객체 → 프로세스 안에서 계속 재사용 (plt.close 불필요)
+- 캐시: digest() = 그리는 입력(템플릿 설정, 라벨/값/제목, 색상, dpi, TEMPLATE_VERSION, matplotlib/폰트)의 해시
+  ChartCache(<출력 디렉토리>/.chart_cache.json)에 같은 digest로 저장한 PNG가 그대로 있으면 savefig 생략
+  (PNG 내용 해시까지 확인 → 다른 스크립트가 덮어쓴 파일은 다시 렌더링)
+  기록은 메모리에만 모았다가 save() 한 번으로 목록 파일에 합침 (파일 잠금 안에서 최신 목록 읽기 → 합치기 → 교체)
+  병렬 렌더링 워커는 기록을 결과와 함께 돌려주고(take_recorded) 메인 프로세스가 merge 후 저장
+
+사용 예:
+    cache = ChartCache('output/charts')
+    chart = BarLineChart(colors, slots=5)
+    chart.update(['테란', '저그', '프로토스'], [40, 25, 31], [55.0, 40.0, 61.29], '종족별 전적 비교')
+    chart.save('output/charts/정서린_race_comparison.png', cache)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+from matplotlib.figure import Figure
+
+from ku_common import fonts
+from ku_common.match_store import file_sha256
+
+# 템플릿 모양(크기, 스타일, 라벨 위치 등)을 바꾸면 올림 (차트 캐시도 무효화)
+TEMPLATE_VERSION = 1
+
+SAVE_DPI = 150
+
+CHART_CACHE_NAME = '.chart_cache.json'
+CHART_CACHE_FORMAT_VERSION = 1
+
+
+def apply_style(fig, ax, colors):
+    """레퍼런스 스타일 적용 (배경, 축선, 눈금, 그리드)"""
+    fig.patch.set_facecolor(colors['bg_dark'])
+    ax.set_facecolor(colors['bg_dark'])
+
+    ax.spines['bottom'].set_color(colors['text_gray'])
+    ax.spines['left'].set_color(colors['text_gray'])
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    ax.tick_params(colors=colors['text_gray'], labelsize=10)
+
+    ax.grid(True, alpha=0.1, color=colors['text_gray'], linestyle='-', linewidth=0.5)
+    ax.set_axisbelow(True)
+
+
+def _json_value(value):
+    """numpy 스칼라 → 파이썬 값 (digest용 JSON 직렬화)"""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"digest에 쓸 수 없는 값: {value!r}")
+
+
+@contextmanager
+def _file_lock(path):
+    """프로세스 간 배타 잠금 (잠금용 파일, 목록을 읽고 합쳐 쓰는 동안 유지)"""
+    with open(path, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _axis_label(ax, text, colors, axis='y'):
+    setter = ax.set_ylabel if axis == 'y' else ax.set_xlabel
+    setter(text, color=colors['text_white'], fontsize=12, fontweight='bold')
+
+
+class ChartCache:
+    """출력 디렉토리의 차트 캐시 목록 {PNG 파일 이름: {digest, sha256}}"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.index_path = self.directory / CHART_CACHE_NAME
+        self.lock_path = self.directory / f'{CHART_CACHE_NAME}.lock'
+        self._entries = self._load()
+        # 아직 저장하지 않은 기록 (저장 시 파일의 최신 목록에 합침)
+        self._recorded = {}
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CHART_CACHE_FORMAT_VERSION:
+                return data['charts']
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def hit(self, path, digest):
+        """같은 digest로 저장한 PNG가 내용 그대로 있는지"""
+        path = Path(path)
+        entry = self._entries.get(path.name)
+        return (entry is not None and entry['digest'] == digest
+                and path.exists() and file_sha256(path) == entry['sha256'])
+
+    def record(self, path, digest):
+        """렌더링한 PNG 기록 (메모리에만, save()에서 파일에 반영)"""
+        path = Path(path)
+        entry = {'digest': digest, 'sha256': file_sha256(path)}
+        self._entries[path.name] = self._recorded[path.name] = entry
+
+    def take_recorded(self):
+        """저장하지 않은 기록을 꺼냄 (워커 → 메인 프로세스 전달용, 꺼낸 기록은 이 객체에서 저장하지 않음)"""
+        recorded, self._recorded = self._recorded, {}
+        return recorded
+
+    def merge(self, entries):
+        """다른 프로세스에서 받은 기록 추가 (다음 save()에서 저장)"""
+        self._entries.update(entries)
+        self._recorded.update(entries)
+
+    def save(self):
+        """기록을 목록 파일에 합쳐 저장 (잠금 안에서 최신 목록 기준 → 동시에 저장해도 다른 프로세스 항목 유지)"""
+        if not self._recorded:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.lock_path):
+            entries = self._load()
+            entries.update(self._recorded)
+            tmp_path = self.index_path.with_name(f'{self.index_path.name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CHART_CACHE_FORMAT_VERSION, 'charts': dict(sorted(entries.items()))},
+                          f, ensure_ascii=False, indent=1)
+            tmp_path.replace(self.index_path)
+        self._recorded = {}
+
+    def clear(self):
+        """목록 삭제 (다음 저장은 모두 다시 렌더링)"""
+        self._entries, self._recorded = {}, {}
+        self.index_path.unlink(missing_ok=True)
+
+
+class _ChartTemplate:
+    """템플릿 공통: 여백 배치, 항목 수 확인, 캐시 키, 저장"""
+
+    def __init__(self, colors, figsize, slots, **options):
+        self.colors = colors
+        self.slots = slots
+        self.fig = Figure(figsize=figsize)
+        # 템플릿 설정 + 마지막 update 입력 → digest
+        self.spec = {'template': type(self).__name__, 'figsize': list(figsize), 'slots': slots, **options}
+        self.data = None
+
+    def _layout(self, title):
+        """여백 배치 (제목 자리를 포함하도록 임시 제목으로 계산)"""
+        title.set_text('제목')
+        self.fig.tight_layout()
+        title.set_text('')
+
+    def _check(self, labels):
+        if len(labels) > self.slots:
+            raise ValueError(f"항목 {len(labels)}개 > 템플릿 최대 {self.slots}개")
+
+    def _show_bars(self, bars, values):
+        for i, bar in enumerate(bars):
+            bar.set_visible(i < len(values))
+            bar.set_height(values[i] if i < len(values) else 0)
+
+    def digest(self):
+        """현재 그림의 입력 해시 (템플릿 설정, update 입력, 색상, dpi, 버전, matplotlib/폰트)"""
+        key = {
+            'version': TEMPLATE_VERSION,
+            'dpi': SAVE_DPI,
+            'matplotlib': matplotlib.__version__,
+            'font': fonts.font_signature(),
+            'colors': self.colors,
+            'spec': self.spec,
+            'data': self.data,
+        }
+        raw = json.dumps(key, ensure_ascii=False, sort_keys=True, default=_json_value)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def save(self, output_path, cache=None):
+        """
+        PNG 저장
+
+        Args:
+            cache: ChartCache (같은 digest의 PNG가 있으면 savefig 생략, 렌더링하면 기록)
+
+        Returns:
+            렌더링했으면 True, 캐시를 재사용했으면 False
+        """
+        digest = self.digest() if cache is not None else None
+        if cache is not None and cache.hit(output_path, digest):
+            return False
+
+        self.fig.savefig(output_path, dpi=SAVE_DPI, facecolor=self.colors['bg_dark'],
+                         edgecolor='none', bbox_inches='tight')
+        if cache is not None:
+            cache.record(output_path, digest)
+        return True
+
+
+class BarLineChart(_ChartTemplate):
+    """막대(경기수, 왼쪽 축) + 선(승률 0~100, 오른쪽 축)"""
+
+    def __init__(self, colors, figsize=(10, 6), slots=5, bar_width=0.5, xlabel=None, value_labels=True):
+        """
+        Args:
+            colors: 색상 {'bg_dark', 'text_white', 'text_gray', 'bar_gray', 'line_blue', ...}
+            slots: 최대 항목 수
+            bar_width: 막대 폭
+            xlabel: x축 제목 (없으면 표시 안 함)
+            value_labels: 막대 위 경기수/선 위 승률 표시
+        """
+        super().__init__(colors, figsize, slots, bar_width=bar_width, xlabel=xlabel, value_labels=value_labels)
+        self.value_labels = value_labels
+
+        self.ax1 = self.fig.subplots()
+        self.bars = self.ax1.bar(np.arange(slots), np.zeros(slots), bar_width,
+                                 color=colors['bar_gray'], alpha=0.7, label='경기수')
+        if xlabel:
+            _axis_label(self.ax1, xlabel, colors, axis='x')
+        _axis_label(self.ax1, '경기수', colors)
+
+        self.ax2 = self.ax1.twinx()
+        self.line, = self.ax2.plot([], [], color=colors['line_blue'],
+                                   marker='o', linewidth=2.5, markersize=8, label='승률')
+        _axis_label(self.ax2, '승률 (%)', colors)
+        self.ax2.set_ylim(0, 100)
+
+        self.bar_texts = [self.ax1.text(0, 0, '', ha='center', va='bottom', color=colors['text_gray'],
+                                        fontsize=10) for _ in range(slots)]
+        self.line_texts = [self.ax2.text(0, 0, '', ha='center', va='bottom', color=colors['line_blue'],
+                                         fontsize=11, fontweight='bold') for _ in range(slots)]
+
+        apply_style(self.fig, self.ax1, colors)
+        self.ax2.spines['bottom'].set_color(colors['text_gray'])
+        self.ax2.spines['right'].set_color(colors['text_gray'])
+        self.ax2.spines['top'].set_visible(False)
+        self.ax2.spines['left'].set_visible(False)
+        self.ax2.tick_params(colors=colors['text_gray'], labelsize=10)
+
+        self.title = self.ax2.set_title('', color=colors['text_white'], fontsize=16, fontweight='bold', pad=20)
+        self._layout(self.title)
+
+    def update(self, labels, games, win_rates, title, show=None):
+        """
+        Args:
+            labels: x축 항목 이름
+            games: 항목별 경기수 (막대)
+            win_rates: 항목별 승률 (선)
+            title: 차트 제목
+            show: 항목별 값 라벨 표시 여부 (기본 모두, 예: 경기 없는 티어는 숨김)
+        """
+        self._check(labels)
+        n = len(labels)
+        show = show if show is not None else [True] * n
+        x = np.arange(n)
+        self.data = {'labels': list(labels), 'games': list(games), 'win_rates': list(win_rates),
+                     'title': title, 'show': list(show)}
+
+        self._show_bars(self.bars, games)
+        self.line.set_data(x, win_rates)
+        self.ax1.set_xticks(x)
+        self.ax1.set_xticklabels(labels)
+
+        max_games = max(games) if games else 1
+        for i, (bar_text, line_text) in enumerate(zip(self.bar_texts, self.line_texts)):
+            visible = self.value_labels and i < n and show[i]
+            bar_text.set_visible(visible)
+            line_text.set_visible(visible)
+            if visible:
+                bar_text.set_position((i, games[i] + max_games * 0.02))
+                bar_text.set_text(f'{games[i]}경기')
+                line_text.set_position((i, win_rates[i] + 3))
+                line_text.set_text(f'{win_rates[i]}%')
+
+        self.title.set_text(title)
+
+        # 보이는 막대/선 기준으로 축 범위 다시 계산 (승률 축은 0~100 고정)
+        self.ax1.relim(visible_only=True)
+        self.ax2.relim(visible_only=True)
+        self.ax1.autoscale_view()
+        return self
+
+
+class BarChart(_ChartTemplate):
+    """막대(승률 0~100) + 막대 위 '승률%\\n(경기수)' 라벨"""
+
+    def __init__(self, colors, figsize=(10, 6), slots=2, bar_width=0.5):
+        super().__init__(colors, figsize, slots, bar_width=bar_width)
+
+        self.ax = self.fig.subplots()
+        self.bars = self.ax.bar(np.arange(slots), np.zeros(slots), bar_width, color=colors['bar_gray'], alpha=0.8)
+        self.texts = [self.ax.text(0, 0, '', ha='center', va='bottom', color=colors['text_white'],
+                                   fontsize=11, fontweight='bold') for _ in range(slots)]
+        _axis_label(self.ax, '승률 (%)', colors)
+        self.ax.set_ylim(0, 100)
+
+        apply_style(self.fig, self.ax, colors)
+        self.title = self.ax.set_title('', color=colors['text_white'], fontsize=16, fontweight='bold', pad=20)
+        self._layout(self.title)
+
+    def update(self, labels, win_rates, games, title):
+        self._check(labels)
+        n = len(labels)
+        x = np.arange(n)
+        self.data = {'labels': list(labels), 'win_rates': list(win_rates), 'games': list(games), 'title': title}
+
+        self._show_bars(self.bars, win_rates)
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels(labels)
+
+        for i, text in enumerate(self.texts):
+            text.set_visible(i < n)
+            if i < n:
+                text.set_position((i, win_rates[i] + 2))
+                text.set_text(f'{win_rates[i]}%\n({games[i]}경기)')
+
+        self.title.set_text(title)
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        return self
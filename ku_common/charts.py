@@ -0,0 +1,108 @@
+"""
+matplotlib 차트 렌더링 공용 (ku_annual Step 3)
+
+pyplot 상태 머신은 스레드 안전하지 않으므로 병렬 렌더링은 프로세스 풀 사용
+- 워커마다 한 번: Agg 백엔드 + 한글 폰트 설정(ku_common.fonts), 차트 생성기 스크립트 로드,
+  멤버별 데이터 묶음(pickle 가능한 dict)으로 생성기 준비 → 워커에서 워크북/큐브를 읽지 않음
+- 작업 단위: (멤버, 차트 종류), chunksize로 묶어 워커에 배분
+- 차트마다 소요 시간 측정 → 차트 종류별 합계/평균/최대 보고
+- 차트 캐시 기록은 워커가 결과와 함께 돌려주고 메인 프로세스의 ChartCache에 합침 (워커는 목록 파일을 쓰지 않음)
+
+사용 예:
+    bundles = {member: generator.member_bundle(member) for member in members}
+    for member, chart, path, seconds in render_charts(script, 'ChartGenerator', bundles, out_dir, jobs, 4):
+        print(member, chart, f"{seconds:.2f}초")
+"""
+
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ku_common import fonts  # 프로젝트 폰트 캐시 지정 (matplotlib import 전)
+
+import matplotlib
+
+# 워커 프로세스의 차트 생성기 (_init_worker에서 한 번 생성)
+_generator = None
+
+
+def setup_matplotlib():
+    """Agg 백엔드 + 한글 폰트 설정 (프로세스마다 차트 생성 전에 한 번)"""
+    matplotlib.use('Agg')
+    fonts.bootstrap_matplotlib()
+    matplotlib.rcParams['axes.unicode_minus'] = False
+
+
+def load_script(script_path):
+    """단계 스크립트를 모듈로 로드 (파일명이 숫자로 시작해 일반 import 불가)"""
+    script_path = Path(script_path)
+    module_name = 'ku_chart_' + script_path.stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed_chart(generator, member_name, chart_name):
+    """차트 하나 생성 → (멤버, 차트, 경로, 소요 초)"""
+    start = time.perf_counter()
+    path = generator.generate_chart(member_name, chart_name)
+    return member_name, chart_name, path, time.perf_counter() - start
+
+
+def _init_worker(script_path, class_name, bundles, output_dir):
+    global _generator
+    # 차트별 진행/폰트 경고 출력은 메인 프로세스에서 (워커 출력이 섞이지 않도록)
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    setup_matplotlib()
+    _generator = getattr(load_script(script_path), class_name).from_bundles(bundles, output_dir)
+
+
+def _render_job(job):
+    return *timed_chart(_generator, *job), _generator.chart_cache.take_recorded()
+
+
+def render_charts(script_path, class_name, bundles, output_dir, jobs, workers, cache=None):
+    """
+    (멤버, 차트) 작업을 프로세스 풀에서 렌더링 (제너레이터, 입력 순서대로 결과)
+
+    Args:
+        script_path: 차트 생성기 스크립트 경로 (워커에서 로드)
+        class_name: 생성기 클래스 이름 (from_bundles(bundles, output_dir) 필요)
+        bundles: {멤버: 데이터 묶음}
+        jobs: [(멤버, 차트 종류), ...]
+        workers: 프로세스 수
+        cache: 워커의 차트 캐시 기록을 합칠 ChartCache (저장은 호출하는 쪽에서 save())
+
+    Yields:
+        (멤버, 차트, 경로, 소요 초)
+    """
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(script_path), class_name, bundles, str(output_dir))) as pool:
+        for *result, recorded in pool.map(_render_job, jobs, chunksize=chunksize):
+            if cache is not None:
+                cache.merge(recorded)
+            yield tuple(result)
+
+
+def print_chart_timings(timings, elapsed):
+    """
+    차트 종류별 소요 시간 출력
+
+    Args:
+        timings: {차트 종류: [소요 초, ...]}
+        elapsed: 전체 경과 시간 (초)
+    """
+    total = sum(sum(values) for values in timings.values())
+    print(f"\n[차트별 소요 시간] 전체 {elapsed:.1f}초 (차트 합계 {total:.1f}초)")
+    for chart_name, values in sorted(timings.items(), key=lambda item: -sum(item[1])):
+        print(f"  - {chart_name}: {len(values)}개, 합계 {sum(values):.1f}초, "
+              f"평균 {sum(values) / len(values):.2f}초, 최대 {max(values):.2f}초")
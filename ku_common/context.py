@@ -0,0 +1,99 @@
+"""
+파이프라인 공유 컨텍스트
+
+ku_annual Step 2~5를 한 프로세스에서 실행할 때 워크북/큐브/Step 1 결과 JSON/멤버별 분석을
+한 번만 읽어 모든 단계가 같이 쓰도록 하는 객체
+
+- 처음 접근할 때 읽고 이후에는 메모리 값을 반환 (단독 실행 시에도 같은 방식으로 동작)
+- Step 2 결과(멤버별 분석)는 set_analysis()로 넣어 두면 Step 4가 파일을 다시 읽지 않음
+- 경로는 base_dir(ku_annual) 기준
+
+사용 예:
+    context = PipelineContext(Path('ku_annual'))
+    context.member_stats['정서린']['overall']
+    context.analysis('정서린')['comments']
+"""
+
+import json
+from pathlib import Path
+
+from ku_common.match_store import load_matches
+from ku_common.schema import to_match_table
+from ku_common.cube import cube_for_workbook
+from ku_common.opponents import TopOpponents
+
+DEFAULT_EXCEL_NAME = 'kuniv_2025_data.xlsx'
+
+
+class PipelineContext:
+    """Step 2~5 공유 데이터 (지연 로드 + 메모리 캐시)"""
+
+    def __init__(self, base_dir='.', excel_name=DEFAULT_EXCEL_NAME):
+        """
+        Args:
+            base_dir: ku_annual 디렉토리 (워크북, output/ 위치)
+            excel_name: 경기 기록 워크북 파일명
+        """
+        self.base_dir = Path(base_dir)
+        self.excel_path = self.base_dir / excel_name
+        self.data_dir = self.base_dir / 'output' / 'data'
+        self.analysis_dir = self.base_dir / 'output' / 'analysis'
+
+        self._cache = {}
+        self._analyses = {}
+
+    def _cached(self, key, loader):
+        if key not in self._cache:
+            self._cache[key] = loader()
+        return self._cache[key]
+
+    def _load_json(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @property
+    def table(self):
+        """경기 테이블 (schema.to_match_table 결과, 공유 객체이므로 컬럼 추가 시 copy() 후 사용)"""
+        return self._cached('table', lambda: to_match_table(load_matches(self.excel_path)))
+
+    @property
+    def cube(self):
+        """승/패 카운트 큐브 (전체 기간)"""
+        return self._cached('cube', lambda: cube_for_workbook(self.excel_path))
+
+    @property
+    def top_opponents(self):
+        """멤버별 주요 상대 표 (상대 종족/맵/동일 티어별 경기수 상위 5명, 차트와 슬라이드 공용)"""
+        return self._cached('top_opponents', lambda: TopOpponents(self.cube))
+
+    @property
+    def tier_history(self):
+        return self._cached('tier_history', lambda: self._load_json(self.data_dir / 'tier_history.json'))
+
+    @property
+    def team_stats(self):
+        return self._cached('team_stats', lambda: self._load_json(self.data_dir / 'team_statistics.json'))
+
+    @property
+    def member_stats(self):
+        return self._cached('member_stats', lambda: self._load_json(self.data_dir / 'member_statistics.json'))
+
+    @property
+    def members(self):
+        """멤버 목록 (member_statistics.json 순서)"""
+        return list(self.member_stats.keys())
+
+    def analysis(self, member_name):
+        """멤버 분석 결과 (Step 2 결과가 메모리에 없으면 output/analysis/에서 로드)"""
+        if member_name not in self._analyses:
+            self._analyses[member_name] = self._load_json(
+                self.analysis_dir / f'{member_name}_analysis.json'
+            )
+        return self._analyses[member_name]
+
+    def set_analysis(self, member_name, analysis):
+        """Step 2에서 만든 분석 결과 등록 (파일 저장은 호출한 쪽에서 처리)
+
+        JSON 저장본을 다시 읽은 것과 같은 형태(문자열 키, 리스트)로 변환해 보관
+        """
+        self._analyses[member_name] = json.loads(json.dumps(analysis, ensure_ascii=False))
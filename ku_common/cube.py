@@ -0,0 +1,292 @@
+"""
+승/패 카운트 큐브
+
+(멤버, 상대 종족, 맵, 상대, 티어, 구분, 월 ...) 축 조합별 경기수/승수를 한 번만 집계해 두고,
+드릴다운 질의를 DataFrame 필터링 대신 정수 코드 배열 비교로 처리
+
+- 희소 저장: 실제 등장한 축 조합(셀)만 보관 (상대처럼 값이 많은 축도 행 수 이하)
+- 셀마다 첫/마지막 행 위치를 함께 저장해 value_counts() 동점 순서, iloc[0] 값까지 재현
+- dense(): 저카디널리티 축 조합을 numpy 배열로 펼쳐서 슬라이싱 (예: 멤버 티어 × 상대 티어)
+- cube_for_workbook(): 워크북 내용 해시 + 기간별로 .cache/에 npz로 저장 후 재사용
+
+사용 예:
+    cube = cube_for_workbook('ku_records.xlsx', '2025-01-01', '2025-12-31')
+    cube.stats(member='정서린', opp_race='테란')            # WinLoss(games, wins, ...)
+    cube.breakdown('map', member='정서린', opp_race='테란')  # 맵별, 경기수 내림차순
+"""
+
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ku_common.match_store import load_matches, workbook_version, cache_dir_for
+from ku_common.schema import to_match_table
+
+CUBE_FORMAT_VERSION = 1
+
+# 축 이름: 경기 테이블 컬럼 ('month'는 날짜에서 'YYYY-MM'으로 파생)
+AXES = {
+    'member': '멤버 이름',
+    'opp_race': '상대 종족',
+    'map': '맵',
+    'opponent': '상대',
+    'member_tier': '멤버 티어',
+    'opp_tier': '상대 티어',
+    'type': '구분2',
+    'event': '구분',
+    'month': '날짜',
+}
+
+# 테이블에 컬럼이 있을 때만 추가되는 축 (tiers.matchup_column 결과)
+OPTIONAL_AXES = {
+    'matchup': 'matchup',
+}
+
+CubeEntry = namedtuple('CubeEntry', ['value', 'games', 'wins', 'first_row', 'last_row', 'first_cell'])
+
+# 프로세스 내 메모리 캐시: {(워크북 경로, 기간, 해시): WinLossCube}
+_memory_cache = {}
+
+
+def _is_missing(label):
+    return label is None or (isinstance(label, float) and np.isnan(label))
+
+
+class WinLossCube:
+    """축 조합(셀)별 경기수/승수 희소 큐브"""
+
+    def __init__(self, axes, labels, codes, games, wins, first_row, last_row):
+        """
+        Args:
+            axes: 축 이름 목록
+            labels: {축 이름: 라벨 목록 (빈 값은 None)}
+            codes: (셀 수 × 축 수) 정수 코드 배열
+            games / wins / first_row / last_row: 셀별 값 배열
+        """
+        self.axes = list(axes)
+        self.labels = {axis: list(labels[axis]) for axis in self.axes}
+        self.codes = np.asarray(codes, dtype=np.int32).reshape(len(games), len(self.axes))
+        self.games = np.asarray(games, dtype=np.int64)
+        self.wins = np.asarray(wins, dtype=np.int64)
+        self.first_row = np.asarray(first_row, dtype=np.int64)
+        self.last_row = np.asarray(last_row, dtype=np.int64)
+
+        self._axis_index = {axis: i for i, axis in enumerate(self.axes)}
+        self._code_of = {
+            axis: {label: code for code, label in enumerate(self.labels[axis]) if not _is_missing(label)}
+            for axis in self.axes
+        }
+
+    @classmethod
+    def from_table(cls, table, axes=None):
+        """경기 테이블(schema.to_match_table 결과)에서 큐브 생성"""
+        if axes is None:
+            axes = dict(AXES)
+            axes.update({name: col for name, col in OPTIONAL_AXES.items() if col in table.columns})
+
+        columns, labels = {}, {}
+        for axis, col in axes.items():
+            if axis == 'month':
+                values = table[col].dt.strftime('%Y-%m')
+            else:
+                values = table[col]
+            codes, uniques = pd.factorize(values.to_numpy(dtype=object), use_na_sentinel=False)
+            columns[axis] = codes.astype(np.int32)
+            labels[axis] = [None if _is_missing(label) else label for label in uniques]
+
+        frame = pd.DataFrame(columns)
+        frame['win'] = table['win'].to_numpy()
+        frame['row'] = np.arange(len(table))
+
+        cells = frame.groupby(list(axes), sort=False).agg(
+            games=('win', 'size'),
+            wins=('win', 'sum'),
+            first_row=('row', 'min'),
+            last_row=('row', 'max'),
+        ).reset_index()
+
+        return cls(list(axes), labels, cells[list(axes)].to_numpy(), cells['games'], cells['wins'],
+                   cells['first_row'], cells['last_row'])
+
+    # ---- 저장/로드 ----
+
+    def save(self, path, key=''):
+        """npz로 저장 (key: 데이터 버전 확인용 문자열)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {'version': CUBE_FORMAT_VERSION, 'key': key, 'axes': self.axes, 'labels': self.labels}
+        tmp_path = path.with_name(path.stem + '.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            codes=self.codes, games=self.games, wins=self.wins,
+            first_row=self.first_row, last_row=self.last_row,
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path, key=None):
+        """npz 로드 (key가 다르거나 형식 버전이 다르면 None)"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('version') != CUBE_FORMAT_VERSION or (key is not None and meta.get('key') != key):
+                    return None
+                return cls(meta['axes'], meta['labels'], data['codes'], data['games'], data['wins'],
+                           data['first_row'], data['last_row'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    # ---- 질의 ----
+
+    def column(self, axis):
+        """셀별 축 코드 배열"""
+        return self.codes[:, self._axis_index[axis]]
+
+    def label(self, axis, cell):
+        """셀의 축 라벨"""
+        return self.labels[axis][self.codes[cell, self._axis_index[axis]]]
+
+    def mask(self, **filters):
+        """필터 조건에 맞는 셀 마스크
+
+        값은 라벨 하나 또는 라벨 목록 (목록이면 그중 하나와 일치)
+        """
+        mask = np.ones(len(self.games), dtype=bool)
+        for axis, value in filters.items():
+            code_of = self._code_of[axis]
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            codes = [code_of[v] for v in values if v in code_of]
+            mask &= np.isin(self.column(axis), codes)
+        return mask
+
+    def same(self, axis_a, axis_b):
+        """두 축 라벨이 같은 셀 마스크 (빈 값끼리는 다른 값으로 취급)"""
+        code_of_b = self._code_of[axis_b]
+        a_to_b = np.array([code_of_b.get(label, -1) if not _is_missing(label) else -1
+                           for label in self.labels[axis_a]], dtype=np.int64)
+        if len(a_to_b) == 0:
+            return np.zeros(len(self.games), dtype=bool)
+        mapped = a_to_b[self.column(axis_a)]
+        return (mapped >= 0) & (mapped == self.column(axis_b))
+
+    def stats(self, cells=None, **filters):
+        """조건에 맞는 전체 경기수/승수
+
+        Returns:
+            CubeEntry (value=None)
+        """
+        mask = self.mask(**filters)
+        if cells is not None:
+            mask &= cells
+        if not mask.any():
+            return CubeEntry(None, 0, 0, -1, -1, -1)
+
+        first_cell = int(np.flatnonzero(mask)[np.argmin(self.first_row[mask])])
+        return CubeEntry(None, int(self.games[mask].sum()), int(self.wins[mask].sum()),
+                         int(self.first_row[mask].min()), int(self.last_row[mask].max()), first_cell)
+
+    def breakdown(self, axis, ranked=True, cells=None, **filters):
+        """조건에 맞는 경기를 axis 값별로 집계
+
+        Args:
+            ranked: True면 경기수 내림차순 (동점은 첫 등장 순서, value_counts()와 동일),
+                    False면 첫 등장 순서 (unique()와 동일)
+            cells: 추가 셀 마스크 (예: same('member_tier', 'opp_tier'))
+
+        Returns:
+            [CubeEntry(value, games, wins, first_row, last_row, first_cell), ...]
+            first_cell: 해당 값이 처음 등장한 행이 속한 셀 (label()로 다른 축 값 조회)
+        """
+        mask = self.mask(**filters)
+        if cells is not None:
+            mask &= cells
+
+        idx = np.flatnonzero(mask)
+        if len(idx) == 0:
+            return []
+
+        values = self.column(axis)[idx]
+        size = len(self.labels[axis])
+        games = np.bincount(values, weights=self.games[idx], minlength=size).astype(np.int64)
+        wins = np.bincount(values, weights=self.wins[idx], minlength=size).astype(np.int64)
+
+        first_row = np.full(size, np.iinfo(np.int64).max)
+        np.minimum.at(first_row, values, self.first_row[idx])
+        last_row = np.full(size, -1, dtype=np.int64)
+        np.maximum.at(last_row, values, self.last_row[idx])
+
+        # 값별 첫 등장 셀: 첫 행 위치 순으로 정렬 후 값마다 첫 번째
+        by_first = idx[np.argsort(self.first_row[idx], kind='stable')]
+        first_values, pos = np.unique(self.column(axis)[by_first], return_index=True)
+        first_cell = np.full(size, -1, dtype=np.int64)
+        first_cell[first_values] = by_first[pos]
+
+        present = np.flatnonzero(games > 0)
+        present = present[np.argsort(first_row[present], kind='stable')]
+        if ranked:
+            present = present[np.argsort(-games[present], kind='stable')]
+
+        labels = self.labels[axis]
+        return [
+            CubeEntry(labels[code], int(games[code]), int(wins[code]),
+                      int(first_row[code]), int(last_row[code]), int(first_cell[code]))
+            for code in present
+        ]
+
+    def dense(self, axes, cells=None, **filters):
+        """선택한 축들로 펼친 (경기수, 승수) numpy 배열
+
+        Returns:
+            (games, wins): shape = 각 축 라벨 수
+        """
+        mask = self.mask(**filters)
+        if cells is not None:
+            mask &= cells
+
+        shape = tuple(len(self.labels[axis]) for axis in axes)
+        index = tuple(self.column(axis)[mask] for axis in axes)
+        games = np.zeros(shape, dtype=np.int64)
+        wins = np.zeros(shape, dtype=np.int64)
+        np.add.at(games, index, self.games[mask])
+        np.add.at(wins, index, self.wins[mask])
+        return games, wins
+
+
+def cube_for_workbook(excel_path, start=None, end=None, cache_dir=None):
+    """워크북(기간 선택)의 큐브 반환 - 워크북 내용이 같으면 저장된 큐브 재사용
+
+    Args:
+        excel_path: 워크북 경로
+        start / end: 기간 필터 ('YYYY-MM-DD', 양 끝 포함), None이면 전체
+        cache_dir: 캐시 디렉토리 (기본: 워크북 옆 .cache/)
+    """
+    excel_path = Path(excel_path).resolve()
+    period = f"{start or 'all'}_{end or 'all'}"
+    key = f"{workbook_version(excel_path, cache_dir)}:{period}"
+
+    memo_key = (str(excel_path), period)
+    cached = _memory_cache.get(memo_key)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    cube_path = cache_dir_for(excel_path, cache_dir) / f"{excel_path.stem}.cube.{period.replace('-', '')}.npz"
+    cube = WinLossCube.load(cube_path, key) if cube_path.exists() else None
+
+    if cube is None:
+        table = to_match_table(load_matches(excel_path, cache_dir))
+        if start:
+            table = table[table['날짜'] >= start]
+        if end:
+            table = table[table['날짜'] <= end]
+        cube = WinLossCube.from_table(table.reset_index(drop=True))
+        try:
+            cube.save(cube_path, key)
+        except OSError as e:
+            print(f"  ! 큐브 캐시 저장 실패: {e}")
+
+    _memory_cache[memo_key] = (key, cube)
+    return cube
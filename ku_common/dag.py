@@ -0,0 +1,314 @@
+"""
+입력 지문 기반 증분 빌드 그래프 (make 방식)
+
+노드마다 입력(파일, 소스 코드 같은 값)과 출력 파일을 선언하고, 지난 빌드 때의
+입력 지문과 같고 출력도 그대로면 건너뜀
+
+- 파일 지문: SHA-256 (크기/mtime이 지난번과 같으면 해시 재계산 생략)
+- 값 지문: 문자열(예: 템플릿 메서드 소스)의 SHA-256
+- 판단 시점: 선행 노드 실행 후 (다시 만든 결과가 이전과 같으면 후속 노드는 건너뜀)
+- 다시 만든 이유를 노드마다 기록 (새 노드, 입력 변경, 출력 없음, 출력 외부 수정, 강제)
+- 실패한 노드의 후속 노드는 실행하지 않음
+- workers > 1: 프로세스 풀에서 준비된 노드를 동시에 실행 (자원 종류별 동시 실행 수 제한,
+  등록 순서가 빠른 노드 우선 → 앞 멤버의 후속 단계가 뒤 멤버의 앞 단계와 겹쳐 실행)
+  action은 pickle 가능한 호출 객체여야 함 (람다/지역 함수 불가)
+
+사용 예:
+    graph = BuildGraph('output/.build_state.json')
+    graph.add(BuildNode('analysis:정서린', action, inputs=[workbook], outputs=[json_path]))
+    graph.add(BuildNode('slide:정서린:page_4', action, inputs=[json_path],
+                        values={'template': source}, deps=['analysis:정서린']))
+    report = graph.run()
+"""
+
+import hashlib
+import heapq
+import json
+from collections import namedtuple, Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+from ku_common.match_store import workbook_fingerprint
+
+STATE_FORMAT_VERSION = 1
+
+BuildReport = namedtuple('BuildReport', ['rebuilt', 'skipped', 'failed', 'blocked'])
+
+
+def _value_hash(value):
+    return hashlib.sha256(str(value).encode('utf-8')).hexdigest()
+
+
+class BuildNode:
+    """빌드 그래프 노드"""
+
+    def __init__(self, name, action, inputs=(), outputs=(), values=None, deps=(), group=None,
+                 resource='cpu'):
+        """
+        Args:
+            name: 노드 이름 (그래프 내 고유)
+            action: 인자 없는 실행 함수
+            inputs: 입력 파일 경로 목록
+            outputs: 출력 파일 경로 목록
+            values: {라벨: 문자열} 파일이 아닌 입력 (템플릿 소스 등)
+            deps: 먼저 실행해야 하는 노드 이름 목록
+            group: 보고용 단계 이름 (예: 'Step 3')
+            resource: 자원 종류 (병렬 실행 시 종류별 동시 실행 수 제한, 예: 'cpu', 'browser')
+        """
+        self.name = name
+        self.action = action
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.values = dict(values or {})
+        self.deps = list(deps)
+        self.group = group
+        self.resource = resource
+
+
+class BuildGraph:
+    """노드 등록 → 위상 순서 실행 (입력 지문이 같으면 건너뜀)"""
+
+    def __init__(self, state_path):
+        self.state_path = Path(state_path)
+        self.nodes = {}
+        self._state = self._load_state()
+        self._files = self._state['files']
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_FORMAT_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'version': STATE_FORMAT_VERSION, 'files': {}, 'nodes': {}}
+
+    def save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False, indent=1)
+        tmp_path.replace(self.state_path)
+
+    def add(self, node):
+        if node.name in self.nodes:
+            raise ValueError(f"중복 노드: {node.name}")
+        self.nodes[node.name] = node
+        return node
+
+    # ---- 지문 ----
+
+    def file_hash(self, path):
+        """파일 SHA-256 (없으면 None, 크기/mtime이 같으면 저장된 해시 재사용)"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        key = str(path.resolve())
+        fingerprint = workbook_fingerprint(path, self._files.get(key))
+        self._files[key] = fingerprint
+        return fingerprint['sha256']
+
+    def input_fingerprint(self, node):
+        """{입력 라벨: 해시} (파일은 경로, 값은 'value:라벨')"""
+        fingerprint = {str(path): self.file_hash(path) for path in node.inputs}
+        fingerprint.update({f'value:{label}': _value_hash(value) for label, value in node.values.items()})
+        return fingerprint
+
+    def rebuild_reasons(self, node, inputs):
+        """다시 만들어야 하는 이유 목록 (비어 있으면 건너뜀)"""
+        record = self._state['nodes'].get(node.name)
+        if record is None:
+            return ['새 노드']
+
+        reasons = []
+        changed = sorted(key for key in set(inputs) | set(record['inputs'])
+                         if inputs.get(key) != record['inputs'].get(key))
+        if changed:
+            reasons.append('입력 변경: ' + ', '.join(Path(key).name if not key.startswith('value:') else key
+                                                    for key in changed))
+
+        # 지난 실행에서도 만들지 않은 출력(데이터가 없어 건너뛴 차트 등)은 없어도 정상
+        for path in node.outputs:
+            current = self.file_hash(path)
+            if current == record['outputs'].get(str(path)):
+                continue
+            reasons.append(f'출력 없음: {path.name}' if current is None else f'출력 외부 수정: {path.name}')
+
+        return reasons
+
+    # ---- 실행 ----
+
+    def order(self):
+        """위상 정렬 (등록 순서 유지)"""
+        ordered, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성: {name}")
+            visiting.add(name)
+            for dep in self.nodes[name].deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"없는 선행 노드: {name} → {dep}")
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(self.nodes[name])
+
+        for name in self.nodes:
+            visit(name)
+        return ordered
+
+    def record(self, node, inputs):
+        """노드 실행 성공 기록 (입력 지문 + 출력 해시)"""
+        self._state['nodes'][node.name] = {
+            'inputs': inputs,
+            'outputs': {str(path): self.file_hash(path) for path in node.outputs},
+        }
+
+    def run(self, force=False, verbose=True, workers=1, limits=None):
+        """
+        그래프 실행
+
+        Args:
+            force: True면 지문과 관계없이 모든 노드 실행
+            workers: 1보다 크면 프로세스 풀 크기 (노드 동시 실행)
+            limits: {자원 종류: 최대 동시 실행 수} (없는 종류는 workers까지)
+
+        Returns:
+            BuildReport(rebuilt={노드: 이유 목록}, skipped=[노드], failed={노드: 오류}, blocked=[노드])
+        """
+        report = BuildReport({}, [], {}, [])
+        try:
+            if workers > 1:
+                self._run_parallel(report, force, verbose, workers, limits or {})
+            else:
+                self._run_serial(report, force, verbose)
+        finally:
+            self.save_state()
+        return report
+
+    def _prepare(self, node, force, report, bad):
+        """실행 전 판단 → (입력 지문, 이유 목록), 건너뛰거나 중단이면 None"""
+        if any(dep in bad for dep in node.deps):
+            report.blocked.append(node.name)
+            bad.add(node.name)
+            return None
+
+        inputs = self.input_fingerprint(node)
+        reasons = ['강제 실행'] if force else self.rebuild_reasons(node, inputs)
+        if not reasons:
+            report.skipped.append(node.name)
+            return None
+        return inputs, reasons
+
+    def _finish(self, node, inputs, reasons, error, report, bad):
+        """실행 결과 기록 (실패면 이전 기록 삭제 → 다음 빌드에서 다시 실행)"""
+        if error is not None:
+            report.failed[node.name] = error
+            bad.add(node.name)
+            self._state['nodes'].pop(node.name, None)
+            print(f"  ❌ {node.name}: {error}")
+            return
+
+        # 실행 중 입력 파일이 바뀌지 않았다는 가정으로 실행 전 지문 기록
+        self.record(node, inputs)
+        report.rebuilt[node.name] = reasons
+
+    def _run_serial(self, report, force, verbose):
+        bad = set()
+        for node in self.order():
+            prepared = self._prepare(node, force, report, bad)
+            if prepared is None:
+                continue
+
+            if verbose:
+                print(f"  ▶ {node.name} ({'; '.join(prepared[1])})")
+            error = None
+            try:
+                node.action()
+            except (Exception, SystemExit) as e:  # sys.exit()로 끝내는 단계도 노드 실패로 처리
+                error = e
+            self._finish(node, *prepared, error, report, bad)
+
+    def _run_parallel(self, report, force, verbose, workers, limits):
+        """준비된 노드를 등록 순서 우선으로 프로세스 풀에 배분 (자원 종류별 동시 실행 수 제한)"""
+        order = self.order()
+        index = {node.name: i for i, node in enumerate(order)}
+        waiting = {node.name: set(node.deps) for node in order}
+        dependents = {node.name: [] for node in order}
+        for node in order:
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+
+        ready = [(index[name], name) for name, deps in waiting.items() if not deps]
+        heapq.heapify(ready)
+        bad, running, in_use = set(), {}, Counter()
+
+        def release(name):
+            for child in dependents[name]:
+                waiting[child].discard(name)
+                if not waiting[child]:
+                    heapq.heappush(ready, (index[child], child))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while ready or running:
+                deferred = []
+                while ready:
+                    item = heapq.heappop(ready)
+                    node = self.nodes[item[1]]
+                    if in_use[node.resource] >= max(1, limits.get(node.resource, workers)):
+                        deferred.append(item)
+                        continue
+
+                    prepared = self._prepare(node, force, report, bad)
+                    if prepared is None:
+                        release(node.name)
+                        continue
+
+                    if verbose:
+                        print(f"  ▶ {node.name} ({'; '.join(prepared[1])})")
+                    running[pool.submit(node.action)] = (node, prepared)
+                    in_use[node.resource] += 1
+
+                for item in deferred:
+                    heapq.heappush(ready, item)
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node, prepared = running.pop(future)
+                    in_use[node.resource] -= 1
+                    self._finish(node, *prepared, future.exception(), report, bad)
+                    release(node.name)
+
+
+def print_build_report(report, nodes):
+    """단계(group)별 다시 만든/건너뛴 노드 수와 이유 요약 출력"""
+    groups = {}
+    for name, node in nodes.items():
+        groups.setdefault(node.group or '-', {'rebuilt': 0, 'skipped': 0, 'failed': 0})
+    for name in report.rebuilt:
+        groups[nodes[name].group or '-']['rebuilt'] += 1
+    for name in report.skipped:
+        groups[nodes[name].group or '-']['skipped'] += 1
+    for name in list(report.failed) + report.blocked:
+        groups[nodes[name].group or '-']['failed'] += 1
+
+    print("\n[빌드 요약]")
+    for group, counts in groups.items():
+        print(f"  - {group}: 실행 {counts['rebuilt']}개, 건너뜀 {counts['skipped']}개"
+              + (f", 실패/중단 {counts['failed']}개" if counts['failed'] else ""))
+
+    # 이유별 집계 (같은 이유로 다시 만든 노드는 한 줄로)
+    by_reason = {}
+    for name, reasons in report.rebuilt.items():
+        by_reason.setdefault('; '.join(reasons), []).append(name)
+    if by_reason:
+        print("\n[다시 만든 이유]")
+        for reason, names in by_reason.items():
+            sample = ', '.join(names[:3]) + (f" 외 {len(names) - 3}개" if len(names) > 3 else "")
+            print(f"  - {reason}: {sample}")
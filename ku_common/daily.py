@@ -0,0 +1,87 @@
+"""
+일별 누적(prefix-sum) 승/패 배열
+
+멤버 × 날짜별 경기수/승수를 한 번 누적해 두고, 임의 기간 통계를
+누적 배열 두 칸의 차이로 계산 (기간 질의 1회당 멤버 수와 무관한 상수 시간)
+
+- 행: 멤버 (첫 등장 순서) + 마지막 행은 팀 전체
+- 열: 첫 경기일 하루 전 ~ 마지막 경기일 (cum[:, 0] = 0)
+- 기간은 양 끝 날짜 포함, 데이터 범위 밖은 자동으로 잘라냄
+
+사용 예:
+    daily = DailyPrefix(table)
+    daily.stats('2025-01-01', '2025-08-31')                  # 팀 전체 (경기수, 승수)
+    daily.stats('2025-09-01', '2025-11-30', member='정서린')
+    daily.window('2025-10-01', '2025-12-31')                 # 멤버별 배열
+"""
+
+import numpy as np
+import pandas as pd
+
+from ku_common.schema import EPOCH
+
+
+def _day_number(date):
+    """날짜 → 일 단위 정수 (1970-01-01 기준)"""
+    return int((np.datetime64(pd.Timestamp(date), 'D') - EPOCH).astype(np.int64))
+
+
+class DailyPrefix:
+    """멤버별 일 단위 누적 경기수/승수"""
+
+    def __init__(self, table, key='멤버 이름'):
+        """
+        Args:
+            table: schema.to_match_table() 결과 (win, date_ord 컬럼 사용)
+            key: 멤버 컬럼명
+        """
+        days = table['date_ord'].to_numpy(dtype=np.int64)
+        self.first_day = int(days.min()) if len(days) else 0
+        self.last_day = int(days.max()) if len(days) else -1
+        n_days = self.last_day - self.first_day + 1
+
+        self.members = pd.Index(pd.unique(table[key].to_numpy(dtype=object)))
+        rows = self.members.get_indexer(table[key].to_numpy(dtype=object))
+        cols = days - self.first_day + 1
+
+        games = np.zeros((len(self.members) + 1, n_days + 1), dtype=np.int64)
+        wins = np.zeros_like(games)
+        np.add.at(games, (rows, cols), 1)
+        np.add.at(wins, (rows, cols), table['win'].to_numpy(dtype=np.int64))
+        games[-1] = games[:-1].sum(axis=0)
+        wins[-1] = wins[:-1].sum(axis=0)
+
+        self.cum_games = games.cumsum(axis=1)
+        self.cum_wins = wins.cumsum(axis=1)
+
+    @property
+    def first_date(self):
+        return pd.Timestamp(EPOCH + np.timedelta64(self.first_day, 'D'))
+
+    @property
+    def last_date(self):
+        return pd.Timestamp(EPOCH + np.timedelta64(self.last_day, 'D'))
+
+    def _bounds(self, start, end):
+        """기간 → 누적 배열 열 위치 (lo, hi), 통계 = cum[hi] - cum[lo]"""
+        n = self.cum_games.shape[1] - 1
+        lo = 0 if start is None else _day_number(start) - self.first_day
+        hi = n if end is None else _day_number(end) - self.first_day + 1
+        lo = min(max(lo, 0), n)
+        hi = min(max(hi, lo), n)
+        return lo, hi
+
+    def window(self, start=None, end=None):
+        """기간 내 멤버별 (경기수 배열, 승수 배열) - members 순서, 팀 전체 행 제외"""
+        lo, hi = self._bounds(start, end)
+        games = self.cum_games[:-1, hi] - self.cum_games[:-1, lo]
+        wins = self.cum_wins[:-1, hi] - self.cum_wins[:-1, lo]
+        return games, wins
+
+    def stats(self, start=None, end=None, member=None):
+        """기간 내 (경기수, 승수) - member가 None이면 팀 전체"""
+        row = -1 if member is None else self.members.get_loc(member)
+        lo, hi = self._bounds(start, end)
+        games = int(self.cum_games[row, hi] - self.cum_games[row, lo])
+        wins = int(self.cum_wins[row, hi] - self.cum_wins[row, lo])
+        return games, wins
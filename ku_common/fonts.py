@@ -0,0 +1,163 @@
+"""
+한글 폰트 부트스트랩 (matplotlib 차트 + HTML 슬라이드가 같은 폰트 파일 사용)
+
+렌더링 장비(Linux)에는 'Malgun Gothic'이 없음 → matplotlib가 글자마다 findfont 경고를 내고
+한글이 없는 대체 폰트로 그려 □로 표시됨
+
+- 폰트: 저장소에 포함한 나눔고딕 (assets/fonts/NanumGothic*.ttf, SIL OFL 1.1 → assets/fonts/OFL.txt)
+  파일이 없으면 렌더링 전에 FileNotFoundError (□ 차트를 만들지 않음)
+- matplotlib: font_manager.addfont로 등록 후 rcParams['font.family']를 그 이름으로 고정
+- 폰트 캐시: matplotlib import 전에 MPLCONFIGDIR를 프로젝트 .cache/matplotlib로 지정하고
+  저장소의 폰트 목록(assets/fonts/fontlist-v*.json)을 복사 → 첫 실행에도 시스템 폰트 검색 없음
+  목록은 matplotlib 내장 폰트만 담아 만든 것 (경로는 matplotlib 데이터 기준 상대 경로)
+  → 장비에 설치된 폰트와 무관하게 같은 목록, 같은 차트
+  matplotlib를 올려 목록 버전이 바뀌면 `python -m ku_common.fonts --build-cache`로 다시 만들어 커밋
+- HTML: font_face_css() → 같은 파일을 가리키는 @font-face (file://로 여는 슬라이드용)
+
+사용 예:
+    from ku_common import fonts    # matplotlib보다 먼저 import
+    import matplotlib
+    family = fonts.bootstrap_matplotlib()
+"""
+
+import dataclasses
+import os
+import shutil
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+FONT_DIR = PROJECT_ROOT / 'assets' / 'fonts'
+MPL_CACHE_DIR = PROJECT_ROOT / '.cache' / 'matplotlib'
+
+FONT_FAMILY = 'NanumGothic'
+
+# 파일 이름 → CSS font-weight (차트는 일반/굵게만 사용)
+FONT_FILES = {
+    'NanumGothic.ttf': 400,
+    'NanumGothicBold.ttf': 700,
+}
+
+# HTML font-family 값
+CSS_FONT_STACK = f"'{FONT_FAMILY}', 'Malgun Gothic', sans-serif"
+
+# 프로젝트 폰트 캐시 사용 (이미 matplotlib를 import했거나 MPLCONFIGDIR를 직접 지정했으면 그대로)
+if 'matplotlib' not in sys.modules and 'MPLCONFIGDIR' not in os.environ:
+    os.environ['MPLCONFIGDIR'] = str(MPL_CACHE_DIR)
+    for _fontlist in FONT_DIR.glob('fontlist-v*.json'):
+        if not (MPL_CACHE_DIR / _fontlist.name).exists():
+            MPL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(_fontlist, MPL_CACHE_DIR / _fontlist.name)
+
+# 프로세스에서 고정한 폰트 이름 (bootstrap_matplotlib 결과)
+_family = None
+_signature = None
+
+
+def font_paths(font_dir=FONT_DIR):
+    """포함한 폰트 파일 경로 목록 (빌드 그래프 입력용)"""
+    return [Path(font_dir) / name for name in FONT_FILES]
+
+
+def require_fonts(font_dir=FONT_DIR):
+    """포함한 폰트 파일 경로 목록 (없으면 FileNotFoundError)"""
+    paths = font_paths(font_dir)
+    missing = [path.name for path in paths if not path.exists()]
+    if missing:
+        raise FileNotFoundError(
+            f"한글 폰트 파일 없음: {', '.join(missing)} ({font_dir}) "
+            f"→ 저장소에서 다시 받으세요 (git checkout -- assets/fonts)"
+        )
+    return paths
+
+
+def bootstrap_matplotlib(font_dir=FONT_DIR):
+    """
+    한글 폰트 등록 + rcParams['font.family'] 고정 (프로세스마다 한 번, 이후 호출은 결과만 반환)
+
+    Returns:
+        고정한 폰트 이름
+    """
+    global _family
+    if _family is not None:
+        return _family
+
+    from matplotlib import font_manager, rcParams
+
+    paths = require_fonts(font_dir)
+    manager = font_manager.fontManager
+    registered = {font.fname for font in manager.ttflist}
+    for path in paths:
+        if str(path) not in registered:
+            manager.addfont(str(path))
+
+    # 나눔고딕 Bold 파일의 OS/2 굵기는 600 → 'bold'(700) 요청마다 findfont 경고
+    # 파일 이름 기준 굵기(FONT_FILES, @font-face와 같은 값)로 맞춤
+    weights = {str(path): FONT_FILES[path.name] for path in paths}
+    manager.ttflist = [
+        dataclasses.replace(font, weight=weights[font.fname]) if font.fname in weights else font
+        for font in manager.ttflist
+    ]
+    manager._findfont_cached.cache_clear()
+
+    _family = font_manager.FontProperties(fname=str(paths[0])).get_name()
+    rcParams['font.family'] = _family
+    return _family
+
+
+def font_signature(font_dir=FONT_DIR):
+    """차트 폰트 식별 문자열 (고정한 폰트 이름 + 폰트 파일 해시, 차트 캐시 키에 사용)"""
+    global _signature
+    if _signature is None:
+        from ku_common.match_store import file_sha256
+
+        hashes = [file_sha256(path)[:16] for path in require_fonts(font_dir)]
+        _signature = ':'.join([bootstrap_matplotlib(font_dir), *hashes])
+    return _signature
+
+
+def font_face_css(font_dir=FONT_DIR):
+    """포함한 폰트 파일의 @font-face 규칙 (file:// URL)"""
+    rules = []
+    for path in require_fonts(font_dir):
+        rules.append(f"@font-face {{ font-family: '{FONT_FAMILY}'; font-weight: {FONT_FILES[path.name]}; "
+                     f"src: url('{path.resolve().as_uri()}') format('truetype'); }}")
+    return '\n'.join(rules)
+
+
+def build_font_cache(font_dir=FONT_DIR):
+    """
+    matplotlib 내장 폰트만 담은 폰트 목록을 font_dir에 저장 (장비와 무관하게 같은 내용)
+
+    Returns:
+        저장한 파일 경로
+    """
+    import copy
+
+    import matplotlib
+    from matplotlib import font_manager
+
+    data_path = Path(matplotlib.get_data_path())
+    manager = copy.copy(font_manager.fontManager)
+    for attr in ('ttflist', 'afmlist'):
+        fonts = [font for font in getattr(manager, attr) if Path(font.fname).is_relative_to(data_path)]
+        setattr(manager, attr, sorted(fonts, key=lambda font: font.fname))
+
+    path = Path(font_dir) / f'fontlist-v{font_manager.FontManager.__version__}.json'
+    font_manager.json_dump(manager, path)
+    return path
+
+
+def main():
+    """폰트 확인 + 프로젝트 폰트 캐시 준비 (--build-cache: 저장소용 폰트 목록 다시 만들기)"""
+    import matplotlib
+
+    if '--build-cache' in sys.argv[1:]:
+        print(f"✓ 폰트 목록: {build_font_cache()}")
+    family = bootstrap_matplotlib()
+    print(f"✓ 차트 폰트: {family}")
+    print(f"✓ 폰트 캐시: {matplotlib.get_cachedir()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+증분 수집 상태 (행 해시 + 날짜 워터마크)
+
+워크북은 사실상 뒤에 경기를 추가하는 방식으로만 바뀌므로, 마지막으로 처리한
+행 수/날짜와 행별 내용 해시를 저장해 두고 다음 실행 때 바뀐 부분만 찾아냄
+
+모드:
+- none: 워크북 내용이 같음 (재계산 불필요)
+- append: 기존 행은 그대로이고 뒤에 행만 추가됨
+- changed: 기존 행이 수정/삭제됨 (바뀐 행 기준으로 영향 범위 계산)
+- full: 저장된 상태가 없거나 형식이 다름 (전체 재계산)
+
+영향 범위:
+- 추가/변경 행의 멤버와 상대
+- 영향받은 상대와 변경 시작일 이후 경기한 멤버 (상대의 경기 시점 티어가 바뀔 수 있음)
+"""
+
+import hashlib
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+STATE_FORMAT_VERSION = 1
+
+# 행 해시에서 제외하는 파생 컬럼 (schema.to_match_table/tiers가 추가)
+DERIVED_COLUMNS = ['win', 'date_ord', 'matchup', 'month']
+
+IngestDiff = namedtuple('IngestDiff', [
+    'mode',           # 'none' | 'append' | 'changed' | 'full'
+    'new_rows',       # 추가/변경된 현재 테이블 행 위치
+    'members',        # 재계산할 멤버 집합
+    'opponents',      # 티어 이력을 다시 만들 상대 집합
+    'since',          # 영향받는 가장 이른 날짜 (date_ord, 없으면 None)
+])
+
+
+def row_hashes(table):
+    """행별 내용 해시 (파생 컬럼 제외, 값 기준 - 카테고리 코드와 무관)"""
+    columns = [col for col in table.columns if col not in DERIVED_COLUMNS]
+    frame = table[columns].astype(object).where(table[columns].notna(), None)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+
+
+def content_hash(hashes):
+    """행 해시 배열 전체의 SHA-256"""
+    return hashlib.sha256(np.ascontiguousarray(hashes).tobytes()).hexdigest()
+
+
+def save_state(path, table, source_version='', hashes=None):
+    """현재 테이블을 처리 완료 상태로 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    hashes = row_hashes(table) if hashes is None else hashes
+
+    meta = {
+        'version': STATE_FORMAT_VERSION,
+        'source_version': source_version,
+        'rows': len(table),
+        'watermark': table['날짜'].max().strftime('%Y-%m-%d') if len(table) else None,
+        'content_hash': content_hash(hashes),
+    }
+    tmp_path = path.with_name(path.stem + '.tmp.npz')
+    np.savez_compressed(
+        tmp_path,
+        meta=np.array(json.dumps(meta, ensure_ascii=False)),
+        row_hash=hashes,
+        member=table['멤버 이름'].to_numpy(dtype=str),
+        opponent=table['상대'].astype(object).fillna('').to_numpy(dtype=str),
+        date_ord=table['date_ord'].to_numpy(dtype=np.int32),
+    )
+    tmp_path.replace(path)
+    return meta
+
+
+def load_state(path):
+    """저장된 상태 (없거나 형식이 다르면 None)"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('version') != STATE_FORMAT_VERSION:
+                return None
+            return {
+                'meta': meta,
+                'row_hash': data['row_hash'],
+                'member': data['member'],
+                'opponent': data['opponent'],
+                'date_ord': data['date_ord'],
+            }
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def diff_table(table, state, source_version='', hashes=None):
+    """저장된 상태와 현재 테이블 비교 → IngestDiff"""
+    if state is None:
+        return IngestDiff('full', np.arange(len(table)), None, None, None)
+
+    meta = state['meta']
+    if source_version and meta.get('source_version') == source_version:
+        return IngestDiff('none', np.arange(0), set(), set(), None)
+
+    hashes = row_hashes(table) if hashes is None else hashes
+    old_hashes = state['row_hash']
+    overlap = min(len(hashes), len(old_hashes))
+
+    changed = np.flatnonzero(hashes[:overlap] != old_hashes[:overlap])
+    removed = np.arange(overlap, len(old_hashes))
+    appended = np.arange(overlap, len(hashes))
+
+    if len(changed) == 0 and len(removed) == 0:
+        mode = 'append' if len(appended) else 'none'
+    else:
+        mode = 'changed'
+
+    new_rows = np.concatenate([changed, appended]).astype(np.int64)
+    old_rows = np.concatenate([changed, removed]).astype(np.int64)
+    if len(new_rows) == 0 and len(old_rows) == 0:
+        return IngestDiff('none', new_rows, set(), set(), None)
+
+    members = set(table['멤버 이름'].to_numpy(dtype=object)[new_rows]) | set(state['member'][old_rows])
+    opponents = set(table['상대'].to_numpy(dtype=object)[new_rows]) | set(state['opponent'][old_rows])
+    opponents = {opp for opp in opponents if isinstance(opp, str) and opp}
+
+    dates = np.concatenate([table['date_ord'].to_numpy()[new_rows], state['date_ord'][old_rows]])
+    since = int(dates.min())
+
+    # 영향받은 상대와 since 이후 경기한 멤버도 재계산 (상대 경기 시점 티어 변동 가능)
+    later = (table['date_ord'].to_numpy() >= since) & table['상대'].isin(opponents).to_numpy()
+    members |= set(table['멤버 이름'].to_numpy(dtype=object)[later])
+
+    return IngestDiff(mode, new_rows, members, opponents, since)
@@ -0,0 +1,144 @@
+"""
+보고서 페이지 목록 (렌더링 결과 → PDF 병합 순서)
+
+출력 디렉토리를 glob해서 파일 이름으로 정렬하지 않고, 렌더러가 만든 페이지를
+<출력 디렉토리>/manifest.json에 직접 기록 → 병합은 목록에 있는 페이지만 순서대로 사용
+
+- 항목: 이름, 섹션, 섹션 내 순서, 파일(디렉토리 기준 상대 경로), 내용 해시(SHA-256)
+- 위치: 이름 앞의 번호 코드 (03-05-2_정서린_vs_race → 섹션 '03', 순서 [5, 2])
+  번호가 아닌 코드는 ValueError (추측해서 끼워 넣지 않음)
+- 같은 위치에 다른 이름의 페이지가 기록되면 이전 페이지는 목록과 디렉토리에서 삭제
+  (예: 04-01_tournament_overview → 04-01_official_overview, 한 번의 기록에 함께 들어온
+  같은 위치 페이지끼리는 유지 → 03-01-6_…_weakness_1/_2)
+- 목록은 저장 시점에 위치 순으로 정렬 → 읽는 쪽은 그대로 순회
+- 기존 출력 등록: python -m ku_common.manifest <출력 디렉토리> [패턴]
+
+사용 예:
+    manifest = PageManifest(OUTPUT_DIR)
+    manifest.update([OUTPUT_DIR / '00_cover.png', OUTPUT_DIR / '01_summary.png'])
+    manifest.save()
+    for entry in manifest.pages():
+        print(entry['name'], manifest.path(entry))
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from ku_common.match_store import file_sha256
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+
+
+def page_position(name):
+    """
+    페이지 이름 → (섹션, 섹션 내 순서)
+
+    '03-05-2_정서린_vs_race' → ('03', [5, 2]), '07_poty_intro' → ('07', [])
+    """
+    code = name.split('_')[0].split('-')
+    if not all(part.isdigit() for part in code):
+        raise ValueError(f"페이지 이름에 번호 코드가 없습니다: {name}")
+    return code[0], [int(part) for part in code[1:]]
+
+
+def _sort_key(entry):
+    return entry['section'], entry['order'], entry['name']
+
+
+class PageManifest:
+    """출력 디렉토리 하나의 페이지 목록"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / MANIFEST_NAME
+        self._entries = {entry['name']: entry for entry in self._load()}
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_FORMAT_VERSION:
+                return data['pages']
+        except (OSError, ValueError):
+            pass
+        return []
+
+    @property
+    def exists(self):
+        return self.manifest_path.exists()
+
+    def path(self, entry):
+        """항목의 파일 절대 경로"""
+        return self.directory / entry['path']
+
+    def pages(self):
+        """위치 순서대로 항목 목록"""
+        return sorted(self._entries.values(), key=_sort_key)
+
+    def update(self, paths):
+        """
+        렌더링한 파일들을 목록에 기록 (같은 위치의 이전 페이지는 목록/디렉토리에서 삭제)
+
+        Returns:
+            삭제한 이전 페이지 이름 목록
+        """
+        batch = {}
+        for path in map(Path, paths):
+            section, order = page_position(path.stem)
+            batch[path.stem] = {
+                'name': path.stem,
+                'section': section,
+                'order': order,
+                'path': path.relative_to(self.directory).as_posix(),
+                'sha256': file_sha256(path),
+            }
+
+        positions = {(entry['section'], tuple(entry['order'])) for entry in batch.values()}
+        replaced = [entry for name, entry in self._entries.items()
+                    if name not in batch and (entry['section'], tuple(entry['order'])) in positions]
+        for entry in replaced:
+            self.discard(entry['name'])
+
+        self._entries.update(batch)
+        return [entry['name'] for entry in replaced]
+
+    def discard(self, name):
+        """페이지를 목록에서 빼고 파일 삭제"""
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            self.path(entry).unlink(missing_ok=True)
+        return entry
+
+    def discard_prefix(self, prefix):
+        """이름이 prefix로 시작하는 페이지 모두 삭제 (예: '03-' 멤버 섹션 전체) → 삭제 수"""
+        names = [name for name in self._entries if name.startswith(prefix)]
+        for name in names:
+            self.discard(name)
+        return len(names)
+
+    def save(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_FORMAT_VERSION, 'pages': self.pages()},
+                      f, ensure_ascii=False, indent=1)
+        tmp_path.replace(self.manifest_path)
+
+
+def main():
+    """기존 출력 디렉토리의 파일을 목록에 등록 (manifest 도입 전에 만든 페이지용)"""
+    if len(sys.argv) < 2:
+        print("사용법: python -m ku_common.manifest <출력 디렉토리> [패턴, 기본 *.png]")
+        sys.exit(1)
+    manifest = PageManifest(sys.argv[1])
+    pattern = sys.argv[2] if len(sys.argv) > 2 else '*.png'
+    paths = sorted(manifest.directory.glob(pattern))
+    manifest.update(paths)
+    manifest.save()
+    print(f"✓ {len(paths)}개 페이지 등록: {manifest.manifest_path}")
+
+
+if __name__ == '__main__':
+    main()
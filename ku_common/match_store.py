@@ -0,0 +1,187 @@
+"""
+경기 기록 워크북 공용 로더
+
+ku_records.xlsx를 한 번만 openpyxl로 파싱해 컬럼형 캐시(Feather)로 저장하고,
+이후 호출은 캐시에서 바로 DataFrame을 읽어 반환
+
+- 캐시 키: 워크북 크기 + 수정 시각(mtime) + 내용 해시(SHA-256)
+- 크기/mtime이 같으면 해시 계산 없이 바로 캐시 사용
+- mtime만 바뀐 경우(내용 동일) 해시로 확인 후 캐시 재사용
+- pyarrow가 없는 환경에서는 pickle 캐시로 대체
+- 같은 프로세스 안에서는 메모리 캐시를 재사용 (호출마다 복사본 반환)
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (Feather 캐시 사용 가능 여부 확인용)
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+CACHE_DIR_NAME = '.cache'
+CACHE_FORMAT_VERSION = 1
+
+# 프로세스 내 메모리 캐시: {워크북 절대경로: (sha256, DataFrame)}
+_memory_cache = {}
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def workbook_fingerprint(excel_path, known=None):
+    """워크북 지문 (크기, mtime, 내용 해시)
+
+    known에 이전 지문을 넘기면 크기/mtime이 같을 때 해시 계산을 생략
+    """
+    stat = Path(excel_path).stat()
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    if known and known.get('size') == stat.st_size and known.get('mtime_ns') == stat.st_mtime_ns:
+        fingerprint['sha256'] = known['sha256']
+    else:
+        fingerprint['sha256'] = file_sha256(excel_path)
+
+    return fingerprint
+
+
+def _cache_paths(excel_path, cache_dir):
+    """캐시 데이터/메타 파일 경로"""
+    excel_path = Path(excel_path)
+    cache_dir = cache_dir_for(excel_path, cache_dir)
+    suffix = 'feather' if HAS_ARROW else 'pkl'
+    return cache_dir / f'{excel_path.stem}.{suffix}', cache_dir / f'{excel_path.stem}.meta.json'
+
+
+def _normalize(df):
+    """엑셀 원본을 캐시 가능한 타입으로 정리
+
+    - 날짜 컬럼은 datetime64로 고정
+    - 문자열 컬럼에 섞인 숫자(예: 숫자로 입력된 맵 이름)는 문자열로 통일
+    """
+    if '날짜' in df.columns:
+        df['날짜'] = pd.to_datetime(df['날짜'])
+
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].map(lambda v: v if isinstance(v, str) or pd.isna(v) else str(v))
+
+    return df
+
+
+def _read_cache(data_path):
+    if data_path.suffix == '.feather':
+        return pd.read_feather(data_path)
+    return pd.read_pickle(data_path)
+
+
+def _write_cache(df, data_path):
+    tmp_path = data_path.with_name(data_path.name + '.tmp')
+    if data_path.suffix == '.feather':
+        df.reset_index(drop=True).to_feather(tmp_path)
+    else:
+        df.to_pickle(tmp_path)
+    tmp_path.replace(data_path)
+
+
+def _load_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_meta(meta_path, excel_path, fingerprint, rows):
+    meta = {
+        'version': CACHE_FORMAT_VERSION,
+        'source': str(excel_path),
+        'fingerprint': fingerprint,
+        'rows': rows,
+    }
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def load_matches(excel_path, cache_dir=None, use_cache=True):
+    """경기 기록 DataFrame 반환 (캐시 우선)
+
+    Args:
+        excel_path: 워크북 경로 (ku_records.xlsx)
+        cache_dir: 캐시 디렉토리 (기본: 워크북 옆 .cache/)
+        use_cache: False면 캐시를 무시하고 엑셀을 직접 파싱
+
+    Returns:
+        pd.DataFrame (호출마다 독립된 복사본)
+    """
+    excel_path = Path(excel_path).resolve()
+
+    if not use_cache:
+        return _normalize(pd.read_excel(excel_path))
+
+    data_path, meta_path = _cache_paths(excel_path, cache_dir)
+    meta = _load_meta(meta_path)
+    known = meta.get('fingerprint') if meta and meta.get('version') == CACHE_FORMAT_VERSION else None
+    fingerprint = workbook_fingerprint(excel_path, known)
+
+    # 1. 프로세스 내 메모리 캐시
+    cached = _memory_cache.get(str(excel_path))
+    if cached and cached[0] == fingerprint['sha256']:
+        return cached[1].copy()
+
+    # 2. 디스크 캐시
+    df = None
+    if known and known['sha256'] == fingerprint['sha256'] and data_path.exists():
+        try:
+            df = _read_cache(data_path)
+        except Exception:
+            df = None
+
+        if df is not None and known != fingerprint:
+            # 내용은 같고 mtime만 바뀐 경우: 메타만 갱신
+            _save_meta(meta_path, excel_path, fingerprint, len(df))
+
+    # 3. 엑셀 파싱 후 캐시 저장
+    if df is None:
+        df = _normalize(pd.read_excel(excel_path))
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_cache(df, data_path)
+            _save_meta(meta_path, excel_path, fingerprint, len(df))
+        except OSError as e:
+            print(f"  ! 캐시 저장 실패 (엑셀 직접 사용): {e}")
+
+    _memory_cache[str(excel_path)] = (fingerprint['sha256'], df)
+    return df.copy()
+
+
+def workbook_version(excel_path, cache_dir=None):
+    """워크북 내용 해시 (파생 캐시 키용, 메타의 크기/mtime이 같으면 해시 계산 생략)"""
+    excel_path = Path(excel_path).resolve()
+    meta = _load_meta(_cache_paths(excel_path, cache_dir)[1])
+    known = meta.get('fingerprint') if meta and meta.get('version') == CACHE_FORMAT_VERSION else None
+    return workbook_fingerprint(excel_path, known)['sha256']
+
+
+def cache_dir_for(excel_path, cache_dir=None):
+    """워크북 캐시 디렉토리 (기본: 워크북 옆 .cache/)"""
+    return Path(cache_dir) if cache_dir else Path(excel_path).resolve().parent / CACHE_DIR_NAME
+
+
+def clear_cache(excel_path, cache_dir=None):
+    """디스크/메모리 캐시 삭제"""
+    excel_path = Path(excel_path).resolve()
+    _memory_cache.pop(str(excel_path), None)
+    for path in _cache_paths(excel_path, cache_dir):
+        if path.exists():
+            path.unlink()
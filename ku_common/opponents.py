@@ -0,0 +1,107 @@
+"""
+멤버별 주요 상대 표 (필터 기준별 상대 경기수 상위 N명을 한 번에 계산)
+
+차트/슬라이드가 필터(상대 종족, 맵, 동일 티어)마다 큐브 breakdown을 따로 호출하는 대신
+큐브 셀을 (필터 기준, 멤버, 필터 값, 상대)로 한 번 groupby → 그룹별 상위 N명만 골라 보관
+(전체 목록 정렬 없이 그룹 내 경기수 순위로 선택, 남은 N명만 정렬)
+
+- 필터 기준: 'opp_race', 'map' (큐브 축), 'same_tier' (멤버 티어 == 상대 티어, 값 True/False)
+- 순위: 경기수 내림차순, 동점은 첫 경기 순 (cube.breakdown('opponent', ...)과 같은 순서)
+- 빈 필터 값(맵 미기록 등)은 제외 (cube.mask와 동일)
+- PipelineContext.top_opponents로 한 프로세스에서 공유
+
+사용 예:
+    table = TopOpponents(cube, top_n=5)
+    table.top('정서린', opp_race='테란')     # [WinLoss(value=상대, games, wins, first_row, last_row), ...]
+    table.top('정서린', same_tier=True)
+"""
+
+import numpy as np
+import pandas as pd
+
+from ku_common.aggregate import WinLoss
+from ku_common.cube import _is_missing
+
+FILTER_KEYS = ('opp_race', 'map', 'same_tier')
+
+
+class TopOpponents:
+    """(멤버, 필터 기준=값) → 경기수 상위 상대 목록"""
+
+    def __init__(self, cube, top_n=5, keys=FILTER_KEYS):
+        """
+        Args:
+            cube: WinLossCube
+            top_n: 그룹별 보관할 상위 상대 수 (top()의 최대 n)
+            keys: 필터 기준 ('same_tier' 또는 큐브 축 이름)
+        """
+        self.top_n = top_n
+        self.keys = list(keys)
+
+        # 필터 기준마다 셀 목록을 이어 붙여 groupby 한 번으로 집계
+        frames = []
+        for key_code, key in enumerate(self.keys):
+            if key == 'same_tier':
+                values = cube.same('member_tier', 'opp_tier').astype(np.int32)
+            else:
+                values = cube.column(key)
+            frames.append(pd.DataFrame({
+                'key': np.full(len(values), key_code, dtype=np.int32),
+                'member': cube.column('member'),
+                'value': values,
+                'opponent': cube.column('opponent'),
+                'games': cube.games,
+                'wins': cube.wins,
+                'first_row': cube.first_row,
+                'last_row': cube.last_row,
+            }))
+        cells = pd.concat(frames, ignore_index=True)
+
+        groups = ['key', 'member', 'value']
+        totals = cells.groupby(groups + ['opponent'], sort=False).agg(
+            games=('games', 'sum'),
+            wins=('wins', 'sum'),
+            first_row=('first_row', 'min'),
+            last_row=('last_row', 'max'),
+        ).reset_index()
+
+        # 그룹별 상위 N명 선택: 첫 경기 순으로 놓고 경기수 순위(동점은 먼저 만난 상대가 앞)
+        # → 순위 N 이하만 남긴 뒤 정렬 (groupby.nlargest는 그룹마다 파이썬 루프라 같은 선택을 rank로)
+        totals = totals.sort_values('first_row', kind='stable', ignore_index=True)
+        totals['rank'] = totals.groupby(groups, sort=False)['games'].rank(method='first', ascending=False)
+        top = totals[totals['rank'] <= top_n].sort_values(groups + ['rank'])
+
+        member_labels = cube.labels['member']
+        opponent_labels = cube.labels['opponent']
+        value_labels = {key: [False, True] if key == 'same_tier' else cube.labels[key] for key in self.keys}
+
+        self._top = {}
+        for row in top.itertuples(index=False):
+            key = self.keys[row.key]
+            value = value_labels[key][row.value]
+            if _is_missing(value):
+                continue
+            self._top.setdefault((member_labels[row.member], key, value), []).append(
+                WinLoss(opponent_labels[row.opponent], int(row.games), int(row.wins),
+                        int(row.first_row), int(row.last_row))
+            )
+
+    def top(self, member, n=None, **filter_):
+        """
+        필터 하나(예: opp_race='테란')에서 멤버의 경기수 상위 상대
+
+        Args:
+            n: 상대 수 (기본 top_n, top_n보다 클 수 없음)
+
+        Returns:
+            [WinLoss(value=상대, games, wins, first_row, last_row), ...] (경기가 없으면 빈 목록)
+        """
+        if len(filter_) != 1:
+            raise ValueError(f"필터는 하나만 지정: {sorted(filter_)}")
+        (key, value), = filter_.items()
+        if key not in self.keys:
+            raise ValueError(f"지원하지 않는 필터: {key} (가능: {', '.join(self.keys)})")
+        n = self.top_n if n is None else n
+        if n > self.top_n:
+            raise ValueError(f"상위 {n}명 > 계산한 상위 {self.top_n}명")
+        return self._top.get((member, key, value), [])[:n]
@@ -0,0 +1,188 @@
+"""
+이미지 → PDF 스트리밍 병합
+
+페이지 이미지를 전부 메모리에 모은 뒤 한 번에 PDF를 만드는 대신
+준비된 페이지부터 순서대로 파일에 기록 (메모리에는 진행 중인 몇 페이지만 유지)
+
+- 페이지 준비(디코딩/변환)는 프로세스 풀에서 병렬 실행, 결과는 입력 순서대로 기록
+- 불투명 RGB PNG(8비트, 인터레이스 없음)는 IDAT 압축 데이터를 그대로 FlateDecode 이미지로 사용
+  (PNG 예측자 = PDF Predictor 15 → 디코딩/재인코딩 없음, 무손실)
+- JPEG는 DCTDecode로 그대로 사용
+- 페이지 크기: 이미지 크기 / DPI (DPI 정보가 없으면 96, img2pdf 기본값과 같음)
+- 증분 병합: 이전에 만든 PDF 페이지의 이미지 스트림을 그대로 꺼내 다시 기록 (page_image)
+
+사용 예:
+    with StreamingPdfWriter('report.pdf') as writer:
+        for image in ordered_map(prepare_page, paths, workers=4):
+            writer.add_image(image)
+"""
+
+import os
+import struct
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+DEFAULT_DPI = 96.0
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# filter: 'DCTDecode' 또는 'FlateDecode', decode_parms: PDF 사전 문자열 (없으면 None)
+PdfImage = namedtuple('PdfImage', ['width', 'height', 'dpi', 'filter', 'decode_parms', 'data'])
+
+
+def png_passthrough(path):
+    """불투명 8비트 RGB PNG면 IDAT 데이터 그대로 PdfImage, 아니면 None (변환 필요)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+
+    pos, idat, header, dpi = len(PNG_SIGNATURE), [], None, (DEFAULT_DPI, DEFAULT_DPI)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', body)
+        elif kind == b'IDAT':
+            idat.append(body)
+        elif kind == b'tRNS':  # 투명색 지정 → 배경 합성 필요
+            return None
+        elif kind == b'pHYs':
+            x, y, unit = struct.unpack('>IIB', body)
+            if unit == 1:  # 미터당 픽셀
+                dpi = (x * 0.0254, y * 0.0254)
+        elif kind == b'IEND':
+            break
+
+    if header is None or not idat:
+        return None
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or color_type != 2 or interlace:
+        return None
+
+    parms = f"<< /BitsPerComponent 8 /Colors 3 /Columns {width} /Predictor 15 >>"
+    return PdfImage(width, height, dpi, 'FlateDecode', parms, b''.join(idat))
+
+
+def jpeg_image(data, size, dpi=None):
+    """JPEG 바이트 → PdfImage (size: (폭, 높이) 픽셀)"""
+    return PdfImage(size[0], size[1], dpi or (DEFAULT_DPI, DEFAULT_DPI), 'DCTDecode', None, data)
+
+
+def page_image(page):
+    """StreamingPdfWriter가 만든 PDF 페이지(pikepdf Page) → PdfImage (압축 데이터 그대로, 디코딩 없음)"""
+    image = page.Resources.XObject.Im0
+    width, height = int(image.Width), int(image.Height)
+    box = [float(value) for value in page.MediaBox]
+    dpi = (width * 72 / (box[2] - box[0]), height * 72 / (box[3] - box[1]))
+
+    parms = image.get('/DecodeParms')
+    if parms is not None:
+        parms = '<< ' + ' '.join(f"{key} {int(parms[key])}" for key in sorted(parms.keys())) + ' >>'
+    return PdfImage(width, height, dpi, str(image.Filter).lstrip('/'), parms, image.read_raw_bytes())
+
+
+def ordered_map(fn, items, workers=None, window=None):
+    """
+    fn(item)을 프로세스 풀에서 실행하고 입력 순서대로 결과 반환 (제너레이터)
+
+    동시에 제출하는 작업은 window개까지 → 결과가 메모리에 쌓이지 않음
+    workers가 1이면 현재 프로세스에서 순서대로 실행
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    window = window or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _number(value):
+    return f"{value:.4f}".rstrip('0').rstrip('.')
+
+
+class StreamingPdfWriter:
+    """이미지 한 장 = 한 페이지 PDF를 파일에 순서대로 기록"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'wb')
+        self._offsets = {}
+        self._pages = []
+        # 1: Catalog, 2: Pages (마지막에 기록), 3부터 페이지별 이미지/내용/페이지 객체
+        self._next_id = 3
+        self._file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def _write_object(self, obj_id, body, stream=None):
+        self._offsets[obj_id] = self._file.tell()
+        self._file.write(f"{obj_id} 0 obj\n".encode('ascii'))
+        self._file.write(body.encode('ascii'))
+        if stream is not None:
+            self._file.write(b'\nstream\n')
+            self._file.write(stream)
+            self._file.write(b'\nendstream')
+        self._file.write(b'\nendobj\n')
+
+    def add_image(self, image):
+        """페이지 추가 (이미지가 페이지 전체를 채움)"""
+        image_id, content_id, page_id = self._next_id, self._next_id + 1, self._next_id + 2
+        self._next_id += 3
+
+        parms = f" /DecodeParms {image.decode_parms}" if image.decode_parms else ""
+        self._write_object(image_id, (
+            f"<< /Type /XObject /Subtype /Image /Width {image.width} /Height {image.height} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /{image.filter}{parms} "
+            f"/Length {len(image.data)} >>"
+        ), image.data)
+
+        width_pt = _number(image.width * 72 / image.dpi[0])
+        height_pt = _number(image.height * 72 / image.dpi[1])
+        content = f"q {width_pt} 0 0 {height_pt} 0 0 cm /Im0 Do Q".encode('ascii')
+        self._write_object(content_id, f"<< /Length {len(content)} >>", content)
+
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt} {height_pt}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ))
+        self._pages.append(page_id)
+
+    def close(self):
+        """Pages/Catalog/xref 기록 후 파일 닫기"""
+        if self._file.closed:
+            return
+        kids = ' '.join(f"{page_id} 0 R" for page_id in self._pages)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>")
+        self._write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+
+        xref_offset = self._file.tell()
+        size = self._next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        lines += [f"{self._offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, size)]
+        lines.append(f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self._file.write(''.join(lines).encode('ascii'))
+        self._file.close()
+
+    @property
+    def page_count(self):
+        return len(self._pages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:  # 중간에 실패하면 불완전한 PDF를 남기지 않음
+            self._file.close()
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,503 @@
+"""
+비동기 페이지 렌더링 풀 (HTML 문자열 → PNG)
+
+Analysis Report 생성 스크립트 공용: 브라우저 하나에 페이지 N개를 열어 두고
+작업마다 빈 페이지를 받아 set_content → screenshot (asyncio.gather로 동시 진행)
+
+- 동시 실행 수 = 빈 페이지 큐 크기 (세마포어 역할, 페이지는 작업 간 재사용)
+- 페이지별 제한 시간, 실패하면 페이지를 새로 만들어 재시도
+- 실패한 페이지가 있어도 나머지는 모두 렌더링한 뒤 RuntimeError
+- 브라우저 실행 순서는 ku_common.browser와 같음 (CHROME_PATH → 내장 Chromium → 설치된 Chrome)
+- 폰트/CSS 요청은 로컬 자산 번들(ku_common.assets)에서 응답, 스크린샷 전 document.fonts.ready 대기
+  (번들이 없으면 시작할 때 FileNotFoundError, KU_ASSETS_ONLINE=1이면 경고 후 네트워크에서 로드)
+- 렌더 캐시: 키 = hash(HTML + 뷰포트 + 자산 번들 버전), 같은 키의 PNG가 있으면 브라우저 없이
+  하드링크(안 되면 복사)로 재사용 (<출력 디렉토리>/.render_cache/, 적중률 보고)
+- 섹션 문서 모드(book=True): 같은 섹션(이름의 첫 번호, 예: 03-05-2_… → 03) 페이지를 한 문서에
+  1920×1080 블록으로 쌓아 한 번만 로드하고 블록별 요소 스크린샷 (폰트/CSS 로드를 섹션당 1회로)
+  각 페이지는 shadow root로 분리 (페이지 CSS 충돌 방지, html/body 선택자는 :host/<ku-body>로 변환)
+- PDF 모드(output_format='pdf'): 스크린샷 대신 브라우저 인쇄로 1920×1080 한 쪽 벡터 PDF 저장
+  (<출력 디렉토리>/pdf/<이름>.pdf, 텍스트 선택 가능, merge_to_pdf.py --vector로 합침)
+- 렌더링한 페이지는 출력 디렉토리의 페이지 목록(ku_common.manifest)에 기록
+  (같은 위치의 이전 페이지는 목록/디렉토리에서 삭제, merge_to_pdf.py는 이 목록만 사용)
+- 출력 파일은 임시 파일(<이름>.png.tmp)에 렌더링한 뒤 성공하면 os.replace로 교체
+  (렌더링이 실패/시간 초과해도 이전 페이지와 하드링크된 캐시 파일은 그대로)
+
+사용 예:
+    asyncio.run(render_pages([('00_cover', html), ('01_summary', html2)], OUTPUT_DIR))
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # Playwright 미설치 → RenderPool 생성 시 오류
+    async_playwright = None
+
+from ku_common.browser import VIEWPORT, LAUNCH_ARGS, launch_candidates
+from ku_common.assets import AssetBundle
+from ku_common.manifest import PageManifest
+
+DEFAULT_CONCURRENCY = max(1, min(4, os.cpu_count() or 1))
+
+# 렌더링 방식(캡처 옵션 등)이 바뀌면 올려서 기존 캐시 무효화
+CACHE_FORMAT_VERSION = 1
+
+# PDF 모드 출력 하위 디렉토리
+PDF_SUBDIR = 'pdf'
+
+# 섹션 문서 하나에 넣는 최대 페이지 수 (DOM 크기 제한)
+DEFAULT_BOOK_SIZE = 40
+
+_STYLE_RE = re.compile(r'<style[^>]*>(.*?)</style>', re.S | re.I)
+_BODY_RE = re.compile(r'<body([^>]*)>(.*)</body>', re.S | re.I)
+_HEAD_RE = re.compile(r'<!DOCTYPE[^>]*>|<head\b.*?</head>|</?html[^>]*>', re.S | re.I)
+_CSS_IMPORT_RE = re.compile(r"@import\s+url\([^)]*\)\s*;?")
+_ROOT_SELECTOR_RE = re.compile(r'(?<![\w.#-])(html|body|:root)(?![\w-])')
+_ROOT_SELECTORS = {'html': ':host', ':root': ':host', 'body': 'ku-body'}
+
+# 블록마다 shadow root 생성, html/body 배경이 없으면 문서 기본처럼 body 배경(없으면 흰색)을 블록에 적용
+_ATTACH_PAGES_JS = """pages => pages.forEach((html, i) => {
+    const host = document.getElementById('ku-page-' + i);
+    const root = host.attachShadow({mode: 'open'});
+    root.innerHTML = html;
+    const transparent = style => style.backgroundColor === 'rgba(0, 0, 0, 0)' && style.backgroundImage === 'none';
+    if (transparent(getComputedStyle(host))) {
+        const body = getComputedStyle(root.querySelector('ku-body'));
+        host.style.background = transparent(body) ? '#fff' : body.background;
+    }
+})"""
+
+
+def book_section(name):
+    """페이지 이름의 섹션 번호 ('03-05-2_이름_vs_race' → '03', '00_cover' → '00')"""
+    return name.split('_')[0].split('-')[0]
+
+
+def split_page(html):
+    """페이지 HTML → (@import 문 목록, 나머지 CSS, body 속성, body 내용)"""
+    css = '\n'.join(_STYLE_RE.findall(html))
+    imports = _CSS_IMPORT_RE.findall(css)
+    css = _CSS_IMPORT_RE.sub('', css)
+
+    body = _BODY_RE.search(html)
+    if body:
+        return imports, css, body.group(1), body.group(2)
+    return imports, css, '', _STYLE_RE.sub('', _HEAD_RE.sub('', html))
+
+
+def build_book(pages, viewport=VIEWPORT):
+    """
+    페이지 HTML 목록 → (섹션 문서 HTML, 블록별 shadow root HTML 목록)
+
+    @import(폰트)는 문서 head로 모아 한 번만 로드 (shadow root 안의 @font-face는 적용되지 않음)
+    """
+    imports, shadows = [], []
+    for html in pages:
+        page_imports, css, attrs, content = split_page(html)
+        imports.extend(i for i in page_imports if i not in imports)
+
+        css = _ROOT_SELECTOR_RE.sub(lambda m: _ROOT_SELECTORS[m.group(1)], css)
+        # body → <ku-body> (선택자 우선순위 유지), 기본값은 브라우저 기본 body 스타일 (우선순위 0)
+        shadows.append(f'<style>:where(ku-body) {{ display: block; margin: 8px; }}</style><style>{css}</style>'
+                       f'<ku-body{attrs}>{content}</ku-body>')
+
+    width, height = viewport['width'], viewport['height']
+    hosts = ''.join(f'<div class="ku-book-page" id="ku-page-{i}"></div>' for i in range(len(pages)))
+    shell = (f'<!DOCTYPE html><html><head><meta charset="UTF-8"><style>{"".join(imports)}\n'
+             f'html, body {{ margin: 0; padding: 0; }}\n'
+             f'.ku-book-page {{ display: block; position: relative; width: {width}px; height: {height}px; '
+             f'overflow: hidden; }}\n'
+             f'</style></head><body>{hosts}</body></html>')
+    return shell, shadows
+
+
+class RenderCache:
+    """
+    내용 주소 렌더 캐시
+
+    - store/<키>.<확장자>: 렌더 결과 (출력 파일과 하드링크, 출력은 항상 교체만 하고 덮어쓰지 않음)
+    - index.json: {페이지 이름: 키} (마지막 실행 기준, 저장 시 참조되지 않는 store 파일 삭제)
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.store_dir = self.cache_dir / 'store'
+        self.index_path = self.cache_dir / 'index.json'
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(html, viewport, asset_version):
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}|{json.dumps(viewport, sort_keys=True)}|{asset_version}|".encode('utf-8'))
+        digest.update(html.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _stored(self, key, suffix):
+        return self.store_dir / f"{key}{suffix}"
+
+    def restore(self, name, key, output_path):
+        """캐시 적중이면 출력 경로에 렌더 결과 배치 후 True"""
+        output_path = Path(output_path)
+        stored = self._stored(key, output_path.suffix)
+        if not stored.exists():
+            self.misses += 1
+            return False
+
+        if not (output_path.exists() and os.path.samefile(stored, output_path)):
+            tmp_path = _temp_path(output_path)
+            tmp_path.unlink(missing_ok=True)
+            _link_or_copy(stored, tmp_path)
+            os.replace(tmp_path, output_path)
+        self.index[name] = key
+        self.hits += 1
+        return True
+
+    def store(self, name, key, output_path):
+        stored = self._stored(key, Path(output_path).suffix)
+        if not stored.exists():
+            _link_or_copy(output_path, stored)
+        self.index[name] = key
+
+    def save(self):
+        referenced = set(self.index.values())
+        for path in self.store_dir.iterdir():
+            if path.stem not in referenced:
+                path.unlink()
+
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1, sort_keys=True)
+        tmp_path.replace(self.index_path)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _temp_path(path):
+    """렌더링 중 쓰는 임시 파일 (성공하면 출력 경로로 교체)"""
+    return path.with_name(path.name + '.tmp')
+
+
+def _commit(paths):
+    """임시 파일 → 출력 파일 교체 (기존 출력이 store 파일과 하드링크여도 store는 그대로)"""
+    for path in paths:
+        os.replace(_temp_path(path), path)
+
+
+def _discard_temp(paths):
+    for path in paths:
+        _temp_path(path).unlink(missing_ok=True)
+
+
+def _link_or_copy(source, target):
+    try:
+        os.link(source, target)
+    except OSError:  # 다른 파일 시스템, 하드링크 미지원 등
+        shutil.copy2(source, target)
+
+
+class RenderPool:
+    """브라우저 1개 + 재사용 페이지 N개로 HTML을 동시에 PNG 렌더링"""
+
+    def __init__(self, output_dir, concurrency=DEFAULT_CONCURRENCY, viewport=VIEWPORT,
+                 timeout=30, retries=2, verbose=True, assets=None, cache=True,
+                 book=False, book_size=DEFAULT_BOOK_SIZE, output_format='png', manifest=True):
+        """
+        Args:
+            output_dir: 저장 디렉토리 (<이름>.png, PDF 모드는 pdf/<이름>.pdf)
+            concurrency: 동시에 렌더링할 페이지 수
+            viewport: 페이지 크기 {'width', 'height'}
+            timeout: 페이지 하나(set_content + screenshot) 제한 시간 (초)
+            retries: 실패 시 재시도 횟수
+            verbose: 페이지마다 완료 메시지 출력
+            assets: 폰트/CSS 번들 (기본: assets/web/, 오프라인 번들이 없으면 start()에서 FileNotFoundError)
+            cache: True면 <output_dir>/.render_cache/ 렌더 캐시 사용 (RenderCache 객체도 가능)
+            book: True면 섹션별로 한 문서에 모아 렌더링
+            book_size: 섹션 문서 하나의 최대 페이지 수
+            output_format: 'png' (스크린샷) 또는 'pdf' (브라우저 인쇄, 벡터)
+            manifest: True면 렌더링한 페이지를 출력 디렉토리의 페이지 목록에 기록 (PageManifest 객체도 가능)
+        """
+        if output_format not in ('png', 'pdf'):
+            raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+        if book and output_format == 'pdf':
+            raise ValueError("섹션 문서 모드는 PNG 출력에서만 사용할 수 있습니다")
+
+        self.output_format = output_format
+        self.suffix = '.' + output_format
+        self.output_dir = Path(output_dir) / PDF_SUBDIR if output_format == 'pdf' else Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = max(1, concurrency)
+        self.viewport = dict(viewport)
+        self.timeout = timeout
+        self.retries = retries
+        self.verbose = verbose
+        self.assets = assets if assets is not None else AssetBundle()
+        if cache is True:
+            cache = RenderCache(self.output_dir / '.render_cache')
+        self.cache = cache or None
+        if manifest is True:
+            manifest = PageManifest(self.output_dir)
+        self.manifest = manifest or None
+        self.book = book
+        self.book_size = max(1, book_size)
+
+        self._playwright = None
+        self._browser = None
+        self._idle = None
+        self._lock = None
+
+    async def _launch(self):
+        error = None
+        for path in launch_candidates():
+            try:
+                return await self._playwright.chromium.launch(headless=True, executable_path=path, args=LAUNCH_ARGS)
+            except Exception as e:  # 내장 Chromium 미설치 등 → 다음 후보
+                error = e
+        raise RuntimeError(f"Chromium을 실행할 수 없습니다: {error}")
+
+    async def start(self):
+        # 번들 없이 렌더링하면 폰트가 네트워크/대체 폰트에 따라 달라짐 → 캐시 적중 여부와 무관하게 먼저 확인
+        self.assets.require()
+        self._lock = asyncio.Lock()
+        return self
+
+    async def _ensure_browser(self):
+        """첫 캐시 미스에서 브라우저 실행 (전부 캐시 적중이면 실행하지 않음)"""
+        async with self._lock:
+            if self._browser is not None:
+                return
+            await self._launch_browser()
+
+    async def _launch_browser(self):
+        if async_playwright is None:
+            raise RuntimeError("Playwright가 설치되어 있지 않습니다 (pip install playwright)")
+        if not self.assets.available:
+            # offline=False (KU_ASSETS_ONLINE=1)일 때만 여기까지 옴
+            print(f"  ⚠️ 로컬 자산 번들 없음 ({self.assets.root}) → 폰트를 네트워크에서 로드 "
+                  f"(python -m ku_common.assets 로 내려받기)")
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._launch()
+            self._idle = asyncio.Queue()
+            for _ in range(self.concurrency):
+                self._idle.put_nowait(await self._new_page())
+        except Exception:
+            await self._close_browser()
+            raise
+
+    async def close(self):
+        if self.cache is not None:
+            self.cache.save()
+        await self._close_browser()
+
+    async def _close_browser(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = self._idle = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _new_page(self):
+        page = await self._browser.new_page(viewport=self.viewport)
+        page.set_default_timeout(self.timeout * 1000)
+        if self.assets.available:
+            await page.route('**/*', self.assets.handle)
+        return page
+
+    async def _discard(self, page):
+        try:
+            await page.close()
+        except Exception:  # 이미 닫혔거나 크래시한 페이지
+            pass
+
+    async def _wait_fonts(self, page):
+        # 웹폰트 적용 완료 후 캡처 (번들 응답이라 네트워크 대기 없음)
+        await page.evaluate('document.fonts.ready.then(() => document.fonts.size)')
+
+    async def _print_pdf(self, page, output_path):
+        """화면과 같은 스타일(media=screen)로 뷰포트 크기 한 쪽 PDF 인쇄 (배경 포함, 여백 없음)"""
+        await page.emulate_media(media='screen')
+        await page.pdf(path=str(output_path), width=f"{self.viewport['width']}px",
+                       height=f"{self.viewport['height']}px", print_background=True, page_ranges='1',
+                       margin={'top': '0', 'right': '0', 'bottom': '0', 'left': '0'})
+
+    async def _with_page(self, label, action, timeout):
+        """빈 페이지를 받아 action(page) 실행 (실패하면 페이지를 새로 만들어 재시도)"""
+        await self._ensure_browser()
+        page = await self._idle.get()
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    if page.is_closed():
+                        page = await self._new_page()
+                    return await asyncio.wait_for(action(page), timeout)
+                except Exception as e:
+                    # 상태를 알 수 없는 페이지는 버리고 새 페이지로 재시도
+                    await self._discard(page)
+                    if attempt == self.retries:
+                        raise
+                    print(f"  ⚠️ {label} 재시도 ({attempt + 1}/{self.retries}): {e!r}")
+        finally:
+            self._idle.put_nowait(page)
+
+    def _output_path(self, name):
+        return self.output_dir / f"{name}{self.suffix}"
+
+    def _cache_key(self, html, book=False):
+        mode = ('|book' if book else '') + ('|pdf' if self.output_format == 'pdf' else '')
+        return RenderCache.key(html, self.viewport, self.assets.version + mode)
+
+    def _restore(self, name, key):
+        """캐시 적중이면 출력 PNG를 배치하고 True"""
+        if self.cache is None:
+            return False
+        output_path = self._output_path(name)
+        if self.cache.restore(name, key, output_path):
+            if self.verbose:
+                print(f"  ✓ {output_path.name} (캐시)")
+            return True
+        return False
+
+    def _rendered(self, name, key):
+        if self.cache is not None:
+            self.cache.store(name, key, self._output_path(name))
+        if self.verbose:
+            print(f"  ✓ {self._output_path(name).name}")
+
+    async def _render_page(self, name, html, key=None):
+        output_path = self._output_path(name)
+        tmp_path = _temp_path(output_path)
+
+        async def action(page):
+            await page.set_content(html)
+            await self._wait_fonts(page)
+            if self.output_format == 'pdf':
+                await self._print_pdf(page, tmp_path)
+            else:
+                await page.screenshot(path=str(tmp_path), type='png')
+
+        try:
+            await self._with_page(output_path.name, action, self.timeout)
+        except BaseException:
+            _discard_temp([output_path])
+            raise
+        _commit([output_path])
+        self._rendered(name, key or self._cache_key(html))
+        return output_path
+
+    async def render(self, name, html):
+        """페이지 하나 렌더링 → 출력 파일 경로 (재시도 후에도 실패하면 예외)"""
+        if self._restore(name, self._cache_key(html)):
+            return self._output_path(name)
+        return await self._render_page(name, html)
+
+    async def _render_book(self, chunk):
+        """[(이름, HTML, 키)]를 한 문서로 로드 → 페이지별 요소 스크린샷"""
+        shell, pages = build_book([html for _, html, _ in chunk], self.viewport)
+        output_paths = [self._output_path(name) for name, _, _ in chunk]
+
+        async def action(page):
+            await page.set_content(shell)
+            await page.evaluate(_ATTACH_PAGES_JS, pages)
+            await self._wait_fonts(page)
+            for i, output_path in enumerate(output_paths):
+                await page.locator(f'#ku-page-{i}').screenshot(path=str(_temp_path(output_path)), type='png')
+
+        label = f"{book_section(chunk[0][0])} 섹션 문서 ({len(chunk)}쪽)"
+        try:
+            await self._with_page(label, action, self.timeout * len(chunk))
+        except BaseException:
+            _discard_temp(output_paths)
+            raise
+        # 문서 전체가 성공한 뒤에만 교체 (실패하면 페이지 단위 렌더링이 다시 시도)
+        _commit(output_paths)
+        for name, _, key in chunk:
+            self._rendered(name, key)
+
+    async def _render_books(self, jobs):
+        """섹션별로 한 문서에 모아 렌더링 (캐시 적중 페이지는 제외, 문서 실패 시 페이지 단위로 다시 렌더링)"""
+        pending = []
+        for name, html in jobs:
+            key = self._cache_key(html, book=True)
+            if not self._restore(name, key):
+                pending.append((name, html, key))
+
+        sections = {}
+        for job in pending:
+            sections.setdefault(book_section(job[0]), []).append(job)
+        chunks = [pages[i:i + self.book_size]
+                  for pages in sections.values() for i in range(0, len(pages), self.book_size)]
+
+        results = await asyncio.gather(*(self._render_book(chunk) for chunk in chunks), return_exceptions=True)
+        fallback = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                print(f"  ⚠️ {book_section(chunk[0][0])} 섹션 문서 실패 → 페이지 단위 렌더링: {result!r}")
+                fallback.extend(chunk)
+        fallback_results = dict(zip(
+            [name for name, _, _ in fallback],
+            await asyncio.gather(*(self._render_page(*job) for job in fallback), return_exceptions=True)
+        ))
+        return [fallback_results.get(name, self._output_path(name)) for name, _ in jobs]
+
+    async def render_many(self, jobs):
+        """
+        [(이름, HTML), ...] 동시 렌더링 (HTML이 None인 항목은 건너뜀)
+
+        Returns:
+            입력 순서대로 출력 파일 경로 목록
+        """
+        jobs = [(name, html) for name, html in jobs if html is not None]
+        start = time.perf_counter()
+        if self.book:
+            results = await self._render_books(jobs)
+        else:
+            results = await asyncio.gather(*(self.render(name, html) for name, html in jobs),
+                                           return_exceptions=True)
+
+        failed = [(name, result) for (name, _), result in zip(jobs, results) if isinstance(result, BaseException)]
+        for name, error in failed:
+            print(f"  ❌ {name}{self.suffix}: {error!r}")
+        print(f"  - 렌더링 {len(jobs) - len(failed)}/{len(jobs)}개 ({time.perf_counter() - start:.1f}초, "
+              f"동시 {self.concurrency}개{', 섹션 문서' if self.book else ''})")
+        if self.cache is not None:
+            print(f"  - 렌더 캐시: 적중 {self.cache.hits}개, 렌더링 {self.cache.misses}개 "
+                  f"(적중률 {self.cache.hit_rate * 100:.0f}%)")
+        if self.manifest is not None:
+            # 실패한 페이지는 기록하지 않음 (이전 기록 유지)
+            replaced = self.manifest.update(result for result in results if not isinstance(result, BaseException))
+            self.manifest.save()
+            if replaced:
+                print(f"  - 이전 페이지 삭제: {', '.join(replaced)}")
+        if failed:
+            raise RuntimeError(f"렌더링 실패 {len(failed)}개: {', '.join(name for name, _ in failed)}")
+        return results
+
+
+async def render_pages(jobs, output_dir, **options):
+    """RenderPool을 열어 [(이름, HTML), ...]을 렌더링하고 닫기 (options는 RenderPool 인자)"""
+    async with RenderPool(output_dir, **options) as pool:
+        return await pool.render_many(jobs)
@@ -0,0 +1,136 @@
+"""
+경기 기록 표준 스키마 (카테고리/정수 코드 테이블)
+
+문자열 object 컬럼을 카테고리 코드로 바꿔 필터/그룹 연산을 정수 비교로 처리
+- 종족/티어: 고정된 카테고리 순서 (RACES, TIER_ORDER)
+- 멤버/상대/맵/구분: 원본 등장 순서 카테고리 (unique() 순서 유지)
+- win: 승리 여부 int8 (1=승, 0=패)
+- date_ord: 날짜 일련번호 int32 (1970-01-01 기준 일수)
+
+사용법:
+    python -m ku_common.schema ku_records.xlsx   # 메모리 사용량 비교 출력
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+RACES = ['테란', '저그', '프로토스']
+
+# 숫자가 작을수록 높은 티어 (data_extractor/update_pages와 동일)
+TIER_ORDER = {
+    '1티어': 1, '2티어': 2, '3티어': 3, '4티어': 4, '5티어': 5,
+    '6티어': 6, '7티어': 7, '8티어': 8, '베이비': 9
+}
+
+RESULT_WIN = '승'
+
+RACE_COLUMNS = ['멤버 종족', '상대 종족']
+TIER_COLUMNS = ['멤버 티어', '상대 티어']
+CODE_COLUMNS = ['멤버 이름', '상대', '맵', '구분', '구분2']
+
+EPOCH = np.datetime64('1970-01-01', 'D')
+
+
+def _fixed_categories(series, base):
+    """고정 순서 카테고리 + 목록에 없는 값은 등장 순서대로 뒤에 추가"""
+    extras = [v for v in pd.unique(series.dropna()) if v not in base]
+    return list(base) + extras
+
+
+def to_match_table(df):
+    """원본 DataFrame → 표준 스키마 테이블
+
+    - 날짜/멤버가 비어 있는 행(엑셀 하단 빈 행)은 제외
+    - 기존 컬럼명은 그대로 유지하므로 df['멤버 이름'] == member 같은 코드는 그대로 동작
+    """
+    table = df[df['날짜'].notna() & df['멤버 이름'].notna()].reset_index(drop=True)
+
+    for col in RACE_COLUMNS:
+        table[col] = pd.Categorical(table[col], categories=_fixed_categories(table[col], RACES))
+
+    for col in TIER_COLUMNS:
+        table[col] = pd.Categorical(table[col], categories=_fixed_categories(table[col], TIER_ORDER))
+
+    for col in CODE_COLUMNS:
+        table[col] = pd.Categorical(table[col], categories=pd.unique(table[col].dropna()))
+
+    table['결과'] = pd.Categorical(table['결과'], categories=_fixed_categories(table['결과'], [RESULT_WIN, '패']))
+    table['win'] = (table['결과'] == RESULT_WIN).astype(np.int8)
+    table['date_ord'] = (table['날짜'].values.astype('datetime64[D]') - EPOCH).astype(np.int32)
+
+    return table
+
+
+def value_counts(series):
+    """문자열 컬럼과 같은 결과를 내는 value_counts()
+
+    카테고리 value_counts()는 0건 카테고리를 포함하고 동점 순서가 카테고리 순서를 따르므로,
+    object 컬럼처럼 관측된 값만 등장 순서대로 센 뒤 안정 정렬
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts()
+
+    codes = series.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    order = pd.unique(codes)
+    counts = np.bincount(codes, minlength=len(series.cat.categories))[order]
+    index = pd.Index(series.cat.categories[order], name=series.name)
+    result = pd.Series(counts, index=index, name='count')
+    return result.sort_values(ascending=False, kind='stable')
+
+
+def win_stats(df):
+    """(경기수, 승수) 정수 튜플"""
+    return len(df), int(df['win'].sum())
+
+
+def memory_report(raw, table):
+    """원본/표준 테이블의 행당 메모리 사용량 (bytes)"""
+    raw_bytes = int(raw.memory_usage(deep=True).sum())
+    table_bytes = int(table.memory_usage(deep=True).sum())
+    return {
+        'rows_raw': len(raw),
+        'rows_table': len(table),
+        'bytes_raw': raw_bytes,
+        'bytes_table': table_bytes,
+        'bytes_per_row_raw': round(raw_bytes / max(len(raw), 1), 1),
+        'bytes_per_row_table': round(table_bytes / max(len(table), 1), 1),
+        'by_column': {
+            col: {
+                'raw': int(raw[col].memory_usage(deep=True, index=False)) if col in raw else 0,
+                'table': int(table[col].memory_usage(deep=True, index=False)),
+            }
+            for col in table.columns
+        },
+    }
+
+
+def print_memory_report(report):
+    """메모리 사용량 비교 출력"""
+    print(f"  - 원본: {report['rows_raw']:,}행, {report['bytes_raw'] / 1024:.1f} KB "
+          f"({report['bytes_per_row_raw']} bytes/행)")
+    print(f"  - 표준: {report['rows_table']:,}행, {report['bytes_table'] / 1024:.1f} KB "
+          f"({report['bytes_per_row_table']} bytes/행)")
+
+
+def main():
+    from ku_common.match_store import load_matches
+
+    excel_path = sys.argv[1] if len(sys.argv) > 1 else 'ku_records.xlsx'
+    raw = load_matches(excel_path)
+    table = to_match_table(raw)
+    report = memory_report(raw, table)
+
+    print("=" * 60)
+    print(f"경기 테이블 메모리 비교: {excel_path}")
+    print("=" * 60)
+    print_memory_report(report)
+    print("\n[컬럼별 bytes]")
+    for col, sizes in report['by_column'].items():
+        print(f"  {col:<10} {sizes['raw']:>10,} → {sizes['table']:>10,}  ({table[col].dtype})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+"""
+티어 이력 (멤버 + 상대 통합)
+
+경기 테이블을 (역할, 선수, 날짜) 순으로 한 번만 정렬하고 직전 행과 티어를 비교해
+티어가 바뀌는 지점만 뽑아내는 컬럼형 이력 테이블
+
+컬럼:
+- role: 'member' (멤버 이름/멤버 티어) 또는 'opponent' (상대/상대 티어)
+- player_id: 멤버/상대 통합 선수 번호 (등장 순서, 같은 이름이면 같은 번호)
+- player: 선수 이름
+- effective_from: 해당 티어가 적용되기 시작한 날짜
+- tier: 티어 문자열
+- tier_code: schema.TIER_ORDER 번호 (목록에 없는 티어/빈 값은 0)
+
+같은 날짜 안에서는 엑셀 행 순서를 유지 (안정 정렬)
+
+update_tier_changes: 증분 수집 시 영향받은 선수의 변동 지점만 다시 만들어 교체
+
+TierTimeline: 변동 지점 테이블로 만든 경기 시점(as-of) 티어 조회 인덱스
+- tier_at(player, date): 이진 탐색 단건 조회
+- tiers_at(players, dates): 배열 일괄 조회 (merge_asof와 같은 "해당 날짜 이전 마지막 변동" 규칙)
+
+matchup_column: 경기 시점 양측 티어를 코드로 바꿔 티어 매치업 룩업 테이블로 한 번에 분류
+- same: 동일 티어 / upper: 상대가 상위 티어 / lower: 상대가 하위 티어 / unknown: 티어 없음
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+from ku_common.schema import TIER_ORDER, EPOCH
+
+ROLE_COLUMNS = {
+    'member': ('멤버 이름', '멤버 티어'),
+    'opponent': ('상대', '상대 티어'),
+}
+
+CHANGE_COLUMNS = ['role', 'player_id', 'player', 'effective_from', 'tier', 'tier_code']
+
+MATCHUP_TYPES = ['same', 'upper', 'lower', 'unknown']
+
+# 티어 번호표에 없는 티어(조커, 0티어 등)는 모두 같은 번호로 취급
+UNLISTED_TIER_NUM = 99
+
+
+def build_tier_changes(table):
+    """경기 테이블 → 티어 변동 지점 테이블 (멤버/상대 한 번에 처리)"""
+    frames = []
+    for role_idx, (player_col, tier_col) in enumerate(ROLE_COLUMNS.values()):
+        frames.append(pd.DataFrame({
+            'role_idx': np.full(len(table), role_idx, dtype=np.int8),
+            'player': table[player_col].to_numpy(dtype=object),
+            'effective_from': table['날짜'].to_numpy(),
+            'tier': table[tier_col].to_numpy(dtype=object),
+        }))
+
+    long = pd.concat(frames, ignore_index=True)
+    long = long[long['player'].notna()]
+    long['player_id'] = pd.factorize(long['player'])[0].astype(np.int32)
+    long = long.sort_values(['role_idx', 'player_id', 'effective_from'], kind='stable')
+
+    role_idx = long['role_idx'].to_numpy()
+    player_id = long['player_id'].to_numpy()
+    tier_key = pd.factorize(long['tier'])[0]
+
+    # 그룹 첫 행, 티어가 바뀐 행, 빈 티어(NaN != NaN) 행이 변동 지점
+    changed = np.ones(len(long), dtype=bool)
+    changed[1:] = (
+        (role_idx[1:] != role_idx[:-1])
+        | (player_id[1:] != player_id[:-1])
+        | (tier_key[1:] != tier_key[:-1])
+        | (tier_key[1:] < 0)
+    )
+
+    changes = long[changed].reset_index(drop=True)
+    changes['role'] = pd.Categorical.from_codes(changes['role_idx'], categories=list(ROLE_COLUMNS))
+    changes['tier_code'] = changes['tier'].map(lambda t: TIER_ORDER.get(t, 0)).astype(np.int8)
+    return changes[CHANGE_COLUMNS]
+
+
+def update_tier_changes(changes, table, members, opponents):
+    """기존 변동 지점 테이블에서 지정한 멤버/상대의 이력만 다시 만들어 교체
+
+    해당 선수가 나온 행만 골라 build_tier_changes()를 돌리므로 비용은 그 선수들의
+    경기 수에 비례 (player_id는 전체 테이블 등장 순서로 다시 매김 - 전체 재구축과 동일)
+
+    Args:
+        changes: 이전 build_tier_changes() 결과
+        table: 현재 경기 테이블 전체
+        members / opponents: 이력을 다시 만들 멤버/상대 이름 집합
+    """
+    members, opponents = set(members), set(opponents)
+    parts = [changes[~(((changes['role'] == 'member') & changes['player'].isin(members))
+                       | ((changes['role'] == 'opponent') & changes['player'].isin(opponents)))]]
+
+    for role, players in (('member', members), ('opponent', opponents)):
+        player_col = ROLE_COLUMNS[role][0]
+        subset = table[table[player_col].isin(players)]
+        if len(subset):
+            rebuilt = build_tier_changes(subset)
+            parts.append(rebuilt[rebuilt['role'] == role])
+
+    merged = pd.concat(parts, ignore_index=True)
+    merged['role'] = pd.Categorical(merged['role'], categories=list(ROLE_COLUMNS))
+
+    # 선수 번호: 멤버 컬럼 → 상대 컬럼 순 첫 등장 순서 (build_tier_changes와 동일 규칙)
+    names = pd.concat([table[col].astype(object) for col, _ in ROLE_COLUMNS.values()], ignore_index=True)
+    players = pd.Index(pd.unique(names.dropna()))
+    merged['player_id'] = players.get_indexer(merged['player']).astype(np.int32)
+    merged = merged[merged['player_id'] >= 0]
+
+    merged = merged.sort_values(['role', 'player_id'], kind='stable').reset_index(drop=True)
+    return merged[CHANGE_COLUMNS]
+
+
+def tier_history_dict(changes, role, players, tier_order, with_count=False):
+    """변동 지점 테이블 → tier_history.json 형식 딕셔너리
+
+    Args:
+        changes: build_tier_changes() 결과
+        role: 'member' 또는 'opponent'
+        players: 출력할 선수 목록 (딕셔너리 키 순서)
+        tier_order: tier_num 계산용 티어 번호표 (없는 티어는 99)
+        with_count: True면 'tier_count' 포함
+    """
+    rows = changes[changes['role'] == role]
+
+    by_player = {}
+    for player, date, tier in zip(rows['player'],
+                                  rows['effective_from'].dt.strftime('%Y-%m-%d'),
+                                  rows['tier']):
+        by_player.setdefault(player, []).append({
+            'date': date,
+            'tier': tier,
+            'tier_num': tier_order.get(tier, 99)
+        })
+
+    history = {}
+    for player in players:
+        tier_changes = by_player.get(player, [])
+        history[player] = {
+            'changes': tier_changes,
+            'first_tier': tier_changes[0]['tier'] if tier_changes else None,
+            'last_tier': tier_changes[-1]['tier'] if tier_changes else None,
+        }
+        if with_count:
+            history[player]['tier_count'] = len(tier_changes)
+
+    return history
+
+
+def save_tier_changes(changes, output_path):
+    """변동 지점 테이블을 CSV로 저장 (날짜는 YYYY-MM-DD)"""
+    out = changes.copy()
+    out['effective_from'] = out['effective_from'].dt.strftime('%Y-%m-%d')
+    out.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+
+def load_tier_changes(path):
+    """save_tier_changes()로 저장한 CSV 읽기"""
+    changes = pd.read_csv(path, encoding='utf-8-sig', dtype={'player': str, 'tier': str})
+    changes['role'] = pd.Categorical(changes['role'], categories=list(ROLE_COLUMNS))
+    changes['effective_from'] = pd.to_datetime(changes['effective_from'])
+    changes['player_id'] = changes['player_id'].astype(np.int32)
+    changes['tier_code'] = changes['tier_code'].astype(np.int8)
+    return changes[CHANGE_COLUMNS]
+
+
+def _day_numbers(dates):
+    """날짜 배열 → 일 단위 정수 (1970-01-01 기준, 시각은 버림)"""
+    values = pd.to_datetime(pd.Series(dates)).to_numpy().astype('datetime64[D]')
+    return (values - EPOCH).astype(np.int64)
+
+
+class TierTimeline:
+    """경기 시점 기준 티어 조회 인덱스
+
+    선수별 변동 지점을 (선수 번호, 날짜) 순으로 정렬해 두고,
+    날짜 이하 마지막 변동 지점의 티어를 반환 (같은 날 변동이 여러 번이면 마지막 값)
+    """
+
+    def __init__(self, changes, role):
+        rows = changes[changes['role'] == role]
+
+        self.players = pd.Index(pd.unique(rows['player']))
+        pids = self.players.get_indexer(rows['player'])
+        days = _day_numbers(rows['effective_from'])
+
+        order = np.lexsort((days, pids))
+        self._pids = pids[order]
+        self._days = days[order]
+        self._tiers = rows['tier'].to_numpy(dtype=object)[order]
+
+        # 일괄 조회용 합성 키: 선수 번호 * 날짜 폭 + 날짜 오프셋 (오름차순 유지)
+        self._day_min = int(self._days.min()) if len(self._days) else 0
+        self._day_max = int(self._days.max()) if len(self._days) else 0
+        self._span = self._day_max - self._day_min + 2
+        self._keys = self._pids * self._span + (self._days - self._day_min + 1)
+
+        # 단건 조회용: 선수별 (날짜 목록, 티어 목록)
+        bounds = np.flatnonzero(np.diff(self._pids)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(self._pids)]))
+        self._by_player = {
+            self.players[self._pids[start]]: (self._days[start:end].tolist(),
+                                              self._tiers[start:end].tolist())
+            for start, end in zip(starts, ends) if end > start
+        }
+
+    @classmethod
+    def from_history(cls, tier_history, role='member'):
+        """tier_history.json 형식 딕셔너리로 생성"""
+        records = [
+            (player, change['date'], change['tier'])
+            for player, history in tier_history.items()
+            for change in history['changes']
+        ]
+        changes = pd.DataFrame(records, columns=['player', 'effective_from', 'tier'])
+        changes['effective_from'] = pd.to_datetime(changes['effective_from'])
+        changes['role'] = role
+        return cls(changes, role)
+
+    def __contains__(self, player):
+        return player in self._by_player
+
+    def tier_at(self, player, date):
+        """특정 날짜의 선수 티어 (이력이 없거나 첫 변동 이전이면 None)"""
+        entry = self._by_player.get(player)
+        if entry is None:
+            return None
+
+        days, tiers = entry
+        day = int((np.datetime64(pd.Timestamp(date), 'D') - EPOCH).astype(np.int64))
+        pos = bisect_right(days, day)
+        return tiers[pos - 1] if pos else None
+
+    def tiers_at(self, players, dates):
+        """선수/날짜 배열의 경기 시점 티어 일괄 조회
+
+        Returns:
+            np.ndarray (object): 티어 문자열, 찾지 못하면 None
+        """
+        pids = self.players.get_indexer(pd.Index(np.asarray(players, dtype=object)))
+        days = _day_numbers(dates)
+        result = np.full(len(pids), None, dtype=object)
+
+        known = pids >= 0
+        if not known.any():
+            return result
+
+        offsets = np.clip(days[known], self._day_min - 1, self._day_max) - self._day_min + 1
+        keys = pids[known] * self._span + offsets
+        pos = np.searchsorted(self._keys, keys, side='right') - 1
+
+        hit = pos >= 0
+        hit[hit] = self._pids[pos[hit]] == pids[known][hit]
+
+        resolved = np.full(len(keys), None, dtype=object)
+        resolved[hit] = self._tiers[pos[hit]]
+        result[known] = resolved
+        return result
+
+
+def matchup_lookup(tier_order):
+    """티어 코드 × 티어 코드 → 매치업 번호(MATCHUP_TYPES 인덱스) 룩업 테이블
+
+    코드 0은 티어 없음(None), 1..n은 번호표의 티어 번호 오름차순, 마지막은 번호표 밖 티어
+    (기본 번호표 기준 10×10)
+
+    Returns:
+        (code_of: {티어: 코드}, table: np.ndarray[int8])
+    """
+    nums = sorted(set(tier_order.values())) + [UNLISTED_TIER_NUM]
+    code_of = {tier: nums.index(num) + 1 for tier, num in tier_order.items()}
+
+    size = len(nums) + 1
+    table = np.full((size, size), MATCHUP_TYPES.index('unknown'), dtype=np.int8)
+    member_num = np.array(nums)[:, None]
+    opponent_num = np.array(nums)[None, :]
+    table[1:, 1:] = np.where(
+        member_num == opponent_num, MATCHUP_TYPES.index('same'),
+        np.where(member_num > opponent_num, MATCHUP_TYPES.index('upper'), MATCHUP_TYPES.index('lower'))
+    )
+    return code_of, table
+
+
+def tier_codes(tiers, code_of):
+    """티어 배열 → 룩업 테이블 코드 (None/빈 문자열 → 0, 번호표 밖 티어/NaN → 마지막 코드)"""
+    tiers = np.asarray(tiers, dtype=object)
+    unlisted_code = max(code_of.values(), default=0) + 1
+
+    codes = pd.Index(list(code_of)).get_indexer(pd.Index(tiers))
+    codes = np.where(codes >= 0, np.array(list(code_of.values()))[codes], unlisted_code)
+    codes[(tiers == None) | (tiers == '')] = 0  # noqa: E711 (object 배열 원소별 비교)
+    return codes.astype(np.int8)
+
+
+def matchup_column(table, member_tiers, opponent_tiers, tier_order=TIER_ORDER):
+    """경기 테이블 전체의 티어 매치업 컬럼 (경기 시점 기준)
+
+    Args:
+        table: schema.to_match_table() 결과
+        member_tiers / opponent_tiers: 멤버/상대 TierTimeline
+        tier_order: 매치업 비교용 티어 번호표 (기본 schema.TIER_ORDER, 파이프라인 전체 공용)
+
+    Returns:
+        pd.Series (category: MATCHUP_TYPES)
+    """
+    code_of, lookup = matchup_lookup(tier_order)
+    member_code = tier_codes(member_tiers.tiers_at(table['멤버 이름'], table['날짜']), code_of)
+    opponent_code = tier_codes(opponent_tiers.tiers_at(table['상대'], table['날짜']), code_of)
+
+    return pd.Series(
+        pd.Categorical.from_codes(lookup[member_code, opponent_code], categories=MATCHUP_TYPES),
+        index=table.index, name='matchup'
+    )